@@ -1,7 +1,11 @@
 #!/usr/bin/python3
 
 import funciones_entero as fn
-import genetico_entero as gn
+import controlador as ctl
+import islas
+import paralelo as par
+from perfilador import PERFIL
+import sys
 import time
 import argparse
 
@@ -9,31 +13,92 @@ def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--instance", type=str, required=True)
     parser.add_argument("--mu", type=int, required=True)
-    parser.add_argument("--select", type=str, required=True)
+    parser.add_argument("--select", type=str, required=True, choices=["ruleta", "torneo.rep", "torneo.sin.rep"])
     parser.add_argument("--pc", type=float, required=True)
     parser.add_argument("--recom", type=str, required=True)
     parser.add_argument("--pm", type=float, required=True)
+    parser.add_argument("--pasillos", type=str, default="greedy", choices=["greedy", "exacto"],
+                        help="selección de pasillos durante la búsqueda; exacto requiere CPLEX (docplex y su "
+                             "runtime), sin él se lanza CBC en cada evaluación y es mucho más lento")
+    parser.add_argument("--pulir", action="store_true",
+                        help="al final recalcula con CBC los pasillos del mejor individuo")
+    parser.add_argument("--cache", type=int, default=4096,
+                        help="tamaño de la cache LRU de evaluaciones (0 la desactiva)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="procesos para evaluar la población en paralelo")
+    parser.add_argument("--tiempo", type=float, default=300,
+                        help="límite de tiempo total de la corrida en segundos")
+    parser.add_argument("--estancamiento", type=int, default=0,
+                        help="generaciones sin mejora para reiniciar la población (0 = nunca)")
+    parser.add_argument("--reserva-pulido", type=float, default=10,
+                        help="segundos reservados al final para --pulir")
+    parser.add_argument("--reducir", action="store_true",
+                        help="resuelve la instancia reducida (Comun/reduccion.py) y traduce la solución a los IDs originales")
+    parser.add_argument("--islas", type=int, default=0,
+                        help="corre N islas en procesos separados (islas.py); la primera usa select/recom/pc/pm "
+                             "y las demás las configuraciones de islas.CONFIGURACIONES_BASE (0 = sin islas)")
+    parser.add_argument("--intervalo", type=int, default=10, help="con --islas, generaciones entre migraciones")
+    parser.add_argument("--migrantes", type=int, default=2, help="con --islas, individuos que migran en cada intercambio")
+    parser.add_argument("--perfil", type=str, default=None,
+                        help="activa la medición por fase y escribe el reporte en esta ruta (.json o .csv)")
     args = parser.parse_args()
+    if args.islas and args.workers > 1:
+        parser.error("--islas y --workers no se pueden combinar")
 
     start_time = time.time()
 
-    while time.time() - start_time < 300:
+    if args.islas:
+        configuraciones = [(args.select, args.recom, args.pc, args.pm)]
+        configuraciones += [islas.CONFIGURACIONES_BASE[k % len(islas.CONFIGURACIONES_BASE)] for k in range(args.islas - 1)]
+        mejor, resumen = islas.ejecutar_islas(args.instance, configuraciones, args.mu, args.tiempo, args.intervalo,
+                                              args.migrantes, args.pasillos, reducir=args.reducir,
+                                              reloj_inicio=start_time, estancamiento=args.estancamiento,
+                                              pulir=args.pulir and args.pasillos != "exacto",
+                                              reserva_pulido=args.reserva_pulido)
+        print(mejor[:3])
+        for k, configuracion, fun, generaciones in resumen:
+            print(f"Isla {k} {configuracion}: mejor = {fun}, generaciones = {generaciones}", file=sys.stderr)
+        return
 
-        general, ordenes_list, pasillos_list = fn.lectura(args.instance)
+    if args.perfil:
+        PERFIL.activar()
 
-        stock = fn.generar_stock(pasillos_list)
-        S = gn.inicio(args.mu, general, ordenes_list, stock, pasillos_list)
-        
-        i = 0
-        while time.time() - start_time < 300:
+    if args.reducir:
+        print(fn.reduccion(args.instance).resumen(), file=sys.stderr)
+    general, ordenes_list, pasillos_list = fn.lectura(args.instance, args.reducir)
 
-            M = gn.seleccion(S, args.mu, args.select)
-            p_prima = gn.recombinacion(M, args.mu, args.pc, args.recom)
-            p_prima = gn.mutacion(p_prima, args.mu, args.pm, ordenes_list, pasillos_list, general, stock)
-            S = gn.reemplazo(S, p_prima, args.mu)
-            i += 1
+    stock = fn.generar_stock(pasillos_list)
+    unidades_orden = fn.estadisticas(args.instance, args.reducir).ordenes["unidades"].tolist()
+    selector = fn.SelectorPasillos(pasillos_list, general[1], modo=args.pasillos, tamano_cache=args.cache)
+    paralelo = par.EvaluadorParalelo(args.instance, args.workers, args.pasillos, args.reducir) if args.workers > 1 else None
 
-    print(S[0])
+    mejor, resumen = ctl.ejecutar(general, ordenes_list, pasillos_list, stock, args.mu, args.select, args.pc,
+                                  args.recom, args.pm, selector=selector, paralelo=paralelo, limite=args.tiempo,
+                                  estancamiento=args.estancamiento,
+                                  pulir=args.pulir and args.pasillos != "exacto",
+                                  reserva_pulido=args.reserva_pulido, reloj_inicio=start_time,
+                                  unidades_orden=unidades_orden)
+
+    if paralelo is not None:
+        paralelo.cerrar()
+
+    if args.perfil:
+        PERFIL.escribir(args.perfil)
+
+    if args.reducir:
+        reduccion = fn.reduccion(args.instance)
+        mejor = (reduccion.ordenes_originales(mejor[0]), reduccion.pasillos_originales(mejor[1])) + tuple(mejor[2:])
+    print(mejor[:3])
+
+    print(f"Generaciones: {resumen['generaciones']} ({resumen['generaciones_por_segundo']:.2f}/s), "
+          f"reinicios: {resumen['reinicios']}, búsqueda: {resumen['tiempo_busqueda']:.1f} s, "
+          f"pulido: {resumen['tiempo_pulido']:.1f} s", file=sys.stderr)
+    print("Trayectoria del mejor (segundos, generación, fun):", file=sys.stderr)
+    for segundos, generacion, fun in resumen["trayectoria"]:
+        print(f"  {segundos:8.2f} {generacion:8d} {fun:.6f}", file=sys.stderr)
+
+    if selector.cache is not None:
+        print(f"Cache de evaluaciones: {selector.cache.estadisticas()}", file=sys.stderr)
 
 if __name__ == "__main__":
     main()
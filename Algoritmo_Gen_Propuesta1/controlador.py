@@ -0,0 +1,135 @@
+"""
+Control de una corrida del GA de genetico_entero con presupuesto de tiempo.
+
+El controlador corre generaciones hasta el límite de tiempo, reinicia la
+población cuando se estanca (conservando al mejor individuo), reserva tiempo
+al final para pulir al mejor con el modelo exacto y arma un resumen con las
+generaciones por segundo y la trayectoria del mejor valor encontrado.
+
+El límite se respeta de forma estimada: no se empieza una generación (o un
+reinicio) si la anterior no cabría en el tiempo restante, y CBC recibe como
+timeLimit lo que queda del límite al pulir.
+"""
+import time
+
+import genetico_entero as gn
+from perfilador import PERFIL
+from poblacion import Poblacion
+
+def ejecutar(general, ordenes_list, pasillos_list, stock, mu, select, pc, recom, pm,
+             selector=None, paralelo=None, limite=300, estancamiento=0, pulir=False,
+             reserva_pulido=0.0, reloj_inicio=None, unidades_orden=None, intercambio=None, detener=None):
+    """
+    Ejecuta el GA con presupuesto de tiempo.
+
+    Parámetros:
+    - general, ordenes_list, pasillos_list, stock: datos de la instancia (ver funciones_entero).
+    - mu, select, pc, recom, pm: parámetros del GA.
+    - selector, paralelo: ver gn.inicio y gn.mutacion.
+    - limite: segundos totales de la corrida, contados desde reloj_inicio.
+    - estancamiento: generaciones sin mejora de la población tras las cuales se reinicia (0 = nunca).
+    - pulir: si True, al final se recalculan con CBC los pasillos del mejor individuo.
+    - reserva_pulido: segundos que se reservan al final del límite para el pulido.
+    - reloj_inicio: instante (time.time()) desde el que corre el límite; por defecto, ahora.
+      Permite descontar el tiempo de lectura de la instancia.
+    - unidades_orden: unidades de cada orden para gn.inicio (tabla de estadísticas de la instancia).
+    - intercambio: función (generaciones, S) -> S que se llama al final de cada generación;
+      las islas de islas.py la usan para publicar su mejor y migrar individuos.
+    - detener: evento (p. ej. multiprocessing.Event) que termina la búsqueda en cuanto se activa.
+
+    Retorna:
+    - mejor: mejor individuo encontrado en toda la corrida, como tupla
+      (x, pasillos_seleccionados, [sum_i, n_pasillos, fun], evaluador).
+    - resumen: diccionario con generaciones, reinicios, tiempos, generaciones por segundo
+      y la trayectoria [(segundos, generacion, fun)] de cada mejora del mejor global.
+    """
+    reloj_inicio = time.time() if reloj_inicio is None else reloj_inicio
+    fin_busqueda = reloj_inicio + limite - (reserva_pulido if pulir else 0.0)
+    # Las consultas exactas de pasillos no pasan del fin de la búsqueda
+    for motor in (selector, paralelo):
+        if motor is not None:
+            motor.fin = fin_busqueda
+
+    mejor = None
+    trayectoria = []
+    generaciones = 0
+    reinicios = 0
+    inicio_busqueda = time.time()
+
+    def registrar(S):
+        nonlocal mejor
+        if mejor is None or S.fitness[0] > mejor[2][2]:
+            mejor = S.individuo(0)
+            trayectoria.append((time.time() - reloj_inicio, generaciones, float(mejor[2][2])))
+
+    def continuar(duracion):
+        """Si una fase de `duracion` segundos cabe antes de fin_busqueda y no se pidió detener."""
+        return time.time() + duracion < fin_busqueda and (detener is None or not detener.is_set())
+
+    with PERFIL.medir("inicio"):
+        S = gn.reemplazo(Poblacion.vacia(), gn.inicio(mu, general, ordenes_list, stock, pasillos_list, selector, paralelo, unidades_orden), mu)
+    PERFIL.cerrar_generacion()
+    registrar(S)
+    sin_mejora = 0
+    # Duración de la última generación y del último inicio: estiman si el siguiente cabe antes de fin_busqueda
+    duracion_inicio = time.time() - inicio_busqueda
+    duracion_generacion = 0.0
+
+    while continuar(duracion_generacion):
+        inicio_generacion = time.time()
+        mejor_poblacion = S.fitness[0]
+
+        with PERFIL.medir("seleccion"):
+            M = gn.seleccion(S, mu, select)
+        with PERFIL.medir("recombinacion"):
+            p_prima = gn.recombinacion(M, mu, pc, recom)
+        with PERFIL.medir("mutacion"):
+            p_prima = gn.mutacion(p_prima, mu, pm, ordenes_list, pasillos_list, general, stock, selector, paralelo)
+        with PERFIL.medir("reemplazo"):
+            S = gn.reemplazo(S, p_prima, mu)
+        generaciones += 1
+        registrar(S)
+        if intercambio is not None:
+            S = intercambio(generaciones, S)
+            registrar(S)
+
+        sin_mejora = 0 if S.fitness[0] > mejor_poblacion else sin_mejora + 1
+        duracion_generacion = time.time() - inicio_generacion
+
+        if estancamiento and sin_mejora >= estancamiento and continuar(duracion_inicio):
+            # Reinicio: población nueva conservando al mejor global
+            inicio_reinicio = time.time()
+            with PERFIL.medir("inicio"):
+                nueva = gn.inicio(mu, general, ordenes_list, stock, pasillos_list, selector, paralelo, unidades_orden)
+                S = gn.reemplazo(nueva, Poblacion.desde_individuos([mejor]), mu)
+            reinicios += 1
+            sin_mejora = 0
+            duracion_inicio = time.time() - inicio_reinicio
+
+        PERFIL.cerrar_generacion()
+
+    tiempo_busqueda = time.time() - inicio_busqueda
+
+    tiempo_pulido = 0.0
+    restante = reloj_inicio + limite - time.time()
+    if pulir and restante > 0:
+        inicio_pulido = time.time()
+        with PERFIL.medir("pulido"):
+            pulido = gn.pulir(mejor, ordenes_list, pasillos_list, general, stock, tiempo_limite=restante)
+        tiempo_pulido = time.time() - inicio_pulido
+        if pulido[2][2] > mejor[2][2]:
+            mejor = pulido
+            trayectoria.append((time.time() - reloj_inicio, generaciones, float(mejor[2][2])))
+
+    resumen = {
+        "generaciones": generaciones,
+        "reinicios": reinicios,
+        "tiempo_busqueda": tiempo_busqueda,
+        "tiempo_pulido": tiempo_pulido,
+        "tiempo_total": time.time() - reloj_inicio,
+        "generaciones_por_segundo": generaciones / tiempo_busqueda if tiempo_busqueda > 0 else 0.0,
+        "mejor": float(mejor[2][2]),
+        "trayectoria": trayectoria,
+    }
+
+    return mejor, resumen
@@ -1,8 +1,50 @@
+import hashlib
+import os
+import sys
+import time
+from collections import OrderedDict
+import numpy as np
 import pulp
+from perfilador import PERFIL
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Comun"))
+import instancia as ins
+import bitset as bs
+import reduccion as rd
+
+# CPLEX (docplex) para la cobertura exacta persistente; sin su runtime el modo exacto usa CBC
+try:
+    from docplex.mp.environment import Environment
+    from docplex.mp.model import Model
+    from docplex.mp.solution import SolveSolution
+    HAY_CPLEX = Environment().has_cplex
+except ImportError:
+    HAY_CPLEX = False
+
+# Reducción de cada instancia (Comun/reduccion.py), calculada una vez por proceso
+_REDUCCIONES = {}
+
+def reduccion(archivo: str):
+    """
+    Reducción de la instancia (órdenes, ítems y pasillos que no cambian el óptimo).
+
+    Retorna:
+    - reduccion.Reduccion; .ordenes_originales / .pasillos_originales traducen una solución.
+    """
+    if archivo not in _REDUCCIONES:
+        _REDUCCIONES[archivo] = rd.reducir(ins.cargar_instancia(archivo))
+    return _REDUCCIONES[archivo]
+
+def cargar(archivo: str, reducir: bool = False):
+    """Instancia CSR del archivo; con reducir=True, la instancia reducida."""
+    return reduccion(archivo).instancia if reducir else ins.cargar_instancia(archivo)
 
-def lectura(archivo: str):
+def lectura(archivo: str, reducir: bool = False):
     """
-    Lee el archivo y transforma la información en diccionarios dispersos.
+    Carga la instancia con el lector compartido (CSR, con cache binaria) y la transforma en diccionarios dispersos.
+
+    Parámetros:
+    - reducir: usa la instancia reducida (IDs de la reducción, ver reduccion()).
 
     Retorna:
     - general: lista con parámetros globales [ordenes, items, pasillos, wave_lower, wave_upper]
@@ -10,29 +52,16 @@ def lectura(archivo: str):
     - pasillos_dicc: diccionario {pasillo_id: {item_id: cantidad}}
     """
 
-    with open(archivo) as info:
-        datos = [list(map(int, linea.split())) for linea in info if linea.strip()]
-
-    # Extraer parámetros generales
-    general = datos.pop(0) + datos.pop()
-
-    num_ordenes = general[0]
-
-    ordenes_list = []
-    for i, orden in enumerate(datos[:num_ordenes]):
-        ordenes = {}
-        for j in range(1, len(orden), 2):
-            ordenes[orden[j]] = orden[j+1]
-        ordenes_list.append(ordenes)
+    return cargar(archivo, reducir).a_diccionarios()
 
-    pasillos_list = []
-    for i, pasillo in enumerate(datos[num_ordenes:]):
-        pasillos = {}
-        for j in range(1, len(pasillo), 2):
-            pasillos[pasillo[j]] = pasillo[j+1]
-        pasillos_list.append(pasillos)
+def estadisticas(archivo: str, reducir: bool = False):
+    """
+    Tabla de estadísticas por orden y por pasillo de la instancia (guardada en su cache binaria).
 
-    return general, ordenes_list, pasillos_list
+    Retorna:
+    - estadisticas.Estadisticas; por ejemplo .ordenes["unidades"] son las unidades de cada orden.
+    """
+    return cargar(archivo, reducir).estadisticas()
 
 def generar_demanda(ordenes_list, x):
     """
@@ -55,6 +84,68 @@ def generar_demanda(ordenes_list, x):
 
     return demanda
 
+class EvaluadorIncremental:
+    """
+    Demanda, unidades totales y exceso de stock de un conjunto de órdenes.
+
+    Se actualiza en O(items de la orden) al agregar, quitar o intercambiar órdenes,
+    en lugar de reconstruir la demanda completa con generar_demanda.
+
+    Atributos:
+    - demanda: diccionario {item_id: cantidad total requerida} (igual al de generar_demanda).
+    - total: unidades totales de las órdenes incluidas.
+    - exceso: suma de max(0, demanda - stock) sobre los ítems.
+    """
+
+    def __init__(self, ordenes_list, stock, x=()):
+        self.ordenes_list = ordenes_list
+        self.stock = stock
+        self.demanda = {}
+        self.total = 0
+        self.exceso = 0
+        for orden_id in x:
+            self.agregar(orden_id)
+
+    def _sumar(self, orden_id, signo):
+        demanda, stock = self.demanda, self.stock
+        for item_id, cantidad in self.ordenes_list[orden_id].items():
+            anterior = demanda.get(item_id, 0)
+            nueva = anterior + signo * cantidad
+            disponible = stock.get(item_id, 0)
+            self.exceso += max(0, nueva - disponible) - max(0, anterior - disponible)
+            if nueva:
+                demanda[item_id] = nueva
+            else:
+                del demanda[item_id]
+            self.total += signo * cantidad
+
+    def agregar(self, orden_id):
+        self._sumar(orden_id, 1)
+
+    def quitar(self, orden_id):
+        self._sumar(orden_id, -1)
+
+    def intercambiar(self, sale, entra):
+        self._sumar(sale, -1)
+        self._sumar(entra, 1)
+
+    def aplicar(self, salen, entran):
+        """Quita las órdenes de salen y agrega las de entran."""
+        for orden_id in salen:
+            self._sumar(orden_id, -1)
+        for orden_id in entran:
+            self._sumar(orden_id, 1)
+
+    def copia(self):
+        nuevo = EvaluadorIncremental(self.ordenes_list, self.stock)
+        nuevo.demanda = dict(self.demanda)
+        nuevo.total = self.total
+        nuevo.exceso = self.exceso
+        return nuevo
+
+    def __repr__(self):
+        return f"EvaluadorIncremental(total={self.total}, exceso={self.exceso}, items={len(self.demanda)})"
+
 def generar_stock(pasillos_list):
     """
     Genera un diccionario de stock acumulado a partir de los pasillos disponibles.
@@ -75,17 +166,19 @@ def generar_stock(pasillos_list):
 
     return stock
 
-def pasillos(pasillos_list, demanda, num_pasillos):
+def pasillos(pasillos_list, demanda, num_pasillos, tiempo_limite=None):
     """
     Minimiza la cantidad de pasillos requeridos para satisfacer la demanda de ítems.
 
     Parámetros:
     - pasillos_list: lista de diccionarios {item_id: cantidad}, donde cada diccionario representa un pasillo.
     - demanda: diccionario {item_id: cantidad requerida}.
+    - tiempo_limite: segundos máximos para CBC (None = sin límite).
 
     Retorna:
     - valor_objetivo: número mínimo de pasillos requeridos.
     - pasillos_seleccionados: lista de índices de pasillos utilizados.
+    - None si CBC se detuvo por tiempo sin encontrar una cobertura factible.
     """
 
     # Definir el problema de optimización
@@ -97,12 +190,22 @@ def pasillos(pasillos_list, demanda, num_pasillos):
     # Función objetivo: minimizar número de pasillos seleccionados
     prob += pulp.lpSum(y[j] for j in range(num_pasillos))
 
-    # Restricciones de demanda
+    # Restricciones de demanda, solo con los pasillos que tienen el ítem (armar los
+    # términos con coeficiente 0 tomaba más que el propio CBC y no lo acota timeLimit)
+    terminos = {item_id: [] for item_id in demanda}
+    for j in range(num_pasillos):
+        for item_id, cantidad in pasillos_list[j].items():
+            if item_id in terminos:
+                terminos[item_id].append((y[j], cantidad))
     for item_id, cantidad_requerida in demanda.items():
-        prob += pulp.lpSum(pasillos_list[j].get(item_id, 0) * y[j] for j in range(num_pasillos)) >= cantidad_requerida
+        prob += pulp.LpAffineExpression(terminos[item_id]) >= cantidad_requerida
 
     # Resolver el problema
-    prob.solve(pulp.PULP_CBC_CMD(msg=False))
+    with PERFIL.medir("cbc"):
+        prob.solve(pulp.PULP_CBC_CMD(msg=False, timeLimit=tiempo_limite))
+
+    if prob.sol_status not in (pulp.LpSolutionOptimal, pulp.LpSolutionIntegerFeasible):
+        return None
 
     # Obtener resultados
     pasillos_seleccionados = [j for j in range(num_pasillos) if y[j].varValue > 0.5]
@@ -110,6 +213,237 @@ def pasillos(pasillos_list, demanda, num_pasillos):
 
     return n_pasillos, pasillos_seleccionados
 
+class CoberturaExacta:
+    """
+    Modelo exacto de selección de pasillos que se construye una sola vez por instancia.
+
+    A diferencia de pasillos(), que arma un problema de PuLP y lanza CBC en cada llamada,
+    aquí el modelo tiene desde el inicio una restricción por ítem con stock sobre todos
+    los pasillos, sum_j stock[j][i] * y_j >= d_i (con d_i = 0). En cada consulta solo se
+    cambian los lados derechos de los ítems cuya demanda cambió respecto a la consulta
+    anterior y CPLEX vuelve a resolver el mismo modelo dentro del proceso, arrancando de
+    una cobertura factible (la greedy) como MIP start.
+
+    Requiere el runtime de CPLEX (HAY_CPLEX).
+
+    Parámetros:
+    - matriz: matriz densa pasillos x items (SelectorPasillos.matriz).
+    """
+
+    def __init__(self, matriz):
+        self.num_pasillos, num_items = matriz.shape
+        m = self.m = Model("Minimize_Pasillos")
+        y = self.y = m.binary_var_list(self.num_pasillos, name="y")
+        m.minimize(m.sum(y))
+
+        # Un renglón por ítem con stock en algún pasillo; fila[i] = -1 si no hay stock
+        self.items = np.flatnonzero(matriz.any(axis=0))
+        self.fila = np.full(num_items, -1, dtype=np.int64)
+        self.fila[self.items] = np.arange(len(self.items))
+        restricciones = []
+        for i in self.items:
+            columna = matriz[:, i]
+            con_stock = np.flatnonzero(columna)
+            restricciones.append(m.scal_prod([y[j] for j in con_stock], columna[con_stock].tolist()) >= 0)
+        self.restricciones = m.add_constraints(restricciones)
+        self.lados_derechos = np.zeros(len(self.items), dtype=np.int64)
+
+    def resolver(self, items, cantidades, inicio=None, tiempo_limite=None):
+        """
+        Mínimo número de pasillos que cubren la demanda.
+
+        Parámetros:
+        - items, cantidades: arreglos con la demanda.
+        - inicio: pasillos de una cobertura factible para el MIP start (opcional).
+        - tiempo_limite: segundos máximos para esta consulta (None = sin límite).
+
+        Retorna:
+        - (n_pasillos, pasillos_seleccionados), o (num_pasillos, []) si el stock no alcanza.
+        - None si CPLEX se detuvo por tiempo sin encontrar una cobertura factible.
+        """
+        filas = self.fila[items]
+        if np.any(filas < 0):
+            return self.num_pasillos, []
+
+        nuevos = np.zeros_like(self.lados_derechos)
+        nuevos[filas] = cantidades
+        for k in np.flatnonzero(nuevos != self.lados_derechos):
+            self.restricciones[k].rhs = int(nuevos[k])
+        self.lados_derechos = nuevos
+
+        self.m.clear_mip_starts()
+        if inicio:
+            self.m.add_mip_start(SolveSolution(self.m, {self.y[j]: 1 for j in inicio}), complete_vars=True)
+        # 1e75 es el valor por omisión de timelimit en CPLEX (sin límite)
+        self.m.set_time_limit(1e75 if tiempo_limite is None else tiempo_limite)
+
+        with PERFIL.medir("cplex"):
+            solucion = self.m.solve()
+        if solucion is None:
+            return None
+        seleccion = [j for j, var in enumerate(self.y) if solucion.get_value(var) > 0.5]
+        return len(seleccion), seleccion
+
+def clave_ordenes(x, num_ordenes):
+    """
+    Clave canónica de un conjunto de órdenes: hash de su bitset (bs.desde_indices).
+
+    Dos individuos con las mismas órdenes en distinta posición tienen la misma clave.
+    """
+    return hashlib.blake2b(bs.desde_indices(x, num_ordenes).tobytes(), digest_size=16).digest()
+
+class CacheLRU:
+    """
+    Cache acotada con política LRU y contadores de aciertos y fallos.
+
+    Parámetros:
+    - capacidad: número máximo de entradas; al superarla se descarta la menos usada.
+    """
+
+    def __init__(self, capacidad=4096):
+        self.capacidad = capacidad
+        self.datos = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def obtener(self, clave):
+        """Regresa el valor guardado (marcándolo como reciente) o None si no existe."""
+        valor = self.datos.get(clave)
+        if valor is None:
+            self.fallos += 1
+            return None
+        self.datos.move_to_end(clave)
+        self.aciertos += 1
+        return valor
+
+    def guardar(self, clave, valor):
+        self.datos[clave] = valor
+        self.datos.move_to_end(clave)
+        if len(self.datos) > self.capacidad:
+            self.datos.popitem(last=False)
+
+    def estadisticas(self):
+        """Diccionario con aciertos, fallos, tamaño actual y tasa de aciertos."""
+        consultas = self.aciertos + self.fallos
+        return {
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "tamano": len(self.datos),
+            "tasa_aciertos": self.aciertos / consultas if consultas else 0.0,
+        }
+
+class SelectorPasillos:
+    """
+    Motor de selección de pasillos para cubrir una demanda.
+
+    Modos:
+    - "greedy": heurística vectorizada de set multicover dentro del proceso; en cada paso
+      elige el pasillo que más unidades de la demanda pendiente cubre. Con mejora_local
+      se eliminan al final los pasillos redundantes.
+    - "exacto": modelo entero. Con CPLEX disponible es una CoberturaExacta persistente
+      (construida en la primera consulta, con la solución greedy como MIP start), así que
+      sirve dentro del ciclo del GA; sin CPLEX se usa CBC (función pasillos), que arma y
+      lanza un modelo nuevo en cada consulta y es mucho más lento.
+
+    resolver() regresa lo mismo que pasillos(): (n_pasillos, pasillos_seleccionados).
+
+    El atributo fin (instante de time.time(), None = sin límite) acota las consultas
+    exactas: cada una recibe como límite el tiempo que falta para fin y, pasado fin, se
+    usa la greedy. controlador.ejecutar lo fija con el fin de la búsqueda. Si el modelo
+    exacto se detiene sin cobertura factible también se regresa la greedy.
+
+    El atributo cache (CacheLRU, o None si tamano_cache=0) guarda evaluaciones por
+    conjunto de órdenes para que individuos repetidos no vuelvan a resolverse.
+    """
+
+    def __init__(self, pasillos_list, num_items, modo="greedy", mejora_local=True, tamano_cache=4096):
+        if modo not in ("greedy", "exacto"):
+            raise ValueError(f"Modo de selección de pasillos desconocido: {modo}")
+
+        self.pasillos_list = pasillos_list
+        self.num_pasillos = len(pasillos_list)
+        self.modo = modo
+        self.mejora_local = mejora_local
+        self.cache = CacheLRU(tamano_cache) if tamano_cache > 0 else None
+        self.cobertura = None
+        self.fin = None
+
+        # Matriz densa pasillos x items (A es pequeño, del orden de cientos)
+        max_cantidad = max((max(p.values()) for p in pasillos_list if p), default=0)
+        self.matriz = np.zeros((self.num_pasillos, num_items), dtype=np.min_scalar_type(max_cantidad))
+        for j, pasillo in enumerate(pasillos_list):
+            if pasillo:
+                self.matriz[j, list(pasillo.keys())] = list(pasillo.values())
+
+    def resolver(self, demanda, modo=None):
+        """
+        Selecciona pasillos que cubren la demanda.
+
+        Parámetros:
+        - demanda: diccionario {item_id: cantidad requerida}.
+        - modo: permite forzar "greedy" o "exacto" en una llamada concreta.
+
+        Retorna:
+        - n_pasillos: número de pasillos seleccionados.
+        - pasillos_seleccionados: lista de índices de pasillos utilizados.
+        """
+        modo = modo or self.modo
+        tiempo_limite = None
+        if modo == "exacto" and self.fin is not None:
+            tiempo_limite = self.fin - time.time()
+            if tiempo_limite <= 0:  # Se acabó el tiempo de la búsqueda: solo greedy
+                modo = "greedy"
+
+        if modo == "exacto" and not HAY_CPLEX:
+            resultado = pasillos(self.pasillos_list, demanda, self.num_pasillos, tiempo_limite)
+            if resultado is not None:
+                return resultado
+            modo = "greedy"  # CBC no regresó una cobertura: se usa la greedy
+
+        items = np.fromiter(demanda.keys(), dtype=np.int64, count=len(demanda))
+        cantidades = np.fromiter(demanda.values(), dtype=np.int64, count=len(demanda))
+        n_pasillos, seleccion = self.greedy(items, cantidades)
+        if modo != "exacto" or not seleccion:
+            return n_pasillos, seleccion
+
+        if self.cobertura is None:
+            self.cobertura = CoberturaExacta(self.matriz)
+        resultado = self.cobertura.resolver(items, cantidades, inicio=seleccion, tiempo_limite=tiempo_limite)
+        return resultado if resultado is not None else (n_pasillos, seleccion)
+
+    def greedy(self, items, cantidades):
+        """Set multicover voraz sobre las columnas de los items demandados."""
+        sub = self.matriz[:, items].astype(np.int64)
+        pendiente = cantidades.copy()
+        disponibles = np.ones(self.num_pasillos, dtype=bool)
+        seleccion = []
+
+        while pendiente.any():
+            aporte = np.minimum(sub, pendiente).sum(axis=1)
+            aporte[~disponibles] = 0
+            j = int(np.argmax(aporte))
+            if aporte[j] == 0:  # El stock no alcanza para la demanda
+                return self.num_pasillos, []
+            seleccion.append(j)
+            disponibles[j] = False
+            pendiente -= np.minimum(sub[j], pendiente)
+
+        if self.mejora_local and len(seleccion) > 1:
+            seleccion = self._quitar_redundantes(sub, cantidades, seleccion)
+
+        return len(seleccion), sorted(seleccion)
+
+    @staticmethod
+    def _quitar_redundantes(sub, cantidades, seleccion):
+        """Quita pasillos (de menor a mayor aporte) mientras la demanda siga cubierta."""
+        cobertura = sub[seleccion].sum(axis=0)
+        for j in sorted(seleccion, key=lambda j: sub[j].sum()):
+            restante = cobertura - sub[j]
+            if np.all(restante >= cantidades):
+                cobertura = restante
+                seleccion.remove(j)
+        return seleccion
+
 def funcion_objetivo(demanda, n_pasillos, limite_inferior, limite_superior, exceso_stock, penalizacion=10**3):
     """
     Calcula la función objetivo para minimizar pasillos con penalizaciones ajustadas.
@@ -1,8 +1,14 @@
+import os
+import sys
 import funciones_entero as fn
+from perfilador import PERFIL
+from poblacion import Poblacion, RELLENO
 import numpy as np
-import bisect
 
-def inicio(mu, general, ordenes_list, stock, pasillos_list):
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Comun"))
+import bitset as bs
+
+def inicio(mu, general, ordenes_list, stock, pasillos_list, selector=None, paralelo=None, unidades_orden=None):
     """
     Genera una población inicial de soluciones considerando órdenes completas y penalización por stock.
 
@@ -12,79 +18,210 @@ def inicio(mu, general, ordenes_list, stock, pasillos_list):
     - ordenes_list: lista de diccionarios {item_id: cantidad} de cada orden.
     - stock: diccionario {item_id: cantidad disponible en stock}.
     - pasillos_list: lista de diccionarios representando los pasillos.
+    - selector: fn.SelectorPasillos para elegir pasillos; si es None se usa el modelo exacto fn.pasillos.
+    - paralelo: paralelo.EvaluadorParalelo para evaluar la población en varios procesos (opcional).
+    - unidades_orden: unidades de cada orden (fn.estadisticas(archivo).ordenes["unidades"]);
+      si es None se calculan a partir de ordenes_list.
 
     Retorna:
-    - S: lista de soluciones [vector x, pasillos_seleccionados, [sum_i, n_pasillos, fun]].
+    - S: Poblacion con el vector x, los pasillos seleccionados, [sum_i, n_pasillos, fun] y el
+      evaluador de cada individuo. El evaluador (fn.EvaluadorIncremental) guarda la demanda
+      del individuo para actualizarla por deltas.
     """
 
+    if unidades_orden is None:
+        unidades_orden = [sum(orden.values()) for orden in ordenes_list]
+
     S = []
 
     for _ in range(mu):
-        x = np.zeros(general[0], dtype=int)  # Vector binario de órdenes seleccionadas
-        sum_i = 0
+        evaluador = fn.EvaluadorIncremental(ordenes_list, stock)  # Demanda acumulada de las órdenes elegidas
         sec = np.array(range(general[0]))
         np.random.shuffle(sec)  # Aleatorizar el orden de las órdenes
 
         # Fase 1: Agregar órdenes completas hasta alcanzar el límite inferior
         i = 0
-        while i < len(sec) and sum_i < general[3]:
-            orden = ordenes_list[sec[i]]  # Orden completa como diccionario {item_id: cantidad}
-            demanda_orden = sum(orden.values())  # Sumar todos los ítems de la orden
+        while i < len(sec) and evaluador.total < general[3]:
+            demanda_orden = unidades_orden[sec[i]]  # Unidades de la orden completa
 
-            if sum_i + demanda_orden <= general[4]:  # Verificar límite superior
-                sum_i += demanda_orden
+            if evaluador.total + demanda_orden <= general[4]:  # Verificar límite superior
+                evaluador.agregar(sec[i])
                 i += 1  # Marcar la orden como seleccionada
 
         # Fase 2: Agregado probabilístico de órdenes completas
-        while i < len(sec) and sum_i < general[4] and np.random.uniform() < 0.8:
-            orden = ordenes_list[sec[i]]
-            demanda_orden = sum(orden.values())
+        while i < len(sec) and evaluador.total < general[4] and np.random.uniform() < 0.8:
+            demanda_orden = unidades_orden[sec[i]]
 
-            if sum_i + demanda_orden <= general[4]:
-                sum_i += demanda_orden
+            if evaluador.total + demanda_orden <= general[4]:
+                evaluador.agregar(sec[i])
                 i += 1
 
         x = sec[:i]
+        S.append((x, evaluador))
+
+    # Pasillos y función objetivo de toda la población (la demanda y el exceso ya están en los evaluadores)
+    evaluaciones = evaluar_lote(S, ordenes_list, pasillos_list, general, stock, selector, paralelo)
+
+    return Poblacion.desde_individuos([(x, pasillos_seleccionados, metricas, evaluador)
+                                       for (x, evaluador), (pasillos_seleccionados, metricas) in zip(S, evaluaciones)])
+
+def evaluar(x, ordenes_list, pasillos_list, general, stock, selector=None, evaluador=None):
+    """
+    Evalúa un conjunto de órdenes: demanda, exceso de stock, pasillos y función objetivo.
+
+    Si el selector tiene cache, el resultado se memoriza con la clave canónica del
+    conjunto de órdenes, de modo que individuos repetidos o sin cambios no se reevalúan.
+    Si se da un evaluador (fn.EvaluadorIncremental) con la demanda de x, se usan sus
+    valores en lugar de reconstruir la demanda.
+
+    Retorna:
+    - pasillos_seleccionados: lista de pasillos.
+    - np.array([sum_i, n_pasillos, fun])
+    """
+    cache = selector.cache if selector is not None else None
+    if cache is not None:
+        clave = fn.clave_ordenes(x, general[0])
+        guardado = cache.obtener(clave)
+        if guardado is not None:
+            return guardado
+
+    resultado = calcular_evaluacion(x, ordenes_list, pasillos_list, general, stock, selector, evaluador)
+    if cache is not None:
+        cache.guardar(clave, resultado)
+
+    return resultado
+
+def calcular_evaluacion(x, ordenes_list, pasillos_list, general, stock, selector=None, evaluador=None):
+    """Evaluación de evaluar() sin pasar por la cache."""
+    if evaluador is not None:
+        demanda, exceso_stock, sum_i = evaluador.demanda, evaluador.exceso, evaluador.total
+    else:
+        with PERFIL.medir("demanda"):
+            # Generar demanda consolidada
+            demanda = fn.generar_demanda(ordenes_list, x)
+
+            # Penalización por exceso de stock
+            exceso_stock = sum(max(0, cantidad - stock.get(item_id, 0)) for item_id, cantidad in demanda.items())
+            sum_i = sum(demanda.values())
+
+    if exceso_stock > 0:
+        n_pasillos, pasillos_seleccionados = general[2], []
+    else:
+        n_pasillos, pasillos_seleccionados = seleccionar_pasillos(selector, pasillos_list, demanda, general)
+
+    # Calcular función objetivo
+    fun = fn.funcion_objetivo(demanda, n_pasillos, general[3], general[4], exceso_stock)
+
+    return pasillos_seleccionados, np.array([sum_i, n_pasillos, fun])
+
+def evaluar_lote(lote, ordenes_list, pasillos_list, general, stock, selector=None, paralelo=None):
+    """
+    Evalúa un lote de individuos, opcionalmente en un pool de procesos.
+
+    Parámetros:
+    - lote: lista de pares (x, evaluador) con evaluador de tipo fn.EvaluadorIncremental o None.
+    - paralelo: paralelo.EvaluadorParalelo; si es None se evalúa en serie con evaluar().
+
+    En modo paralelo la cache se consulta en este proceso y los individuos con exceso de
+    stock (que no requieren elegir pasillos) se evalúan aquí; solo el resto viaja al pool.
+
+    Retorna:
+    - Lista de pares (pasillos_seleccionados, np.array([sum_i, n_pasillos, fun])) en el orden del lote.
+    """
+    if paralelo is None:
+        return [evaluar(x, ordenes_list, pasillos_list, general, stock, selector, evaluador) for x, evaluador in lote]
+
+    cache = selector.cache if selector is not None else None
+    resultados = [None] * len(lote)
+    pendientes = []
 
-        # Generar demanda
-        demanda = fn.generar_demanda(ordenes_list, x)
+    for k, (x, evaluador) in enumerate(lote):
+        clave = fn.clave_ordenes(x, general[0]) if cache is not None else None
+        guardado = cache.obtener(clave) if cache is not None else None
 
-        # Penalización por exceso de stock
-        exceso_stock = sum(max(0, cantidad - stock.get(item_id, 0)) for item_id, cantidad in demanda.items())
+        if guardado is not None:
+            resultados[k] = guardado
+            continue
 
-        if exceso_stock > 0:
-            n_pasillos, pasillos_seleccionados = general[2], []
+        if evaluador is not None and evaluador.exceso > 0:
+            resultados[k] = calcular_evaluacion(x, ordenes_list, pasillos_list, general, stock, selector, evaluador)
+            if cache is not None:
+                cache.guardar(clave, resultados[k])
         else:
-            n_pasillos, pasillos_seleccionados = fn.pasillos(pasillos_list, demanda, general[2])
+            pendientes.append((k, clave, x))
+
+    for (k, clave, _), resultado in zip(pendientes, paralelo.evaluar([x for _, _, x in pendientes])):
+        resultados[k] = resultado
+        if cache is not None:
+            cache.guardar(clave, resultado)
+
+    return resultados
 
-        # Calcular función objetivo
-        fun = fn.funcion_objetivo(demanda, n_pasillos, general[3], general[4], exceso_stock)
+def seleccionar_pasillos(selector, pasillos_list, demanda, general):
+    """
+    Elige los pasillos para una demanda con el selector configurado.
+
+    Sin selector se conserva el comportamiento original: modelo exacto con CBC. Si CBC
+    no regresa una cobertura, el individuo se penaliza igual que cuando el stock no alcanza.
+    """
+    with PERFIL.medir("pasillos"):
+        if selector is None:
+            resultado = fn.pasillos(pasillos_list, demanda, general[2])
+            return resultado if resultado is not None else (general[2], [])
+        return selector.resolver(demanda)
+
+def pulir(individuo, ordenes_list, pasillos_list, general, stock, tiempo_limite=None):
+    """
+    Recalcula los pasillos de un individuo con el modelo exacto (CBC).
+
+    Se usa al final de la corrida sobre el mejor individuo, cuando durante la
+    búsqueda los pasillos se eligieron con la heurística greedy. Si CBC no
+    encuentra una cobertura dentro de tiempo_limite, se conservan los pasillos
+    del individuo.
+
+    Retorna:
+    - Individuo con la misma estructura [x, pasillos_seleccionados, np.array([sum_i, n_pasillos, f]), evaluador].
+    """
+    x = individuo[0]
+    demanda = fn.generar_demanda(ordenes_list, x)
+    exceso_stock = sum(max(0, cantidad - stock.get(item_id, 0)) for item_id, cantidad in demanda.items())
+
+    if exceso_stock > 0:
+        return individuo
 
-        individuo = [x, pasillos_seleccionados, np.array([sum_i, n_pasillos, fun])]
-        S.append(tuple(individuo))
+    resultado = fn.pasillos(pasillos_list, demanda, general[2], tiempo_limite)
+    if resultado is None:
+        return individuo
 
-    return S
+    n_pasillos, pasillos_seleccionados = resultado
+    fun = fn.funcion_objetivo(demanda, n_pasillos, general[3], general[4], exceso_stock)
+
+    if fun < individuo[2][2]:
+        return individuo
+
+    return tuple([x, pasillos_seleccionados, np.array([sum(demanda.values()), n_pasillos, fun])] + list(individuo[3:]))
 
 ############ SELECCIÓN ###########
 
-def seleccion(S:np.ndarray, N:int, select:str):
+def seleccion(S:Poblacion, N:int, select:str):
     """
     Realiza la selección de individuos para la siguiente generación.
 
+    Los N sorteos de cada esquema se hacen en bloque sobre el arreglo de aptitudes.
+
     Parámetros:
     -----------
-    - S: Población de los individuos generados (array de numpy), donde cada individuo incluye:
-         - Las primeras n posiciones: variables.
-         - La última posición: el valor de la función.
-    - select: Esquema de selección
+    - S: Población de los individuos generados (Poblacion); la aptitud de cada
+         individuo es S.fitness.
+    - select: Esquema de selección ("ruleta", "torneo.rep" o "torneo.sin.rep")
 
     Retorna:
     --------
-    - np.ndarray: Población seleccionada.
+    - Poblacion: Población seleccionada (copia de los renglones elegidos de S).
     """
+    values = S.fitness
+
     if select == "ruleta":  # Selección por ruleta
-        values = np.array([individuo[2][2] for individuo in S]) 
-        
         # Manejo de valores negativos (si es necesario)
         if np.any(values <= 0):
             values = values - np.min(values) + 1e-10  # Ajuste para valores positivos
@@ -93,136 +230,261 @@ def seleccion(S:np.ndarray, N:int, select:str):
         probs = values / np.sum(values)
         limites = np.cumsum(probs)
 
-        # Selección usando ruleta
-        M = []
-        for _ in range(N):
-            r = np.random.uniform(0, 1)
-            idx = bisect.bisect_left(limites, r)
-            M.append(S[idx])
-
-    elif select == "torneo.rep":  # Torneo binario con reposición
-        M = []
-        perm = np.random.choice(range(N), N, replace=True)
-        for i in range(N):
-            # Seleccionar 2 individuos aleatorios
-            idx1, idx2 = i, perm[i]
-            # Escoger el mejor
-            winner = idx1 if S[idx1][2][2] > S[idx2][2][2] else idx2
-            M.append(S[winner])
-
-    elif select == "torneo.sin.rep":  # Torneo binario sin reposición
-        M = []
-        perm = np.random.permutation(N)
-        for i in range(N):
-            # Seleccionar 2 individuos aleatorios
-            idx1, idx2 = i, perm[i]
-            # Escoger el mejor
-            winner = idx1 if S[idx1][2][2] > S[idx2][2][2] else idx2
-            M.append(S[winner])
-
-    return M
+        # Selección usando ruleta: primer límite >= r para cada uno de los N sorteos
+        r = np.random.uniform(0, 1, N)
+        elegidos = np.minimum(np.searchsorted(limites, r, side="left"), len(limites) - 1)
+
+    elif select in ("torneo.rep", "torneo.sin.rep"):  # Torneo binario con o sin reposición
+        # El individuo i compite contra perm[i]; gana el de mayor aptitud
+        if select == "torneo.rep":
+            perm = np.random.choice(range(N), N, replace=True)
+        else:
+            perm = np.random.permutation(N)
+        idx = np.arange(N)
+        elegidos = np.where(values[idx] > values[perm], idx, perm)
+
+    else:
+        raise ValueError(f"Esquema de selección desconocido: {select}")
+
+    return S.tomar(elegidos)
 
 ############ RECOMBINACIÓN ###########
 
+def _ensamblar(segmentos):
+    """
+    Arma los hijos concatenando, renglón por renglón, segmentos de matrices de órdenes.
+
+    Parámetros:
+    - segmentos: lista de (matriz, inicio, fin); el renglón k del hijo recibe
+      matriz[k, inicio[k]:fin[k]] a continuación del segmento anterior.
+
+    Retorna:
+    - hijos: matriz rellena con RELLENO.
+    - largos: número de órdenes de cada hijo.
+    """
+    largos = sum(fin - inicio for _, inicio, fin in segmentos)
+    columnas = np.arange(max(int(largos.max(initial=0)), 1))[None, :]
+    hijos = np.full((len(largos), columnas.shape[1]), RELLENO, dtype=segmentos[0][0].dtype)
+
+    desplazamiento = np.zeros(len(largos), dtype=np.int64)[:, None]
+    for matriz, inicio, fin in segmentos:
+        dentro = (columnas >= desplazamiento) & (columnas < desplazamiento + (fin - inicio)[:, None])
+        fuente = np.clip(inicio[:, None] + columnas - desplazamiento, 0, matriz.shape[1] - 1)
+        hijos = np.where(dentro, np.take_along_axis(matriz, fuente, axis=1), hijos)
+        desplazamiento = desplazamiento + (fin - inicio)[:, None]
+
+    return hijos, largos.astype(np.int32)
+
+def _quitar_repetidas(hijos):
+    """
+    Elimina de cada renglón las órdenes repetidas, conservando la primera aparición
+    y el orden original, y recorre el relleno al final.
+    """
+    orden = np.argsort(hijos, axis=1, kind="stable")
+    valores = np.take_along_axis(hijos, orden, axis=1)
+    repetida = np.zeros(hijos.shape, dtype=bool)
+    np.put_along_axis(repetida, orden[:, 1:], (valores[:, 1:] == valores[:, :-1]) & (valores[:, 1:] != RELLENO), axis=1)
+
+    hijos = np.where(repetida, RELLENO, hijos)
+    hijos = np.take_along_axis(hijos, np.argsort(hijos == RELLENO, axis=1, kind="stable"), axis=1)
+    largos = np.count_nonzero(hijos != RELLENO, axis=1).astype(np.int32)
+    return hijos[:, :max(int(largos.max(initial=0)), 1)], largos
+
+def _puntos_de_corte(largos, cruza):
+    """
+    Un punto de corte en [1, largo) por renglón; donde no hay cruce el corte es el largo
+    (el segmento posterior queda vacío).
+    """
+    puntos = 1 + np.floor(np.random.uniform(0, 1, len(largos)) * np.maximum(largos - 1, 1)).astype(np.int64)
+    return np.where(cruza, puntos, largos)
+
+def _dos_puntos_de_corte(largos, cruza):
+    """
+    Dos puntos de corte distintos y ordenados en [1, largo) por renglón; donde no hay
+    cruce ambos son el largo (el segmento intermedio queda vacío).
+    """
+    opciones = np.maximum(largos - 1, 2)
+    a = 1 + np.floor(np.random.uniform(0, 1, len(largos)) * opciones).astype(np.int64)
+    b = 1 + np.floor(np.random.uniform(0, 1, len(largos)) * (opciones - 1)).astype(np.int64)
+    b = b + (b >= a)  # b distinto de a
+    return np.where(cruza, np.minimum(a, b), largos), np.where(cruza, np.maximum(a, b), largos)
+
 def recombinacion(M, N, pc, recom):
     """
-    Realiza la recombinación únicamente sobre el vector binario de los individuos.
+    Realiza la recombinación únicamente sobre el vector de órdenes de los individuos.
+
+    Todas las parejas (M[0], M[1]), (M[2], M[3]), ... se cruzan a la vez sobre la
+    matriz de órdenes; las órdenes repetidas en un hijo se eliminan.
     
-    - M: Lista de individuos, donde cada uno tiene [x, pasillos_seleccionados, np.array([sum_i, n_pasillos, f])]
+    - M: Poblacion de individuos seleccionados
     - N: Número de individuos
     - pc: Probabilidad de cruce
     - recom: Tipo de recombinación ("un.punto" o "dos.puntos")
     
     Retorna:
-    - Lista de individuos recombinados con estructura preservada.
+    - Poblacion de hijos; conservan los pasillos y las métricas de su padre hasta la mutación.
     """
-    p_prima = []
-    ind = 0
+    N = min(N, len(M))
+    parejas = N // 2
+    p_prima = M.tomar(np.arange(N))
+
+    if parejas == 0:
+        return p_prima
+
+    impares, pares = np.arange(0, 2 * parejas, 2), np.arange(1, 2 * parejas, 2)
+    p1, p2 = M.ordenes[impares], M.ordenes[pares]
+    l1, l2 = M.largos[impares].astype(np.int64), M.largos[pares].astype(np.int64)
+    cero = np.zeros(parejas, dtype=np.int64)
+
+    match recom:
+        case "un.punto":
+            # Un punto de corte distinto para cada padre
+            cruza = (l1 >= 2) & (l2 >= 2) & (np.random.uniform(0, 1, parejas) < pc)
+            c1, c2 = _puntos_de_corte(l1, cruza), _puntos_de_corte(l2, cruza)
+
+            hijos1, _ = _ensamblar([(p1, cero, c1), (p2, c2, l2)])
+            hijos2, _ = _ensamblar([(p2, cero, c2), (p1, c1, l1)])
+
+        case "dos.puntos":
+            # Dos puntos de corte distintos por padre
+            cruza = (l1 >= 3) & (l2 >= 3) & (np.random.uniform(0, 1, parejas) < pc)
+            a1, b1 = _dos_puntos_de_corte(l1, cruza)
+            a2, b2 = _dos_puntos_de_corte(l2, cruza)
+
+            hijos1, _ = _ensamblar([(p1, cero, a1), (p2, a2, b2), (p1, b1, l1)])
+            hijos2, _ = _ensamblar([(p2, cero, a2), (p1, a1, b1), (p2, b2, l2)])
+
+    # Hijos intercalados en el orden de sus padres; las órdenes repetidas se eliminan
+    ancho = max(hijos1.shape[1], hijos2.shape[1])
+    hijos = np.full((2 * parejas, ancho), RELLENO, dtype=hijos1.dtype)
+    hijos[impares, :hijos1.shape[1]] = hijos1
+    hijos[pares, :hijos2.shape[1]] = hijos2
+    hijos, largos = _quitar_repetidas(hijos)
+
+    # Individuo impar sin pareja: se conserva igual
+    ancho = max(hijos.shape[1], p_prima.ordenes.shape[1] if N > 2 * parejas else 1)
+    p_prima.ordenes = np.full((N, ancho), RELLENO, dtype=hijos.dtype)
+    p_prima.ordenes[:2 * parejas, :hijos.shape[1]] = hijos
+    if N > 2 * parejas:
+        p_prima.ordenes[N - 1, :M.largos[N - 1]] = M.x(N - 1)
+    p_prima.largos[:2 * parejas] = largos
+
+    # Evaluador de cada hijo: el del padre (compartido si no hubo cruce) o derivado por deltas
+    for k in np.flatnonzero(np.repeat(cruza, 2)):
+        p_prima.evaluadores[k] = derivar_evaluador(M.evaluadores[k], M.x(k), p_prima.x(k))
 
-    while ind < N:
-        if ind + 1 >= len(M):
-            p_prima.append(M[ind])
-            break       
-        
-        p1, p2 = M[ind][0], M[ind+1][0]  # Tomamos solo el vector binario `x`
-        if len(p1) < 2 or len(p2) < 2:
-            nuevo_x1, nuevo_x2 = p1, p2
-        elif np.random.uniform() < pc:
-            match recom:
-                case "un.punto":
-                    # Seleccionar un punto de corte distinto para cada padre
-                    punto_p1 = np.random.randint(1, len(p1)) 
-                    punto_p2 = np.random.randint(1, len(p2))  
-                    
-                    nuevo_x1 = np.concatenate((p1[:punto_p1], p2[punto_p2:]))
-                    nuevo_x2 = np.concatenate((p2[:punto_p2], p1[punto_p1:]))
-                    
-                case "dos.puntos":
-                    # Seleccionar dos puntos de corte distintos por padre
-                    puntos_p1 = sorted(np.random.choice(range(1, len(p1)), size=2, replace=False))
-                    puntos_p2 = sorted(np.random.choice(range(1, len(p2)), size=2, replace=False))
-
-                    nuevo_x1 = np.concatenate((p1[:puntos_p1[0]], p2[puntos_p2[0]:puntos_p2[1]], p1[puntos_p1[1]:]))
-                    nuevo_x2 = np.concatenate((p2[:puntos_p2[0]], p1[puntos_p1[0]:puntos_p1[1]], p2[puntos_p2[1]:]))
+    return p_prima
 
-        else:
-            nuevo_x1, nuevo_x2 = p1, p2  # No hay cruce, se conservan iguales
+def derivar_evaluador(evaluador, x_padre, x_hijo):
+    """
+    Evaluador de un hijo a partir del de su padre, aplicando solo las órdenes que cambiaron.
+
+    Retorna None si el padre no tiene evaluador.
+    """
+    if evaluador is None:
+        return None
 
-        # Conservar la estructura original del individuo
-        individuo1 = [list(dict.fromkeys(nuevo_x1)), M[ind][1], M[ind][2]]
-        individuo2 = [list(dict.fromkeys(nuevo_x2)), M[ind+1][1], M[ind+1][2]]
+    with PERFIL.medir("demanda"):
+        evaluador = evaluador.copia()
+        evaluador.aplicar(salen=np.setdiff1d(x_padre, x_hijo), entran=np.setdiff1d(x_hijo, x_padre))
+    return evaluador
 
-        p_prima.append(individuo1)
-        p_prima.append(individuo2)
+def sortear_mutaciones(x, pm, num_ordenes, bits=None):
+    """
+    Sortea en bloque las posiciones de x que mutan y las órdenes que las reemplazan.
 
-        ind += 2  # Procesamos de dos en dos
+    Las órdenes de reemplazo son distintas entre sí y no están en x. En lugar de construir
+    el complemento de x como conjunto, se sortean candidatos por rechazo contra el bitset
+    de x; si x ocupa más de la mitad de las órdenes se toma el complemento explícito.
 
-    return p_prima
+    Parámetros:
+    - x: arreglo de órdenes del individuo.
+    - pm: probabilidad de mutación por posición.
+    - num_ordenes: total de órdenes de la instancia.
+    - bits: bitset de las órdenes de x (bs.desde_indices); se calcula si no se da.
 
-def mutacion(p_prima, N, pm, ordenes_list, pasillos_list, general, stock):
+    Retorna:
+    - posiciones: índices de x que mutan.
+    - reemplazos: órdenes nuevas para esas posiciones.
+    """
+    posiciones = np.flatnonzero(np.random.uniform(0, 1, len(x)) < pm)
+    libres = num_ordenes - len(x)
+    if len(posiciones) > libres:
+        posiciones = np.sort(np.random.choice(posiciones, libres, replace=False))
+
+    k = len(posiciones)
+    if k == 0:
+        return posiciones, np.zeros(0, dtype=np.int64)
+
+    if bits is None:
+        bits = bs.desde_indices(x, num_ordenes)
+
+    if 2 * libres >= num_ordenes:
+        # Muestreo por rechazo: cada candidato cae fuera de x con probabilidad >= 1/2
+        reemplazos = np.zeros(0, dtype=np.int64)
+        while len(reemplazos) < k:
+            candidatos = np.random.randint(0, num_ordenes, size=2 * (k - len(reemplazos)) + 8)
+            reemplazos = np.concatenate((reemplazos, candidatos[~bs.contiene(bits, candidatos)]))
+            _, primeros = np.unique(reemplazos, return_index=True)
+            reemplazos = reemplazos[np.sort(primeros)]
+        reemplazos = reemplazos[:k]
+    else:
+        complemento = bs.a_indices(np.invert(bits))
+        reemplazos = np.random.choice(complemento[complemento < num_ordenes], k, replace=False)
+
+    return posiciones, reemplazos
+
+def mutacion(p_prima, N, pm, ordenes_list, pasillos_list, general, stock, selector=None, paralelo=None):
     """
-    Aplica mutación solo al vector binario de cada individuo y recalcula métricas.
+    Aplica mutación solo al vector de órdenes de cada individuo y recalcula métricas.
     
-    - p_prima: Lista de individuos con la estructura [x, pasillos_seleccionados, np.array([sum_i, n_pasillos, f])]
+    - p_prima: Poblacion de hijos; se modifica en su lugar.
     - N: Número de individuos a mutar.
     - pm: Probabilidad de mutación por bit.
     - ordenes_list: Lista de diccionarios de órdenes
     - pasillos_list: Lista de diccionarios de pasillos
     - general: Parámetros generales
     - stock: Diccionario de stock disponible
+    - selector: fn.SelectorPasillos para elegir pasillos; si es None se usa el modelo exacto fn.pasillos.
+    - paralelo: paralelo.EvaluadorParalelo para evaluar a los hijos en varios procesos (opcional).
     
     Retorna:
-    - Lista de individuos mutados con estructura preservada.
+    - Poblacion de individuos mutados y evaluados.
     """
-    for i in range(N):
-        # Obtener el vector binario del individuo
-        x = np.copy(p_prima[i][0])
+    # Órdenes de cada individuo como bitset, para sortear reemplazos fuera de x
+    bits_ordenes = p_prima.bits_ordenes(general[0])
+    mutados = []
 
-        for j in range(len(x)):
-            if np.random.uniform(0, 1) < pm:
-                out = np.random.choice(list(set(range(general[0])) - set(x)))
-                x[j] = out
+    for i in range(N):
+        # Vector de órdenes del individuo (la mutación no cambia su largo)
+        x = p_prima.x(i).astype(np.int64)
 
-        # Generar demanda consolidada
-        demanda = fn.generar_demanda(ordenes_list, x)
+        # Evaluador con la demanda de x; puede estar compartido con el padre, así que se
+        # copia solo si el individuo realmente muta
+        evaluador, propio = p_prima.evaluadores[i], False
+        if evaluador is None:
+            evaluador, propio = fn.EvaluadorIncremental(ordenes_list, stock, x), True
 
-        # Penalización por exceso de stock
-        exceso_stock = sum(max(0, cantidad - stock.get(item_id, 0)) for item_id, cantidad in demanda.items())
+        # Posiciones que mutan y órdenes que entran, sorteadas en bloque
+        posiciones, reemplazos = sortear_mutaciones(x, pm, general[0], bits_ordenes[i])
 
-        # En las funciones inicio() y mutacion(), cambiar:
-        if exceso_stock > 0:
-            n_pasillos, pasillos_seleccionados = general[2], []  # No sumar 100
-        else:
-            n_pasillos, pasillos_seleccionados = fn.pasillos(pasillos_list, demanda, general[2])
+        if len(posiciones) > 0:
+            with PERFIL.medir("demanda"):
+                if not propio:
+                    evaluador, propio = evaluador.copia(), True
+                evaluador.aplicar(salen=x[posiciones], entran=reemplazos)
+            x[posiciones] = reemplazos
+            p_prima.ordenes[i, posiciones] = reemplazos
 
-        # Calcular función objetivo (note we removed the stock parameter)
-        fun = fn.funcion_objetivo(demanda, n_pasillos, general[3], general[4], exceso_stock)
+        p_prima.evaluadores[i] = evaluador
+        mutados.append((x, evaluador))
 
-        # Calcular suma total de demanda
-        sum_i = sum(demanda.values())
+    # Pasillos y función objetivo (memorizados por conjunto de órdenes)
+    evaluaciones = evaluar_lote(mutados, ordenes_list, pasillos_list, general, stock, selector, paralelo)
 
-        # Actualizar el individuo
-        p_prima[i] = tuple([x, pasillos_seleccionados, np.array([sum_i, n_pasillos, fun])])
+    # Actualizar los individuos
+    for i, (pasillos_seleccionados, metricas) in enumerate(evaluaciones):
+        p_prima.asignar_evaluacion(i, pasillos_seleccionados, metricas)
 
     return p_prima
 
@@ -232,23 +494,24 @@ def reemplazo(S, p_prima, N):
     """
     Aplica reemplazo para seleccionar los mejores N individuos basados en la función objetivo `f`.
 
-    - S: Lista de población de padres
-    - p_prima: Lista de población de hijos
+    - S: Poblacion de padres
+    - p_prima: Poblacion de hijos
     - N: Número de individuos a conservar
     
     Retorna:
-    - Lista de los mejores N individuos.
+    - Poblacion con los mejores N individuos, de mejor a peor.
     """
     # Combinar población padre e hijo
-    poblacion_completa = S + p_prima  
-    
-    # Extraer valores de la función objetivo `f`
-    valores_f = [individuo[2][2] for individuo in poblacion_completa]  
-    
-    # Ordenar individuos por `f` de MAYOR a menor ([::-1])
-    indices_ordenados = np.argsort(valores_f)[::-1]  
-    
+    poblacion_completa = S.unir(p_prima)
+    valores_f = poblacion_completa.fitness
+
+    # Truncamiento: los N mejores sin ordenar toda la población (argpartition),
+    # y solo esos N se ordenan por `f` de MAYOR a menor
+    if N < len(valores_f):
+        mejores = np.argpartition(-valores_f, N - 1)[:N]
+    else:
+        mejores = np.arange(len(valores_f))
+    mejores = mejores[np.argsort(-valores_f[mejores], kind="stable")]
+
     # Seleccionar los mejores N individuos
-    S = [poblacion_completa[i] for i in indices_ordenados[:N]]
-    
-    return S
+    return poblacion_completa.tomar(mejores).recortar()
@@ -0,0 +1,233 @@
+#!/usr/bin/python3
+"""
+Modelo de islas para el GA de genetico_entero.
+
+Cada isla es una población independiente que corre en su propio proceso con su
+propia configuración (select, recom, pc, pm) y con el controlador de controlador.py,
+así que respeta el mismo límite de tiempo que una corrida de 5_minutos.py (que expone
+este modelo con --islas). Cada `intervalo` generaciones la isla envía sus mejores
+`migrantes` individuos a la siguiente isla (topología de anillo) y recibe los de la
+anterior, que entran a la población por reemplazo.
+"""
+import argparse
+import multiprocessing as mp
+import queue
+import sys
+import time
+
+import numpy as np
+
+import controlador as ctl
+import funciones_entero as fn
+import genetico_entero as gn
+from poblacion import Poblacion
+
+# Configuraciones usadas cuando no se indican con --config: (select, recom, pc, pm)
+CONFIGURACIONES_BASE = [
+    ("torneo.rep", "un.punto", 0.8, 0.05),
+    ("torneo.sin.rep", "dos.puntos", 0.9, 0.02),
+    ("ruleta", "un.punto", 0.7, 0.1),
+    ("torneo.rep", "dos.puntos", 0.6, 0.01),
+]
+
+def leer_configuracion(texto):
+    """Convierte 'select:recom:pc:pm' en la tupla (select, recom, pc, pm)."""
+    select, recom, pc, pm = texto.split(":")
+    return select, recom, float(pc), float(pm)
+
+def _recibir_migrantes(entrada, ordenes_list, stock):
+    """Vacía la cola de entrada sin bloquear y arma una Poblacion con los migrantes y sus evaluadores."""
+    migrantes = []
+    while True:
+        try:
+            paquete = entrada.get_nowait()
+        except queue.Empty:
+            break
+        for x, pasillos_seleccionados, metricas in paquete:
+            migrantes.append((x, pasillos_seleccionados, metricas, fn.EvaluadorIncremental(ordenes_list, stock, x)))
+    return Poblacion.desde_individuos(migrantes) if migrantes else None
+
+def isla(indice, archivo, configuracion, mu, reloj_inicio, limite, intervalo, migrantes, pasillos, semilla,
+         entrada, salida, resultados, detener, reducir=False, estancamiento=0, pulir=False, reserva_pulido=0.0):
+    """
+    Corre una isla con ctl.ejecutar hasta el límite y publica su mejor individuo.
+
+    Parámetros:
+    - indice: número de la isla.
+    - configuracion: tupla (select, recom, pc, pm).
+    - reloj_inicio, limite: límite de la corrida (ver ctl.ejecutar), el mismo en todas las islas.
+    - intervalo: generaciones entre migraciones.
+    - migrantes: número de mejores individuos que se envían en cada migración (0 = sin migración).
+    - pasillos: modo de fn.SelectorPasillos ("greedy" o "exacto").
+    - semilla: semilla base; la isla usa semilla + indice (None toma entropía del sistema).
+    - entrada, salida: colas de migración (de la isla anterior y hacia la siguiente).
+    - resultados: cola donde se deja (indice, mejor individuo, generaciones, final) cada vez que
+      mejora el mejor de la isla y una última vez, con final = True, al terminar.
+    - detener: evento con el que el coordinador pide terminar la búsqueda.
+    - reducir: usa la instancia reducida (todas las islas calculan la misma reducción).
+    - estancamiento, pulir, reserva_pulido: ver ctl.ejecutar.
+    """
+    np.random.seed(None if semilla is None else semilla + indice)
+    select, recom, pc, pm = configuracion
+
+    general, ordenes_list, pasillos_list = fn.lectura(archivo, reducir)
+    stock = fn.generar_stock(pasillos_list)
+    unidades_orden = fn.estadisticas(archivo, reducir).ordenes["unidades"].tolist()
+    selector = fn.SelectorPasillos(pasillos_list, general[1], modo=pasillos)
+    publicado = -np.inf
+
+    def intercambio(generacion, S):
+        nonlocal publicado
+        # S está ordenada de mejor a peor después del reemplazo
+        if S.fitness[0] > publicado:
+            publicado = S.fitness[0]
+            resultados.put((indice, S.individuo(0)[:3], generacion, False))
+
+        if migrantes and generacion % intervalo == 0:
+            salida.put([S.individuo(k)[:3] for k in range(min(migrantes, len(S)))])
+            recibidos = _recibir_migrantes(entrada, ordenes_list, stock)
+            if recibidos is not None:
+                S = gn.reemplazo(S, recibidos, mu)
+        return S
+
+    mejor, resumen = ctl.ejecutar(general, ordenes_list, pasillos_list, stock, mu, select, pc, recom, pm,
+                                  selector=selector, limite=limite, estancamiento=estancamiento, pulir=pulir,
+                                  reserva_pulido=reserva_pulido, reloj_inicio=reloj_inicio,
+                                  unidades_orden=unidades_orden, intercambio=intercambio, detener=detener)
+
+    # Los migrantes que nadie alcanzó a leer se descartan para que el proceso pueda terminar
+    salida.cancel_join_thread()
+    resultados.put((indice, mejor[:3], resumen["generaciones"], True))
+
+def _esperar_resultados(resultados, procesos, fin, detener, gracia):
+    """
+    Lee lo que publican las islas hasta que todas entregan su resultado final.
+
+    Al llegar a `fin` activa `detener` y espera a lo más `gracia` segundos más. Deja de
+    esperar antes si todas las islas que faltan ya terminaron (p. ej. murieron por una
+    excepción o por falta de memoria).
+
+    Retorna:
+    - ultimos: {indice: (individuo, generaciones)} con lo último que publicó cada isla.
+    - terminadas: índices de las islas que entregaron su resultado final.
+    """
+    ultimos, terminadas = {}, set()
+    limite = fin
+
+    def guardar(indice, individuo, generaciones, final):
+        ultimos[indice] = (individuo, generaciones)
+        if final:
+            terminadas.add(indice)
+
+    while len(terminadas) < len(procesos):
+        restante = limite - time.time()
+        if restante <= 0:
+            if detener.is_set():
+                break
+            detener.set()
+            limite = time.time() + gracia
+            continue
+        try:
+            guardar(*resultados.get(timeout=min(restante, 1.0)))
+        except queue.Empty:
+            if not any(proceso.is_alive() for k, proceso in enumerate(procesos) if k not in terminadas):
+                # Un proceso que salió ya vació su cola; lo que quede se lee sin esperar
+                while True:
+                    try:
+                        guardar(*resultados.get_nowait())
+                    except queue.Empty:
+                        break
+                break
+    return ultimos, terminadas
+
+def ejecutar_islas(archivo, configuraciones, mu, tiempo, intervalo=10, migrantes=2, pasillos="greedy", semilla=None,
+                   reducir=False, gracia=2.0, reloj_inicio=None, estancamiento=0, pulir=False, reserva_pulido=0.0):
+    """
+    Lanza una isla por configuración y regresa el mejor individuo al llegar al límite.
+
+    Todas las islas corren ctl.ejecutar con el mismo límite (`tiempo` segundos desde
+    reloj_inicio) y publican su mejor individuo cada vez que mejora. Al llegar al límite
+    se activa un evento para que terminen; las que no entregan su resultado final en
+    `gracia` segundos se terminan y cuentan con lo último que publicaron. Una isla que
+    muere sin publicar nada se reporta en stderr. Con una sola isla no hay migración.
+
+    Retorna:
+    - mejor: mejor individuo (x, pasillos_seleccionados, [sum_i, n_pasillos, fun]) entre todas las islas
+      (con reducir, x y los pasillos en IDs originales).
+    - resumen: lista de (indice, configuracion, fun del mejor, generaciones) por isla; fun y
+      generaciones son None en las islas que no publicaron nada.
+    """
+    n = len(configuraciones)
+    reloj_inicio = time.time() if reloj_inicio is None else reloj_inicio
+    migrantes = migrantes if n > 1 else 0
+    colas = [mp.Queue() for _ in range(n)]
+    resultados = mp.Queue()
+    detener = mp.Event()
+
+    procesos = []
+    for k, configuracion in enumerate(configuraciones):
+        proceso = mp.Process(target=isla, args=(k, archivo, configuracion, mu, reloj_inicio, tiempo, intervalo,
+                                                migrantes, pasillos, semilla, colas[k], colas[(k + 1) % n],
+                                                resultados, detener, reducir, estancamiento, pulir,
+                                                reserva_pulido))
+        proceso.start()
+        procesos.append(proceso)
+
+    ultimos, terminadas = _esperar_resultados(resultados, procesos, reloj_inicio + tiempo, detener, gracia)
+    for k, proceso in enumerate(procesos):
+        if k not in terminadas and proceso.is_alive():
+            proceso.terminate()
+        proceso.join()
+        if k not in ultimos:
+            print(f"Isla {k} {configuraciones[k]} no entregó resultado (exitcode = {proceso.exitcode})", file=sys.stderr)
+        elif k not in terminadas:
+            print(f"Isla {k} {configuraciones[k]} no terminó a tiempo; se usa su último mejor", file=sys.stderr)
+
+    if not ultimos:
+        raise RuntimeError("Ninguna isla entregó resultado")
+
+    mejor = max((individuo for individuo, _ in ultimos.values()), key=lambda individuo: individuo[2][2])
+    resumen = [(k, configuraciones[k], ultimos[k][0][2][2], ultimos[k][1]) if k in ultimos
+               else (k, configuraciones[k], None, None) for k in range(n)]
+    if reducir:
+        reduccion = fn.reduccion(archivo)
+        mejor = (reduccion.ordenes_originales(mejor[0]), reduccion.pasillos_originales(mejor[1]), mejor[2])
+
+    return mejor, resumen
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--instance", type=str, required=True)
+    parser.add_argument("--mu", type=int, required=True)
+    parser.add_argument("--islas", type=int, default=mp.cpu_count())
+    parser.add_argument("--config", type=str, action="append", default=[],
+                        help="configuración de una isla como select:recom:pc:pm (se puede repetir)")
+    parser.add_argument("--tiempo", type=float, default=300)
+    parser.add_argument("--intervalo", type=int, default=10, help="generaciones entre migraciones")
+    parser.add_argument("--migrantes", type=int, default=2, help="individuos que migran en cada intercambio")
+    parser.add_argument("--pasillos", type=str, default="greedy", choices=["greedy", "exacto"],
+                        help="exacto requiere CPLEX (docplex y su runtime); sin él se lanza CBC en cada evaluación")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--reducir", action="store_true", help="resuelve la instancia reducida (Comun/reduccion.py)")
+    parser.add_argument("--gracia", type=float, default=2.0,
+                        help="segundos que se espera a las islas después de pedirles que terminen")
+    args = parser.parse_args()
+
+    base = [leer_configuracion(c) for c in args.config] or CONFIGURACIONES_BASE
+    configuraciones = [base[k % len(base)] for k in range(args.islas)]
+
+    mejor, resumen = ejecutar_islas(args.instance, configuraciones, args.mu, args.tiempo,
+                                    args.intervalo, args.migrantes, args.pasillos, args.seed, args.reducir,
+                                    args.gracia)
+
+    if args.reducir:
+        print(fn.reduccion(args.instance).resumen())
+    for k, configuracion, fun, generaciones in resumen:
+        if fun is None:
+            print(f"Isla {k} {configuracion}: sin resultado")
+        else:
+            print(f"Isla {k} {configuracion}: mejor = {fun}, generaciones = {generaciones}")
+    print(mejor)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Evaluación de individuos del GA en un pool de procesos.
+
+Cada proceso carga la instancia una sola vez en su inicializador (con la cache
+binaria de Comun/instancia.py las matrices quedan en memoria mapeada y se
+comparten entre procesos), de modo que por tarea solo viaja el vector de órdenes.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import funciones_entero as fn
+import genetico_entero as gn
+
+# Datos de la instancia en cada proceso trabajador (los llena _inicializar)
+_DATOS = {}
+
+def _inicializar(archivo, modo_pasillos, reducir):
+    general, ordenes_list, pasillos_list = fn.lectura(archivo, reducir)
+    _DATOS["general"] = general
+    _DATOS["ordenes_list"] = ordenes_list
+    _DATOS["pasillos_list"] = pasillos_list
+    _DATOS["stock"] = fn.generar_stock(pasillos_list)
+    # La cache vive en el proceso principal; aquí solo se resuelve
+    _DATOS["selector"] = fn.SelectorPasillos(pasillos_list, general[1], modo=modo_pasillos, tamano_cache=0)
+
+def _evaluar(x, fin):
+    _DATOS["selector"].fin = fin
+    return gn.calcular_evaluacion(x, _DATOS["ordenes_list"], _DATOS["pasillos_list"], _DATOS["general"],
+                                  _DATOS["stock"], _DATOS["selector"])
+
+class EvaluadorParalelo:
+    """
+    Pool de procesos que evalúa conjuntos de órdenes (demanda, pasillos y función objetivo).
+
+    Parámetros:
+    - archivo: ruta de la instancia; cada proceso la carga una vez al iniciar.
+    - workers: número de procesos.
+    - modo_pasillos: "greedy" o "exacto", como en fn.SelectorPasillos.
+    - reducir: los procesos usan la instancia reducida (debe coincidir con la del proceso principal).
+
+    El atributo fin viaja con cada tarea al selector de los procesos (ver fn.SelectorPasillos).
+    """
+
+    def __init__(self, archivo, workers, modo_pasillos="greedy", reducir=False):
+        self.workers = workers
+        self.fin = None
+        self.pool = ProcessPoolExecutor(max_workers=workers, initializer=_inicializar,
+                                        initargs=(archivo, modo_pasillos, reducir))
+
+    def evaluar(self, lista_x):
+        """Evalúa cada x de la lista; regresa pares (pasillos_seleccionados, metricas) en el mismo orden."""
+        if not lista_x:
+            return []
+        chunksize = max(1, len(lista_x) // (4 * self.workers))
+        return list(self.pool.map(_evaluar, lista_x, repeat(self.fin), chunksize=chunksize))
+
+    def cerrar(self):
+        self.pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
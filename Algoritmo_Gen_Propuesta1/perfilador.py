@@ -0,0 +1,101 @@
+"""
+Medición de tiempos por fase del GA.
+
+Los operadores envuelven su trabajo en `with PERFIL.medir("fase"):`. Mientras el
+perfilador está inactivo, medir() regresa un contexto vacío compartido, así que el
+costo es una llamada a función. Al activarlo se acumulan los segundos y llamadas
+de cada fase, agrupados por generación, y al final se escribe un reporte JSON o CSV.
+
+Los tiempos son inclusivos: "mutacion" incluye a "demanda" y "pasillos" medidas
+dentro de ella. Con evaluación en paralelo solo se mide el proceso principal.
+"""
+import csv
+import json
+import time
+from collections import defaultdict
+
+class _Nulo:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULO = _Nulo()
+
+class _Medicion:
+    __slots__ = ("perfilador", "fase", "inicio")
+
+    def __init__(self, perfilador, fase):
+        self.perfilador = perfilador
+        self.fase = fase
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.perfilador.registrar(self.fase, time.perf_counter() - self.inicio)
+        return False
+
+class Perfilador:
+    """
+    Acumulador de tiempos por fase y por generación.
+
+    Atributos:
+    - activo: si es False, medir() no mide nada.
+    - totales, llamadas: segundos y número de llamadas por fase en toda la corrida.
+    - generaciones: lista con un diccionario {fase: segundos} por generación cerrada.
+    """
+
+    def __init__(self):
+        self.activo = False
+        self.reiniciar()
+
+    def reiniciar(self):
+        self.totales = defaultdict(float)
+        self.llamadas = defaultdict(int)
+        self.actual = defaultdict(float)
+        self.generaciones = []
+
+    def activar(self):
+        self.activo = True
+
+    def medir(self, fase):
+        return _Medicion(self, fase) if self.activo else _NULO
+
+    def registrar(self, fase, segundos):
+        self.totales[fase] += segundos
+        self.llamadas[fase] += 1
+        self.actual[fase] += segundos
+
+    def cerrar_generacion(self):
+        """Guarda los tiempos acumulados desde la generación anterior."""
+        if self.activo:
+            self.generaciones.append(dict(self.actual))
+            self.actual = defaultdict(float)
+
+    def reporte(self):
+        return {
+            "totales": {fase: {"segundos": self.totales[fase], "llamadas": self.llamadas[fase]}
+                        for fase in sorted(self.totales)},
+            "generaciones": self.generaciones,
+        }
+
+    def escribir(self, ruta):
+        """Escribe el reporte en JSON o, si la ruta termina en .csv, una fila por generación."""
+        if ruta.endswith(".csv"):
+            fases = sorted(self.totales)
+            with open(ruta, "w", newline="") as f:
+                escritor = csv.writer(f)
+                escritor.writerow(["generacion"] + fases)
+                for g, tiempos in enumerate(self.generaciones):
+                    escritor.writerow([g] + [f"{tiempos.get(fase, 0.0):.6f}" for fase in fases])
+        else:
+            with open(ruta, "w") as f:
+                json.dump(self.reporte(), f, indent=2)
+
+# Perfilador compartido por todos los módulos del GA
+PERFIL = Perfilador()
@@ -0,0 +1,152 @@
+"""
+Población del GA de genetico_entero guardada en arreglos.
+
+En lugar de una lista de tuplas (x, pasillos_seleccionados, métricas, evaluador), la
+población es un conjunto de arreglos paralelos con un renglón por individuo:
+
+- ordenes: matriz (n, ancho) con las órdenes de cada individuo, rellena con -1.
+- largos: número de órdenes de cada individuo.
+- pasillos, largos_pasillos: igual que ordenes/largos para los pasillos seleccionados.
+- metricas: matriz (n, 3) con [sum_i, n_pasillos, fun] de cada individuo.
+- evaluadores: arreglo de objetos con el fn.EvaluadorIncremental de cada individuo.
+
+Así la selección, la recombinación y el reemplazo se hacen con indexación sobre
+arreglos completos y el tamaño de la población en memoria no cambia entre generaciones.
+Para operaciones de conjuntos, bits_ordenes y bits_pasillos dan la población como
+matrices de bitsets (ver Comun/bitset.py).
+"""
+import os
+import sys
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Comun"))
+import bitset as bs
+
+RELLENO = -1
+
+def _matriz_rellena(filas, n, dtype=np.int32):
+    """Matriz (n, ancho) con las filas (arreglos o listas) alineadas a la izquierda y rellena con -1."""
+    largos = np.array([len(fila) for fila in filas], dtype=np.int32)
+    matriz = np.full((n, max(int(largos.max(initial=0)), 1)), RELLENO, dtype=dtype)
+    for k, fila in enumerate(filas):
+        matriz[k, :len(fila)] = fila
+    return matriz, largos
+
+def _ensanchar(matriz, ancho):
+    """Regresa la matriz con al menos `ancho` columnas (rellena con -1)."""
+    if matriz.shape[1] >= ancho:
+        return matriz
+    nueva = np.full((matriz.shape[0], max(ancho, 2 * matriz.shape[1])), RELLENO, dtype=matriz.dtype)
+    nueva[:, :matriz.shape[1]] = matriz
+    return nueva
+
+class Poblacion:
+    """
+    Población de individuos del GA en arreglos paralelos.
+
+    Atributos:
+    - ordenes, largos: órdenes de cada individuo (matriz rellena con -1) y su número.
+    - pasillos, largos_pasillos: pasillos seleccionados de cada individuo y su número.
+    - metricas: matriz (n, 3) con [sum_i, n_pasillos, fun].
+    - evaluadores: arreglo de objetos con el evaluador de cada individuo (o None).
+    """
+
+    def __init__(self, ordenes, largos, pasillos, largos_pasillos, metricas, evaluadores):
+        self.ordenes = ordenes
+        self.largos = largos
+        self.pasillos = pasillos
+        self.largos_pasillos = largos_pasillos
+        self.metricas = metricas
+        self.evaluadores = evaluadores
+
+    @classmethod
+    def vacia(cls, n=0, ancho=1, ancho_pasillos=1):
+        """Población de n individuos sin órdenes ni pasillos."""
+        return cls(np.full((n, ancho), RELLENO, dtype=np.int32), np.zeros(n, dtype=np.int32),
+                   np.full((n, ancho_pasillos), RELLENO, dtype=np.int32), np.zeros(n, dtype=np.int32),
+                   np.zeros((n, 3)), np.full(n, None, dtype=object))
+
+    @classmethod
+    def desde_individuos(cls, individuos):
+        """
+        Construye la población a partir de tuplas (x, pasillos_seleccionados, métricas[, evaluador]).
+        """
+        n = len(individuos)
+        ordenes, largos = _matriz_rellena([individuo[0] for individuo in individuos], n)
+        pasillos, largos_pasillos = _matriz_rellena([individuo[1] for individuo in individuos], n)
+        metricas = np.zeros((n, 3))
+        evaluadores = np.full(n, None, dtype=object)
+        for k, individuo in enumerate(individuos):
+            metricas[k] = individuo[2]
+            if len(individuo) > 3:
+                evaluadores[k] = individuo[3]
+        return cls(ordenes, largos, pasillos, largos_pasillos, metricas, evaluadores)
+
+    def __len__(self):
+        return len(self.largos)
+
+    @property
+    def fitness(self):
+        """Valor de la función objetivo de cada individuo (vista de metricas)."""
+        return self.metricas[:, 2]
+
+    def x(self, k):
+        """Órdenes del individuo k (vista, sin relleno)."""
+        return self.ordenes[k, :self.largos[k]]
+
+    def pasillos_de(self, k):
+        """Pasillos seleccionados del individuo k como lista."""
+        return self.pasillos[k, :self.largos_pasillos[k]].tolist()
+
+    def individuo(self, k):
+        """Copia del individuo k como tupla (x, pasillos_seleccionados, métricas, evaluador)."""
+        return (self.x(k).astype(np.int64), self.pasillos_de(k), self.metricas[k].copy(), self.evaluadores[k])
+
+    def bits_ordenes(self, num_ordenes):
+        """Matriz de bitsets (n, bs.palabras(num_ordenes)) con las órdenes de cada individuo."""
+        return bs.desde_matriz(self.ordenes, self.largos, num_ordenes)
+
+    def bits_pasillos(self, num_pasillos):
+        """Matriz de bitsets (n, bs.palabras(num_pasillos)) con los pasillos de cada individuo."""
+        return bs.desde_matriz(self.pasillos, self.largos_pasillos, num_pasillos)
+
+    def asignar_x(self, k, x):
+        """Reemplaza las órdenes del individuo k, ensanchando la matriz si hace falta."""
+        self.ordenes = _ensanchar(self.ordenes, len(x))
+        self.ordenes[k, :len(x)] = x
+        self.ordenes[k, len(x):] = RELLENO
+        self.largos[k] = len(x)
+
+    def asignar_evaluacion(self, k, pasillos_seleccionados, metricas):
+        """Guarda los pasillos y las métricas [sum_i, n_pasillos, fun] del individuo k."""
+        n_sel = len(pasillos_seleccionados)
+        self.pasillos = _ensanchar(self.pasillos, n_sel)
+        self.pasillos[k, :n_sel] = pasillos_seleccionados
+        self.pasillos[k, n_sel:] = RELLENO
+        self.largos_pasillos[k] = n_sel
+        self.metricas[k] = metricas
+
+    def tomar(self, indices):
+        """Nueva población con los individuos de `indices` (en ese orden, con repeticiones)."""
+        indices = np.asarray(indices, dtype=np.intp)
+        return Poblacion(self.ordenes[indices], self.largos[indices], self.pasillos[indices],
+                         self.largos_pasillos[indices], self.metricas[indices], self.evaluadores[indices])
+
+    def unir(self, otra):
+        """Nueva población con los individuos de esta seguidos de los de `otra`."""
+        ancho = max(self.ordenes.shape[1], otra.ordenes.shape[1])
+        ancho_pasillos = max(self.pasillos.shape[1], otra.pasillos.shape[1])
+        return Poblacion(
+            np.concatenate((_ensanchar(self.ordenes, ancho)[:, :ancho], _ensanchar(otra.ordenes, ancho)[:, :ancho])),
+            np.concatenate((self.largos, otra.largos)),
+            np.concatenate((_ensanchar(self.pasillos, ancho_pasillos)[:, :ancho_pasillos],
+                            _ensanchar(otra.pasillos, ancho_pasillos)[:, :ancho_pasillos])),
+            np.concatenate((self.largos_pasillos, otra.largos_pasillos)),
+            np.concatenate((self.metricas, otra.metricas)),
+            np.concatenate((self.evaluadores, otra.evaluadores)))
+
+    def recortar(self):
+        """Quita las columnas de relleno sobrantes de ordenes y pasillos."""
+        self.ordenes = self.ordenes[:, :max(int(self.largos.max(initial=0)), 1)]
+        self.pasillos = self.pasillos[:, :max(int(self.largos_pasillos.max(initial=0)), 1)]
+        return self
@@ -29,3 +29,91 @@ def fitness(sol, matriz_ordenes, matriz_pasillos):
     fit = unidades_totales / m if m > 0 else 0
     
     return fit
+
+def _claves_unicas(filas, columnas, n_columnas, pesos=None):
+    '''
+    Agrupa pares (fila, columna) repetidos en claves fila*n_columnas + columna
+    ordenadas, sumando los pesos de cada par (o contando apariciones si no hay pesos).
+    '''
+    claves, inversa = np.unique(filas.astype(np.int64) * n_columnas + columnas, return_inverse=True)
+    pesos = np.ones(len(inversa), dtype=np.int64) if pesos is None else pesos
+    return claves, np.bincount(inversa, weights=pesos, minlength=len(claves)).astype(np.int64)
+
+def fitness_poblacion(poblacion, instancia, unidades_orden=None):
+    '''
+    Evalúa toda la población en una sola llamada, revisando las restricciones.
+
+    Entradas:
+    -------------------------------------------------------------------
+    poblacion(list): soluciones en el formato de fitness()
+        [n, j_1, ..., j_n, k, i_1, ..., i_k]
+    instancia: instancia.Instancia con las órdenes y los pasillos en CSR
+    unidades_orden(np.ndarray): unidades de cada orden; si no se da se
+        toma de instancia.estadisticas()
+    Salida:
+    --------------------------------------------------------------------
+    diccionario de arreglos, una entrada por individuo:
+        - 'unidades': unidades de las órdenes distintas seleccionadas
+        - 'num_pasillos': pasillos distintos visitados
+        - 'cumple_limites': LB <= unidades <= UB
+        - 'cubre_stock': el stock de los pasillos visitados alcanza para
+          cada ítem pedido
+        - 'factible': cumple_limites, cubre_stock y al menos un pasillo
+        - 'objetivo': unidades / num_pasillos si es factible; si no,
+          -(1 + unidades fuera de [LB, UB] + unidades sin stock), que
+          queda por debajo de cualquier individuo factible
+    '''
+    if unidades_orden is None:
+        unidades_orden = instancia.estadisticas().ordenes["unidades"]
+    P = len(poblacion)
+
+    # Órdenes y pasillos de todos los individuos, con el individuo al que pertenecen
+    ordenes = [sol[1:sol[0]+1] for sol in poblacion]
+    pasillos = [sol[sol[0]+2:sol[0]+2+sol[sol[0]+1]] for sol in poblacion]
+    ind_ordenes = np.repeat(np.arange(P), [len(o) for o in ordenes])
+    ind_pasillos = np.repeat(np.arange(P), [len(p) for p in pasillos])
+    ordenes = np.array([o for lista in ordenes for o in lista], dtype=np.int64)
+    pasillos = np.array([p for lista in pasillos for p in lista], dtype=np.int64)
+
+    # Sin repetidos ni índices fuera de la instancia
+    validas = (ordenes >= 0) & (ordenes < instancia.O)
+    claves_o, _ = _claves_unicas(ind_ordenes[validas], ordenes[validas], instancia.O)
+    ind_ordenes, ordenes = claves_o // instancia.O, claves_o % instancia.O
+    validos = (pasillos >= 0) & (pasillos < instancia.A)
+    claves_p, _ = _claves_unicas(ind_pasillos[validos], pasillos[validos], instancia.A)
+    ind_pasillos, pasillos = claves_p // instancia.A, claves_p % instancia.A
+
+    unidades = np.bincount(ind_ordenes, weights=np.asarray(unidades_orden)[ordenes], minlength=P).astype(np.int64)
+    num_pasillos = np.bincount(ind_pasillos, minlength=P)
+
+    # Demanda y stock por (individuo, ítem): producto disperso de la selección con las matrices CSR
+    pos = instancia.ordenes.posiciones(ordenes)
+    claves_d, demanda = _claves_unicas(np.repeat(ind_ordenes, instancia.ordenes.largos()[ordenes]),
+                                       instancia.ordenes.indices[pos], instancia.I, instancia.ordenes.data[pos])
+    pos = instancia.pasillos.posiciones(pasillos)
+    claves_s, stock = _claves_unicas(np.repeat(ind_pasillos, instancia.pasillos.largos()[pasillos]),
+                                     instancia.pasillos.indices[pos], instancia.I, instancia.pasillos.data[pos])
+
+    # Stock disponible para cada ítem pedido (0 si ningún pasillo visitado lo tiene)
+    if len(claves_s) == 0:
+        disponible = np.zeros_like(demanda)
+    else:
+        lugar = np.minimum(np.searchsorted(claves_s, claves_d), len(claves_s) - 1)
+        disponible = np.where(claves_s[lugar] == claves_d, stock[lugar], 0)
+    faltante = np.bincount(claves_d // instancia.I, weights=np.maximum(demanda - disponible, 0), minlength=P)
+
+    cumple_limites = (unidades >= instancia.LB) & (unidades <= instancia.UB)
+    cubre_stock = faltante == 0
+    factible = cumple_limites & cubre_stock & (num_pasillos > 0)
+    fuera = np.maximum(instancia.LB - unidades, 0) + np.maximum(unidades - instancia.UB, 0)
+
+    objetivo = np.where(factible, unidades / np.maximum(num_pasillos, 1), -(1.0 + fuera + faltante))
+
+    return {
+        'unidades': unidades,
+        'num_pasillos': num_pasillos,
+        'cumple_limites': cumple_limites,
+        'cubre_stock': cubre_stock,
+        'factible': factible,
+        'objetivo': objetivo
+    }
@@ -1,139 +1,268 @@
+import argparse
+import os
 import sys
 import random
 import numpy as np
-from Fitness import fitness
-from pruebas import matriz_ordenes, matriz_pasillos, liminf, limsup
+from Fitness import fitness_poblacion
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Comun"))
+import bitset as bs
+import instancia as ins
+
+class Complemento:
+    """
+    Órdenes que no están en la solución, con alta, baja y muestreo aleatorio en O(1).
+
+    Los elementos libres ocupan elementos[:tamano] y posicion[e] es el lugar de e en
+    ese arreglo (o >= tamano si e está en la solución).
+    """
+    def __init__(self, n, ocupados=(), rng=random):
+        self.rng = rng
+        self.elementos = np.arange(n)
+        self.posicion = np.arange(n)
+        self.tamano = n
+        for e in ocupados:
+            self.quitar(e)
+
+    def __len__(self):
+        return self.tamano
+
+    def _intercambiar(self, i, j):
+        a, b = self.elementos[i], self.elementos[j]
+        self.elementos[i], self.elementos[j] = b, a
+        self.posicion[a], self.posicion[b] = j, i
+
+    def quitar(self, e):
+        """Marca e como ocupado (deja de ser libre)"""
+        if self.posicion[e] < self.tamano:
+            self.tamano -= 1
+            self._intercambiar(self.posicion[e], self.tamano)
+
+    def agregar(self, e):
+        """Marca e como libre otra vez"""
+        if self.posicion[e] >= self.tamano:
+            self._intercambiar(self.posicion[e], self.tamano)
+            self.tamano += 1
+
+    def sacar_aleatorio(self):
+        """Elige un elemento libre al azar y lo marca como ocupado"""
+        e = int(self.elementos[self.rng.randrange(self.tamano)])
+        self.quitar(e)
+        return e
 
 class AlgoritmoGenetico:
-    def __init__(self, archivo=None, generaciones=100, tam_poblacion=50, prob_cruce=0.8, prob_mut=0.1):
-        self.archivo = archivo
+    def __init__(self, instancia, generaciones=100, tam_poblacion=50, prob_cruce=0.8, prob_mut=0.1, semilla=None):
+        """
+        Parámetros:
+        - instancia: instancia.Instancia ya cargada (ins.cargar_instancia); se puede reutilizar
+          para varias corridas en el mismo proceso.
+        - semilla: semilla del generador aleatorio propio de esta corrida (None toma entropía del sistema).
+        """
+        self.instancia = instancia
         self.generaciones = generaciones
         self.tam_poblacion = tam_poblacion
         self.prob_cruce = prob_cruce
         self.prob_mut = prob_mut
+        self.semilla = semilla
+        self.random = random.Random(semilla)
         self.mejor_solucion = None
         self.mejor_fitness = -np.inf
 
-    def obtener_pasillos_para_items(self, items):
-        """Encuentra los pasillos que contienen los items especificados"""
-        pasillos_necesarios = set()
-        for item in items:
-            for pasillo_idx, pasillo in enumerate(matriz_pasillos):
-                if item in pasillo:
-                    pasillos_necesarios.add(pasillo_idx)
-                    break
-        return list(pasillos_necesarios)
+        self.num_ordenes, self.num_pasillos = instancia.O, instancia.A
+        self.liminf, self.limsup = instancia.LB, instancia.UB
+
+        # Unidades e ítems distintos por orden (tabla de estadísticas de la instancia) e índice
+        # invertido ítem -> pasillos (con su stock), calculado una vez
+        self.ordenes_csr = instancia.ordenes
+        estadisticas = instancia.estadisticas()
+        self.unidades = estadisticas.ordenes["unidades"]
+        self.unidades_orden = self.unidades.tolist()
+        self.items_orden = estadisticas.ordenes["items"].tolist()
+        self.pasillos_csr = instancia.pasillos
+        self.pasillos_por_item = instancia.pasillos.transpuesta()
+        self._restante = np.zeros(instancia.I, dtype=np.int64)
+
+    def demanda_ordenes(self, ordenes):
+        """Ítems pedidos por las órdenes y la cantidad total de cada uno"""
+        pos = self.ordenes_csr.posiciones(ordenes)
+        items, inversa = np.unique(self.ordenes_csr.indices[pos], return_inverse=True)
+        cantidades = np.bincount(inversa, weights=self.ordenes_csr.data[pos], minlength=len(items)).astype(np.int64)
+        return items, cantidades
+
+    def obtener_pasillos_para_items(self, items, cantidades=None):
+        """
+        Encuentra pasillos que juntos tienen stock suficiente para los items especificados.
+
+        Greedy: cada vez se elige el pasillo que más unidades faltantes cubre. El aporte de
+        cada pasillo se calcula una vez con el índice invertido de los ítems pedidos y, tras
+        cada elección, solo se actualiza en los pasillos que tienen alguno de los ítems cuyo
+        faltante cambió. Sin cantidades basta una unidad de cada ítem. Regresa [] si el
+        stock no alcanza.
+        """
+        items = np.asarray(items, dtype=np.int64)
+        if cantidades is None:
+            items = np.unique(items)
+            cantidades = np.ones(len(items), dtype=np.int64)
+        cantidades = np.asarray(cantidades, dtype=np.int64)
+        if len(items) == 0:
+            return []
+
+        indice = self.pasillos_por_item
+        largos = indice.largos()
+
+        def aporte_items(items_, antes, despues):
+            """Cambio en el aporte de cada pasillo cuando el faltante de items_ pasa de antes a despues"""
+            pos = indice.posiciones(items_)
+            oferta = indice.data[pos].astype(np.int64)
+            delta = np.minimum(oferta, np.repeat(despues, largos[items_])) - np.minimum(oferta, np.repeat(antes, largos[items_]))
+            return np.bincount(indice.indices[pos], weights=delta, minlength=self.num_pasillos)
+
+        # Faltante por ítem en un arreglo denso (se limpia al salir)
+        restante = self._restante
+        restante[items] = cantidades
+        try:
+            aporte = aporte_items(items, np.zeros_like(cantidades), cantidades)
+            pendiente = int(cantidades.sum())
+            pasillos_necesarios = []
+            while pendiente > 0:
+                mejor = int(np.argmax(aporte))
+                if aporte[mejor] <= 0:
+                    return []
+                items_pasillo, oferta = self.pasillos_csr.fila(mejor)
+                antes = restante[items_pasillo]
+                despues = antes - np.minimum(oferta.astype(np.int64), antes)
+                cambian = despues != antes
+                aporte += aporte_items(items_pasillo[cambian], antes[cambian], despues[cambian])
+                aporte[mejor] = -1  # cada pasillo se elige una sola vez
+                restante[items_pasillo] = despues
+                pendiente -= int((antes - despues).sum())
+                pasillos_necesarios.append(mejor)
+            return pasillos_necesarios
+        finally:
+            restante[items] = 0
+
+    def pasillos_para_ordenes(self, ordenes):
+        """Pasillos que cubren la demanda completa de las órdenes"""
+        return self.obtener_pasillos_para_items(*self.demanda_ordenes(ordenes))
+
+    def ordenes_aleatorias(self):
+        """Subconjunto aleatorio de órdenes (de tamaño también aleatorio)"""
+        num_ordenes = self.random.randint(1, self.num_ordenes)
+        return self.random.sample(range(self.num_ordenes), num_ordenes)
+
+    def dentro_de_limites(self, ordenes):
+        """Si las unidades de las órdenes están entre LB y UB"""
+        return self.liminf <= int(self.unidades[ordenes].sum()) <= self.limsup
+
+    def solucion(self, ordenes):
+        """Arma [n, ordenes..., m, pasillos...] con los pasillos que cubren las órdenes"""
+        pasillos = self.pasillos_para_ordenes(ordenes)
+        return [len(ordenes)] + ordenes + [len(pasillos)] + pasillos
 
     def generar_solucion_aleatoria(self):
         """Genera una solución completamente aleatoria"""
-        num_ordenes = random.randint(1, len(matriz_ordenes))
-        ordenes = random.sample(range(len(matriz_ordenes)), num_ordenes)
-        
-        items = []
-        for orden in ordenes:
-            items.extend([i for i, cant in enumerate(matriz_ordenes[orden]) if cant > 0])
-        
-        pasillos = self.obtener_pasillos_para_items(items)
-        return [num_ordenes] + ordenes + [len(pasillos)] + pasillos
+        return self.solucion(self.ordenes_aleatorias())
 
-    def generar_solucion_heuristica(self):
-        """Genera una solución usando un enfoque heurístico simple"""
-        ordenes_con_items = [(i, sum(1 for cant in matriz_ordenes[i] if cant > 0)) 
-                            for i in range(len(matriz_ordenes))]
+    def ordenes_heuristicas(self):
+        """Órdenes con más ítems distintos primero, ajustadas para quedar entre LB y UB"""
+        ordenes_con_items = [(i, self.items_orden[i]) 
+                            for i in range(self.num_ordenes)]
         ordenes_ordenadas = sorted(ordenes_con_items, key=lambda x: -x[1])
         
         ordenes_seleccionadas = []
         unidades = 0
         for orden, _ in ordenes_ordenadas:
-            if unidades >= limsup:
+            if unidades >= self.limsup:
                 break
             ordenes_seleccionadas.append(orden)
-            unidades += sum(matriz_ordenes[orden])
+            unidades += self.unidades_orden[orden]
         
-        while unidades < liminf and len(ordenes_seleccionadas) < len(matriz_ordenes):
+        while unidades < self.liminf and len(ordenes_seleccionadas) < self.num_ordenes:
             for orden, _ in ordenes_ordenadas:
                 if orden not in ordenes_seleccionadas:
                     ordenes_seleccionadas.append(orden)
-                    unidades += sum(matriz_ordenes[orden])
+                    unidades += self.unidades_orden[orden]
                     break
         
-        while unidades > limsup and len(ordenes_seleccionadas) > 1:
+        while unidades > self.limsup and len(ordenes_seleccionadas) > 1:
             orden_a_quitar = min(ordenes_seleccionadas, 
-                               key=lambda o: sum(1 for cant in matriz_ordenes[o] if cant > 0))
+                               key=lambda o: self.items_orden[o])
             ordenes_seleccionadas.remove(orden_a_quitar)
-            unidades -= sum(matriz_ordenes[orden_a_quitar])
+            unidades -= self.unidades_orden[orden_a_quitar]
         
-        items = []
-        for orden in ordenes_seleccionadas:
-            items.extend([i for i, cant in enumerate(matriz_ordenes[orden]) if cant > 0])
-        pasillos = self.obtener_pasillos_para_items(items)
-        
-        return [len(ordenes_seleccionadas)] + ordenes_seleccionadas + [len(pasillos)] + pasillos
+        return ordenes_seleccionadas
+
+    def generar_solucion_heuristica(self):
+        """Genera una solución usando un enfoque heurístico simple"""
+        return self.solucion(self.ordenes_heuristicas())
 
     def generar_solucion_valida(self):
-        """Genera una solución válida que cumple con todas las restricciones"""
-        if random.random() < 0.5:
-            sol = self.generar_solucion_heuristica()
-            if liminf <= sum(sum(matriz_ordenes[o]) for o in sol[1:1+sol[0]]) <= limsup:
-                return sol
+        """
+        Genera una solución válida que cumple con todas las restricciones.
+
+        Las unidades de cada candidata se revisan con unidades_orden antes de calcular
+        sus pasillos, así que solo se cubren las que quedan entre LB y UB.
+        """
+        if self.random.random() < 0.5:
+            ordenes = self.ordenes_heuristicas()
+            if self.dentro_de_limites(ordenes):
+                return self.solucion(ordenes)
         
         for _ in range(100):
-            sol = self.generar_solucion_aleatoria()
-            unidades = sum(sum(matriz_ordenes[o]) for o in sol[1:1+sol[0]])
-            if liminf <= unidades <= limsup and sol[1+sol[0]] > 0:
-                return sol
+            ordenes = self.ordenes_aleatorias()
+            if self.dentro_de_limites(ordenes):
+                sol = self.solucion(ordenes)
+                if sol[1+sol[0]] > 0:
+                    return sol
         
-        for orden in range(len(matriz_ordenes)):
-            unidades = sum(matriz_ordenes[orden])
-            if liminf <= unidades <= limsup:
-                items = [i for i, cant in enumerate(matriz_ordenes[orden]) if cant > 0]
-                pasillos = self.obtener_pasillos_para_items(items)
+        for orden in range(self.num_ordenes):
+            unidades = self.unidades_orden[orden]
+            if self.liminf <= unidades <= self.limsup:
+                pasillos = self.pasillos_para_ordenes([orden])
                 if pasillos:
                     return [1, orden, len(pasillos)] + pasillos
         
         return [1, 0, 1, 0]
 
     def reparar_solucion(self, sol):
-        """Repara una solución para que cumpla con todas las restricciones"""
+        """
+        Repara una solución para que cumpla con todas las restricciones.
+
+        Las unidades se llevan como total acumulado con las unidades precalculadas de
+        cada orden, las órdenes a agregar se sortean de un Complemento y los pasillos
+        se calculan una sola vez, al final, para las órdenes reparadas.
+        """
         try:
             num_ordenes = sol[0]
             ordenes = sol[1:1+num_ordenes]
-            num_pasillos = sol[1+num_ordenes] if len(sol) > 1+num_ordenes else 0
-            pasillos = sol[2+num_ordenes:2+num_ordenes+num_pasillos] if len(sol) > 2+num_ordenes else []
             
-            ordenes = list({o for o in ordenes if 0 <= o < len(matriz_ordenes)})
+            ordenes = list({o for o in ordenes if 0 <= o < self.num_ordenes})
             num_ordenes = len(ordenes)
             
-            items = []
-            for orden in ordenes:
-                items.extend([i for i, cant in enumerate(matriz_ordenes[orden]) if cant > 0])
-            
-            pasillos = self.obtener_pasillos_para_items(items)
-            num_pasillos = len(pasillos)
-            
-            unidades = sum(sum(matriz_ordenes[o]) for o in ordenes)
+            unidades = sum(self.unidades_orden[o] for o in ordenes)
+            libres = None
             intentos = 0
             
-            while (unidades < liminf or unidades > limsup) and intentos < 100:
-                if unidades < liminf and num_ordenes < len(matriz_ordenes):
-                    disponibles = [i for i in range(len(matriz_ordenes)) if i not in ordenes]
-                    if disponibles:
-                        ordenes.append(random.choice(disponibles))
-                        num_ordenes += 1
-                elif unidades > limsup and num_ordenes > 1:
-                    ordenes.pop(random.randint(0, num_ordenes-1))
+            while (unidades < self.liminf or unidades > self.limsup) and intentos < 100:
+                if unidades < self.liminf and num_ordenes < self.num_ordenes:
+                    if libres is None:
+                        libres = Complemento(self.num_ordenes, ordenes, self.random)
+                    orden = libres.sacar_aleatorio()
+                    ordenes.append(orden)
+                    num_ordenes += 1
+                    unidades += self.unidades_orden[orden]
+                elif unidades > self.limsup and num_ordenes > 1:
+                    orden = ordenes.pop(self.random.randint(0, num_ordenes-1))
                     num_ordenes -= 1
-                
-                items = []
-                for orden in ordenes:
-                    items.extend([i for i, cant in enumerate(matriz_ordenes[orden]) if cant > 0])
-                pasillos = self.obtener_pasillos_para_items(items)
-                num_pasillos = len(pasillos)
-                unidades = sum(sum(matriz_ordenes[o]) for o in ordenes)
+                    unidades -= self.unidades_orden[orden]
+                    if libres is not None:
+                        libres.agregar(orden)
                 intentos += 1
             
-            if num_pasillos > 0 and liminf <= unidades <= limsup:
-                return [num_ordenes] + ordenes + [num_pasillos] + pasillos
+            if self.liminf <= unidades <= self.limsup:
+                pasillos = self.pasillos_para_ordenes(ordenes)
+                if pasillos:
+                    return [num_ordenes] + ordenes + [len(pasillos)] + pasillos
         except:
             pass
         
@@ -143,38 +272,35 @@ class AlgoritmoGenetico:
         """Selección por ranking lineal"""
         ranked = sorted(zip(poblacion, fitnesses), key=lambda x: -x[1])
         probabilidades = [i/len(ranked) for i in range(1, len(ranked)+1)]
-        return random.choices(
+        return self.random.choices(
             [ind for ind, fit in ranked],
             weights=probabilidades,
             k=num_padres
         )
 
+    def pasillos_de(self, ind):
+        """Pasillos visitados por una solución [n, ordenes..., m, pasillos...]"""
+        num_ordenes = ind[0]
+        pasillos_ind = ind[2+num_ordenes:2+num_ordenes+ind[1+num_ordenes]]
+        return [p for p in pasillos_ind if 0 <= p < self.num_pasillos]
+
     def seleccion_diversidad(self, poblacion, fitnesses, num_padres):
         """Selección basada en diversidad de pasillos"""
+        # Pasillos de cada individuo como bitset: un renglón de palabras uint64 por individuo
+        bits_pasillos = bs.desde_listas([self.pasillos_de(ind) for ind in poblacion], self.num_pasillos)
+
         padres = []
-        mejor_ind = poblacion[np.argmax(fitnesses)]
-        padres.append(mejor_ind.copy())
+        mejor_idx = int(np.argmax(fitnesses))
+        padres.append(poblacion[mejor_idx].copy())
+        pasillos_cubiertos = bits_pasillos[mejor_idx].copy()
         
         for _ in range(num_padres - 1):
-            if len(padres) == 0:
-                elegido = random.choice(poblacion)
-            else:
-                pasillos_cubiertos = set()
-                for ind in padres:
-                    num_ordenes = ind[0]
-                    pasillos_ind = ind[2+num_ordenes:2+num_ordenes+ind[1+num_ordenes]]
-                    pasillos_cubiertos.update(pasillos_ind)
-                
-                diversidades = []
-                for ind in poblacion:
-                    num_ordenes = ind[0]
-                    pasillos_ind = ind[2+num_ordenes:2+num_ordenes+ind[1+num_ordenes]]
-                    nuevos_pasillos = len(set(pasillos_ind) - pasillos_cubiertos)
-                    diversidades.append(nuevos_pasillos + 1)
-                
-                elegido = random.choices(poblacion, weights=diversidades, k=1)[0]
+            # Pasillos nuevos de cada individuo respecto a los ya cubiertos por los padres
+            diversidades = bs.conteo(bs.diferencia(bits_pasillos, pasillos_cubiertos)) + 1
             
-            padres.append(elegido.copy())
+            elegido = self.random.choices(range(len(poblacion)), weights=diversidades.tolist(), k=1)[0]
+            pasillos_cubiertos = bs.union(pasillos_cubiertos, bits_pasillos[elegido])
+            padres.append(poblacion[elegido].copy())
         
         return padres
 
@@ -188,7 +314,8 @@ class AlgoritmoGenetico:
                 poblacion.append(self.generar_solucion_valida())
         
         for generacion in range(self.generaciones):
-            fitnesses = [fitness(ind, matriz_ordenes, matriz_pasillos) for ind in poblacion]
+            # Fitness de toda la población en una llamada; los infactibles quedan debajo de los factibles
+            fitnesses = fitness_poblacion(poblacion, self.instancia, self.unidades)['objetivo'].tolist()
             
             max_fit = max(fitnesses)
             if max_fit > self.mejor_fitness:
@@ -211,12 +338,12 @@ class AlgoritmoGenetico:
                     min_len = min(len(padre1), len(padre2))
                     
                     if min_len > 2:
-                        punto1 = random.randint(1, min_len-2)
-                        punto2 = random.randint(punto1+1, min_len-1)
+                        punto1 = self.random.randint(1, min_len-2)
+                        punto2 = self.random.randint(punto1+1, min_len-1)
                         hijo1 = padre1[:punto1] + padre2[punto1:punto2] + padre1[punto2:]
                         hijo2 = padre2[:punto1] + padre1[punto1:punto2] + padre2[punto2:]
                     else:
-                        punto = random.randint(1, min_len-1)
+                        punto = self.random.randint(1, min_len-1)
                         hijo1 = padre1[:punto] + padre2[punto:]
                         hijo2 = padre2[:punto] + padre1[punto:]
                     
@@ -227,11 +354,11 @@ class AlgoritmoGenetico:
             
             # Mutación
             for i in range(len(descendencia)):
-                if random.random() < self.prob_mut:
+                if self.random.random() < self.prob_mut:
                     mutado = descendencia[i].copy()
                     if len(mutado) > 4:
-                        idx = random.randint(1, len(mutado)-1)
-                        mutado[idx] = random.choice(range(len(matriz_pasillos)))
+                        idx = self.random.randint(1, len(mutado)-1)
+                        mutado[idx] = self.random.choice(range(self.num_pasillos))
                     descendencia[i] = self.reparar_solucion(mutado)
             
             # Reemplazo
@@ -247,8 +374,8 @@ class AlgoritmoGenetico:
             'num_ordenes': num_ordenes,
             'pasillos': pasillos,
             'num_pasillos': len(pasillos),
-            'unidades': sum(sum(matriz_ordenes[o]) for o in ordenes),
-            'items_unicos': len(set(i for o in ordenes for i, cant in enumerate(matriz_ordenes[o]) if cant > 0)),
+            'unidades': sum(self.unidades_orden[o] for o in ordenes),
+            'items_unicos': len(self.demanda_ordenes(ordenes)[0]),
             'fitness': self.mejor_fitness,
             'parametros': {
                 'generaciones': self.generaciones,
@@ -258,57 +385,84 @@ class AlgoritmoGenetico:
             }
         }
 
-def algoritmo_genetico_mejorado(archivo=None, generaciones=100, tam_poblacion=50, prob_cruce=0.8, prob_mut=0.1):
-    """Función wrapper para compatibilidad con target-runner.py"""
-    # Si se ejecuta desde target-runner.py, los parámetros vendrán en sys.argv
-    #if len(sys.argv) > 1:
-        # El primer argumento es el nombre del script, los siguientes son los parámetros
-        # Ejemplo de llamada desde target-runner.py: ./GGA.py INSTANCE generaciones tam_poblacion prob_cruce prob_mut SEED
-        #if len(sys.argv) >= 7:
-        #    archivo = sys.argv[1]  # INSTANCE (nombre del archivo de instancia)
-        #    generaciones = int(sys.argv[2])
-        #    tam_poblacion = int(sys.argv[3])
-        #    prob_cruce = float(sys.argv[4])
-        #    prob_mut = float(sys.argv[5])
-        #    seed = int(sys.argv[6])  # Semilla para reproducibilidad
-        #    random.seed(seed)
-        #    np.random.seed(seed)
+# Instancias ya cargadas en este proceso, por ruta, para no releerlas en corridas por lote
+_INSTANCIAS = {}
+
+def cargar_instancia(archivo):
+    """Carga la instancia (CSR, con cache binaria) una sola vez por proceso"""
+    if archivo not in _INSTANCIAS:
+        _INSTANCIAS[archivo] = ins.cargar_instancia(archivo)
+    return _INSTANCIAS[archivo]
+
+def algoritmo_genetico_mejorado(archivo=None, generaciones=100, tam_poblacion=50, prob_cruce=0.8, prob_mut=0.1,
+                                semilla=None, instancia=None):
+    """Función wrapper para compatibilidad con target-runner.py; recibe la ruta o la instancia ya cargada"""
+    if instancia is None:
+        instancia = cargar_instancia(archivo)
     
     ag = AlgoritmoGenetico(
-        archivo=archivo,
+        instancia,
         generaciones=generaciones,
         tam_poblacion=tam_poblacion,
         prob_cruce=prob_cruce,
-        prob_mut=prob_mut
+        prob_mut=prob_mut,
+        semilla=semilla
     )
     return ag.ejecutar()
 
-if __name__ == "__main__":
-    # Si se ejecuta desde target-runner.py, solo imprime el fitness
-    if len(sys.argv) > 1:
-        resultado = algoritmo_genetico_mejorado()
+def leer_corrida(campos):
+    """Convierte [INSTANCE, generaciones, tam_poblacion, prob_cruce, prob_mut, SEED] en argumentos del wrapper"""
+    archivo, generaciones, tam_poblacion, prob_cruce, prob_mut, semilla = campos
+    return {
+        'archivo': archivo,
+        'generaciones': int(generaciones),
+        'tam_poblacion': int(tam_poblacion),
+        'prob_cruce': float(prob_cruce),
+        'prob_mut': float(prob_mut),
+        'semilla': int(semilla)
+    }
+
+def imprimir_solucion(resultado, instancia):
+    print("\nMejor solución encontrada:")
+    print(f"Órdenes seleccionadas: {resultado['ordenes']}")
+    print(f"Número de órdenes: {resultado['num_ordenes']}")
+    print(f"Unidades totales: {resultado['unidades']} (LB={instancia.LB}, UB={instancia.UB})")
+    print(f"Ítems únicos recogidos: {resultado['items_unicos']}")
+    print(f"Pasillos visitados: {resultado['pasillos']}")
+    print(f"Fitness (Ítems/Pasillos): {resultado['fitness']:.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="GGA3. Formato de target-runner: INSTANCE generaciones tam_poblacion prob_cruce prob_mut SEED")
+    parser.add_argument("corrida", nargs="*", help="INSTANCE generaciones tam_poblacion prob_cruce prob_mut SEED")
+    parser.add_argument("--lote", type=str, default=None,
+                        help="archivo con una corrida por renglón en el formato de target-runner")
+    parser.add_argument("--detalle", action="store_true", help="imprime también la mejor solución")
+    args = parser.parse_args()
+
+    if args.lote is None and len(args.corrida) != 6:
+        parser.error("se requiere una corrida (6 argumentos) o --lote")
+
+    if args.lote is None:
+        # Una corrida (target-runner): la primera línea es solo el fitness
+        corrida = leer_corrida(args.corrida)
+        resultado = algoritmo_genetico_mejorado(**corrida)
         print(resultado['fitness'])
-        print("\nMejor solución encontrada:")
-        print(f"Órdenes seleccionadas: {resultado['selected_orders']}")
-        print(f"Número de órdenes: {resultado['num_orders']}")
-        print(f"Unidades totales: {resultado['total_units']} (LB={resultado['LB']}, UB={resultado['UB']})")
-        print(f"Ítems únicos recogidos: {resultado['unique_items']}")
-        print(f"Pasillos visitados: {resultado['visited_aisles']}")
-        print(f"Fitness (Ítems/Pasillos): {resultado['fitness']:.2f}")
-        
-    else:
-        # Ejemplo de ejecución directa (modo normal)
-        resultado = algoritmo_genetico_mejorado(
-            generaciones=100,
-            tam_poblacion=50,
-            prob_cruce=0.8,
-            prob_mut=0.1
-        )
-        
-        print("\nMejor solución encontrada:")
-        print(f"Órdenes seleccionadas: {resultado['selected_orders']}")
-        print(f"Número de órdenes: {resultado['num_orders']}")
-        print(f"Unidades totales: {resultado['total_units']} (LB={resultado['LB']}, UB={resultado['UB']})")
-        print(f"Ítems únicos recogidos: {resultado['unique_items']}")
-        print(f"Pasillos visitados: {resultado['visited_aisles']}")
-        print(f"Fitness (Ítems/Pasillos): {resultado['fitness']:.2f}")
+        if args.detalle:
+            imprimir_solucion(resultado, cargar_instancia(corrida['archivo']))
+        return
+
+    # Varias corridas en el mismo proceso: una línea "INSTANCE SEED fitness" por corrida
+    with open(args.lote) as f:
+        for linea in f:
+            campos = linea.split()
+            if not campos or campos[0].startswith("#"):
+                continue
+            corrida = leer_corrida(campos)
+            resultado = algoritmo_genetico_mejorado(**corrida)
+            print(corrida['archivo'], corrida['semilla'], resultado['fitness'], flush=True)
+            if args.detalle:
+                imprimir_solucion(resultado, cargar_instancia(corrida['archivo']))
+
+if __name__ == "__main__":
+    main()
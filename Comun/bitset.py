@@ -0,0 +1,121 @@
+"""
+Conjuntos de órdenes, ítems o pasillos como bits empaquetados en palabras uint64.
+
+Un conjunto sobre el universo {0, ..., n-1} se guarda en palabras(n) enteros uint64:
+el elemento e es el bit e % 64 de la palabra e // 64. Una población de conjuntos es
+una matriz (individuos, palabras), de modo que la unión, la diferencia y el conteo
+de elementos de todos los individuos se hacen con una sola operación de NumPy.
+
+Es la representación canónica de conjuntos de ambos GA: dos selecciones con los
+mismos elementos tienen exactamente los mismos bytes, sin importar el orden en que
+se listaron.
+"""
+import numpy as np
+
+BITS = 64
+
+if hasattr(np, "bitwise_count"):
+    def _conteo_palabras(palabras):
+        return np.bitwise_count(palabras)
+else:
+    _CONTEO_BYTE = np.array([bin(b).count("1") for b in range(256)], dtype=np.uint8)
+
+    def _conteo_palabras(palabras):
+        bytes_ = palabras.view(np.uint8).reshape(palabras.shape + (8,))
+        return _CONTEO_BYTE[bytes_].sum(axis=-1, dtype=np.uint8)
+
+
+def palabras(n):
+    """Número de palabras uint64 para un universo de n elementos."""
+    return max((n + BITS - 1) // BITS, 1)
+
+
+def vacio(n, filas=None):
+    """Conjunto vacío (o matriz de `filas` conjuntos vacíos) sobre n elementos."""
+    forma = palabras(n) if filas is None else (filas, palabras(n))
+    return np.zeros(forma, dtype=np.uint64)
+
+
+def desde_indices(indices, n):
+    """Conjunto con los elementos de `indices` (se ignoran repetidos)."""
+    indices = np.asarray(indices, dtype=np.int64)
+    bits = vacio(n)
+    np.bitwise_or.at(bits, indices // BITS, np.left_shift(np.uint64(1), (indices % BITS).astype(np.uint64)))
+    return bits
+
+
+def desde_matriz(matriz, largos, n):
+    """
+    Un conjunto por renglón de una matriz de índices rellena (p. ej. Poblacion.ordenes).
+
+    Parámetros:
+    - matriz: (filas, ancho) con los elementos de cada renglón al inicio.
+    - largos: número de elementos válidos de cada renglón.
+    - n: tamaño del universo.
+    """
+    matriz = np.asarray(matriz, dtype=np.int64)
+    filas = np.repeat(np.arange(matriz.shape[0]), largos)
+    valores = matriz[np.arange(matriz.shape[1])[None, :] < np.asarray(largos)[:, None]]
+    bits = vacio(n, matriz.shape[0])
+    np.bitwise_or.at(bits, (filas, valores // BITS), np.left_shift(np.uint64(1), (valores % BITS).astype(np.uint64)))
+    return bits
+
+
+def desde_pares(filas, elementos, n_filas, n):
+    """
+    Matriz de n_filas conjuntos a partir de pares (fila, elemento), por ejemplo
+    (MatrizCSR.ids_filas(), MatrizCSR.indices).
+    """
+    filas = np.asarray(filas, dtype=np.int64)
+    elementos = np.asarray(elementos, dtype=np.int64)
+    bits = vacio(n, n_filas)
+    np.bitwise_or.at(bits, (filas, elementos // BITS), np.left_shift(np.uint64(1), (elementos % BITS).astype(np.uint64)))
+    return bits
+
+
+def desde_listas(listas, n):
+    """Un conjunto por lista de índices."""
+    bits = vacio(n, len(listas))
+    for k, indices in enumerate(listas):
+        bits[k] = desde_indices(indices, n)
+    return bits
+
+
+def a_indices(bits):
+    """Elementos del conjunto en orden creciente."""
+    desempacados = np.unpackbits(np.ascontiguousarray(bits).view(np.uint8), bitorder="little")
+    return np.flatnonzero(desempacados)
+
+
+def contiene(bits, elementos):
+    """Arreglo booleano: si cada uno de `elementos` está en el conjunto."""
+    elementos = np.asarray(elementos, dtype=np.int64)
+    return (np.right_shift(bits[elementos // BITS], (elementos % BITS).astype(np.uint64)) & np.uint64(1)).astype(bool)
+
+
+def union(a, b):
+    return np.bitwise_or(a, b)
+
+
+def interseccion(a, b):
+    return np.bitwise_and(a, b)
+
+
+def diferencia(a, b):
+    """Elementos de a que no están en b."""
+    return np.bitwise_and(a, np.invert(b))
+
+
+def union_filas(matriz):
+    """Unión de todos los conjuntos (renglones) de una matriz."""
+    return np.bitwise_or.reduce(matriz, axis=0)
+
+
+def conteo(bits):
+    """Número de elementos de cada conjunto (sobre la última dimensión)."""
+    return _conteo_palabras(bits).sum(axis=-1, dtype=np.int64)
+
+
+def subconjunto(a, b):
+    """Si a está contenido en b (por renglón si son matrices)."""
+    return ~np.any(diferencia(a, b), axis=-1)
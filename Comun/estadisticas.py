@@ -0,0 +1,102 @@
+"""
+Tabla de estadísticas por orden y por pasillo, calculada una vez por instancia.
+
+Todos los solvers usan los mismos agregados (unidades de cada orden, ítems distintos,
+stock de cada pasillo...). Se calculan al compilar la instancia y se guardan en su
+directorio de cache como columnas .npy, así que las heurísticas de inicialización y
+los modelos las leen en lugar de volver a derivarlas.
+
+Columnas:
+- ordenes: unidades, items (ítems distintos), min_pasillos (cota inferior de pasillos
+  necesarios para surtir la orden sola; A + 1 si el stock total no alcanza).
+- pasillos: stock (unidades totales), items (ítems distintos).
+"""
+import os
+
+import numpy as np
+
+COLUMNAS_ORDENES = ("unidades", "items", "min_pasillos")
+COLUMNAS_PASILLOS = ("stock", "items")
+
+
+def min_pasillos_por_orden(ordenes, pasillos):
+    """
+    Cota inferior del número de pasillos que necesita cada orden.
+
+    Para cada ítem de la orden se cuentan cuántos pasillos hacen falta si se toman los de
+    mayor stock de ese ítem primero; la orden necesita al menos el máximo sobre sus ítems.
+
+    Parámetros:
+    - ordenes, pasillos: MatrizCSR de órdenes y de pasillos (renglones x ítems).
+
+    Retorna:
+    - Arreglo con la cota de cada orden (A + 1 si algún ítem no alcanza con todo el stock).
+    """
+    num_pasillos = pasillos.forma[0]
+    por_item = pasillos.transpuesta()
+    items = por_item.ids_filas().astype(np.int64)
+    stock = por_item.data.astype(np.int64)
+
+    # Stock de cada ítem ordenado de mayor a menor y acumulado dentro del ítem
+    orden = np.lexsort((-stock, items))
+    acumulado = np.cumsum(stock[orden])
+    inicios = por_item.indptr[:-1].astype(np.int64)
+    previo = np.concatenate(([0], acumulado))[inicios]
+    acumulado = acumulado - np.repeat(previo, por_item.largos())
+
+    # Búsqueda del primer acumulado >= cantidad dentro del bloque de cada ítem
+    escala = int(acumulado.max(initial=0)) + 1
+    claves = items[orden] * escala + acumulado
+    pedidos = ordenes.indices.astype(np.int64)
+    cantidades = ordenes.data.astype(np.int64)
+    necesarios = np.searchsorted(claves, pedidos * escala + cantidades, side="left") - inicios[pedidos] + 1
+    necesarios = np.where(necesarios > por_item.largos()[pedidos], num_pasillos + 1, necesarios)
+
+    cota = np.zeros(ordenes.forma[0], dtype=np.int64)
+    np.maximum.at(cota, ordenes.ids_filas(), necesarios)
+    return cota
+
+
+class Estadisticas:
+    """
+    Tabla columnar de estadísticas de una instancia.
+
+    Atributos:
+    - ordenes: diccionario {columna: arreglo de tamaño O} (ver COLUMNAS_ORDENES).
+    - pasillos: diccionario {columna: arreglo de tamaño A} (ver COLUMNAS_PASILLOS).
+    """
+
+    def __init__(self, ordenes, pasillos):
+        self.ordenes = ordenes
+        self.pasillos = pasillos
+
+    @classmethod
+    def calcular(cls, instancia):
+        """Calcula todas las columnas a partir de las matrices CSR de la instancia."""
+        ordenes = {
+            "unidades": instancia.ordenes.sumas_filas(),
+            "items": instancia.ordenes.largos().astype(np.int64),
+            "min_pasillos": min_pasillos_por_orden(instancia.ordenes, instancia.pasillos),
+        }
+        pasillos = {
+            "stock": instancia.pasillos.sumas_filas(),
+            "items": instancia.pasillos.largos().astype(np.int64),
+        }
+        return cls(ordenes, pasillos)
+
+    def guardar(self, directorio):
+        """Escribe una columna .npy por estadística en el directorio de cache."""
+        for tabla, columnas in (("ordenes", self.ordenes), ("pasillos", self.pasillos)):
+            for columna, valores in columnas.items():
+                np.save(os.path.join(directorio, f"estadisticas_{tabla}_{columna}.npy"), valores)
+
+    @classmethod
+    def abrir(cls, directorio):
+        """Abre las columnas guardadas con memoria mapeada; None si faltan."""
+        try:
+            tablas = [{columna: np.load(os.path.join(directorio, f"estadisticas_{tabla}_{columna}.npy"), mmap_mode="r")
+                       for columna in columnas}
+                      for tabla, columnas in (("ordenes", COLUMNAS_ORDENES), ("pasillos", COLUMNAS_PASILLOS))]
+        except OSError:
+            return None
+        return cls(*tablas)
@@ -0,0 +1,398 @@
+"""
+Lectura única de instancias del challenge de waves, compartida por todos los solvers.
+
+El archivo se recorre línea por línea y las órdenes y los pasillos se guardan en
+formato CSR (indptr/indices/data) con tipos enteros compactos, de modo que ya no
+es necesario construir matrices densas de órdenes x ítems para leer una instancia.
+
+Formato del archivo:
+- primera línea: O I A
+- O líneas de órdenes: k item_1 cant_1 ... item_k cant_k
+- A líneas de pasillos con el mismo formato
+- última línea: LB UB
+
+Como las mismas instancias se resuelven miles de veces, cargar_instancia compila
+cada archivo una sola vez a un directorio binario (<instancia>.cache) con los
+arreglos CSR en .npy y una cabecera JSON; las siguientes cargas abren los arreglos
+con memoria mapeada, así que el arranque es casi inmediato y varios procesos
+comparten las mismas páginas físicas. La misma cache guarda la tabla de
+estadísticas por orden y por pasillo (ver estadisticas.py).
+"""
+import array
+import json
+import os
+import tempfile
+import numpy as np
+
+from estadisticas import Estadisticas
+
+VERSION_CACHE = 2
+_ARREGLOS = ("indptr", "indices", "data")
+
+
+def _tipo_minimo(valor_maximo, con_signo=False):
+    """
+    Devuelve el tipo entero más pequeño capaz de guardar valor_maximo.
+
+    Parámetros:
+    - valor_maximo: mayor valor que se debe poder representar.
+    - con_signo: si se requiere un tipo con signo (por ejemplo para índices).
+    """
+    tipos = (np.int8, np.int16, np.int32, np.int64) if con_signo else (np.uint8, np.uint16, np.uint32, np.uint64)
+    for tipo in tipos:
+        if valor_maximo <= np.iinfo(tipo).max:
+            return tipo
+    return tipos[-1]
+
+
+class MatrizCSR:
+    """
+    Matriz dispersa por renglones; cada renglón es una orden o un pasillo y cada columna un ítem.
+
+    Atributos:
+    - indptr: arreglo de tamaño n_filas+1; el renglón r ocupa indices/data[indptr[r]:indptr[r+1]].
+    - indices: ítems con cantidad distinta de cero.
+    - data: cantidades correspondientes.
+    - forma: tupla (n_filas, n_columnas).
+
+    Las sumas se acumulan siempre en int64 para no desbordar los tipos compactos.
+    """
+
+    def __init__(self, indptr, indices, data, forma):
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.forma = (int(forma[0]), int(forma[1]))
+
+    @classmethod
+    def desde_densa(cls, matriz):
+        """MatrizCSR a partir de una matriz densa (lista de listas o arreglo) de renglones x ítems."""
+        matriz = np.asarray(matriz)
+        filas, columnas = np.nonzero(matriz)
+        data = matriz[filas, columnas].astype(np.int64)
+        indptr = np.zeros(matriz.shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(filas, minlength=matriz.shape[0]), out=indptr[1:])
+        return cls(indptr.astype(_tipo_minimo(len(data), True)), columnas.astype(_tipo_minimo(matriz.shape[1], True)),
+                   data.astype(_tipo_minimo(int(data.max()) if len(data) else 0)), matriz.shape)
+
+    @property
+    def nnz(self):
+        return int(self.indptr[-1])
+
+    def fila(self, r):
+        """Regresa (items, cantidades) del renglón r sin copiar memoria."""
+        ini, fin = self.indptr[r], self.indptr[r + 1]
+        return self.indices[ini:fin], self.data[ini:fin]
+
+    def largos(self):
+        """Número de ítems distintos en cada renglón."""
+        return np.diff(self.indptr)
+
+    def ids_filas(self):
+        """Renglón al que pertenece cada entrada de data (útil para operaciones vectorizadas)."""
+        return np.repeat(np.arange(self.forma[0], dtype=_tipo_minimo(self.forma[0], True)), self.largos())
+
+    def sumas_filas(self):
+        """Total de unidades por renglón."""
+        acumulado = np.zeros(self.nnz + 1, dtype=np.int64)
+        np.cumsum(self.data, dtype=np.int64, out=acumulado[1:])
+        return acumulado[self.indptr[1:]] - acumulado[self.indptr[:-1]]
+
+    def sumas_columnas(self):
+        """Total de unidades por ítem sumando todos los renglones."""
+        return np.bincount(self.indices, weights=self.data, minlength=self.forma[1]).astype(np.int64)
+
+    def posiciones(self, filas):
+        """Posiciones en indices/data de todas las entradas de los renglones indicados."""
+        filas = np.asarray(filas, dtype=np.int64)
+        inicios = self.indptr[filas].astype(np.int64)
+        largos = self.indptr[filas + 1].astype(np.int64) - inicios
+        total = int(largos.sum())
+        if total == 0:
+            return np.zeros(0, dtype=np.int64)
+        desplazamientos = np.repeat(inicios - np.concatenate(([0], np.cumsum(largos)[:-1])), largos)
+        return desplazamientos + np.arange(total, dtype=np.int64)
+
+    def suma_filas(self, filas):
+        """
+        Suma los renglones indicados (con repetición) en un vector denso de ítems.
+
+        Es la demanda agregada de un conjunto de órdenes o el stock de un conjunto de pasillos.
+        """
+        pos = self.posiciones(filas)
+        return np.bincount(self.indices[pos], weights=self.data[pos], minlength=self.forma[1]).astype(np.int64)
+
+    def producto(self, vector):
+        """Producto matriz-vector M @ vector con el vector indexado por columnas."""
+        vector = np.asarray(vector)
+        acumulado = np.zeros(self.nnz + 1, dtype=np.result_type(vector.dtype, np.int64))
+        np.cumsum(self.data * vector[self.indices], out=acumulado[1:])
+        return acumulado[self.indptr[1:]] - acumulado[self.indptr[:-1]]
+
+    def submatriz(self, filas, columnas=None):
+        """
+        Matriz con los renglones `filas` (en ese orden) y, si se indican, solo las `columnas`.
+
+        Las columnas conservadas se renumeran 0..len(columnas)-1 en el orden dado.
+        """
+        filas = np.asarray(filas, dtype=np.int64)
+        pos = self.posiciones(filas)
+        ids = np.repeat(np.arange(len(filas)), self.indptr[filas + 1].astype(np.int64) - self.indptr[filas])
+        indices, data, n_columnas = self.indices[pos].astype(np.int64), self.data[pos], self.forma[1]
+        if columnas is not None:
+            nuevas = np.full(self.forma[1], -1, dtype=np.int64)
+            nuevas[np.asarray(columnas, dtype=np.int64)] = np.arange(len(columnas))
+            indices = nuevas[indices]
+            conservar = indices >= 0
+            indices, data, ids = indices[conservar], data[conservar], ids[conservar]
+            n_columnas = len(columnas)
+        indptr = np.zeros(len(filas) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(ids, minlength=len(filas)), out=indptr[1:])
+        return MatrizCSR(indptr.astype(_tipo_minimo(len(data), True)), indices.astype(_tipo_minimo(n_columnas, True)),
+                         np.ascontiguousarray(data), (len(filas), n_columnas))
+
+    def transpuesta(self):
+        """Matriz transpuesta en CSR (por ejemplo ítem -> pasillos)."""
+        orden = np.argsort(self.indices, kind="stable")
+        conteos = np.bincount(self.indices, minlength=self.forma[1])
+        indptr = np.zeros(self.forma[1] + 1, dtype=np.int64)
+        np.cumsum(conteos, out=indptr[1:])
+        indices = self.ids_filas()[orden]
+        return MatrizCSR(indptr.astype(self.indptr.dtype), indices, self.data[orden], (self.forma[1], self.forma[0]))
+
+    def densa(self, dtype=np.int32):
+        """Matriz densa; solo para instancias pequeñas o código que aún no usa CSR."""
+        matriz = np.zeros(self.forma, dtype=dtype)
+        matriz[self.ids_filas(), self.indices] = self.data
+        return matriz
+
+    def a_diccionarios(self):
+        """Lista de diccionarios {item_id: cantidad}, uno por renglón."""
+        indices, data = self.indices.tolist(), self.data.tolist()
+        indptr = self.indptr.tolist()
+        return [dict(zip(indices[indptr[r]:indptr[r + 1]], data[indptr[r]:indptr[r + 1]]))
+                for r in range(self.forma[0])]
+
+
+class Instancia:
+    """
+    Instancia del problema de selección de waves.
+
+    Atributos:
+    - O, I, A: número de órdenes, ítems y pasillos.
+    - LB, UB: límites inferior y superior de unidades en la wave.
+    - ordenes: MatrizCSR de O x I con las cantidades pedidas.
+    - pasillos: MatrizCSR de A x I con el stock de cada pasillo.
+    - archivo: ruta de la que se leyó la instancia (si aplica).
+    - estadisticas(): tabla estadisticas.Estadisticas de la instancia.
+    """
+
+    def __init__(self, O, I, A, LB, UB, ordenes, pasillos, archivo=None, estadisticas=None):
+        self.O, self.I, self.A = int(O), int(I), int(A)
+        self.LB, self.UB = int(LB), int(UB)
+        self.ordenes = ordenes
+        self.pasillos = pasillos
+        self.archivo = archivo
+        self._estadisticas = estadisticas
+
+    def estadisticas(self) -> Estadisticas:
+        """Tabla de estadísticas por orden y por pasillo (de la cache o calculada la primera vez)."""
+        if self._estadisticas is None:
+            self._estadisticas = Estadisticas.calcular(self)
+        return self._estadisticas
+
+    @property
+    def general(self):
+        """Parámetros globales en el formato histórico [ordenes, items, pasillos, wave_lower, wave_upper]."""
+        return [self.O, self.I, self.A, self.LB, self.UB]
+
+    def a_diccionarios(self):
+        """Formato de funciones_entero: (general, ordenes_list, pasillos_list) con diccionarios dispersos."""
+        return self.general, self.ordenes.a_diccionarios(), self.pasillos.a_diccionarios()
+
+    def a_densa(self, dtype=np.int32):
+        """Formato denso (general, matriz_ordenes, matriz_pasillos); evitar en instancias grandes."""
+        return self.general, self.ordenes.densa(dtype), self.pasillos.densa(dtype)
+
+
+def _leer_bloque(lineas, n_filas, n_columnas):
+    """Lee n_filas renglones 'k item cant ...' del iterador de líneas y arma una MatrizCSR."""
+    indptr = array.array("q", [0])
+    indices = array.array("q")
+    data = array.array("q")
+
+    for _ in range(n_filas):
+        valores = next(lineas).split()
+        indices.extend(map(int, valores[1::2]))
+        data.extend(map(int, valores[2::2]))
+        indptr.append(len(indices))
+
+    indices = np.frombuffer(indices, dtype=np.int64)
+    data = np.frombuffer(data, dtype=np.int64)
+    max_dato = int(data.max()) if len(data) else 0
+
+    return MatrizCSR(
+        np.frombuffer(indptr, dtype=np.int64).astype(_tipo_minimo(len(indices), True)),
+        indices.astype(_tipo_minimo(n_columnas, True)),
+        data.astype(_tipo_minimo(max_dato)),
+        (n_filas, n_columnas),
+    )
+
+
+def leer_instancia(archivo: str) -> Instancia:
+    """
+    Lee una instancia en streaming y la guarda en matrices CSR compactas.
+
+    Parámetros:
+    - archivo: ruta al archivo de texto de la instancia.
+
+    Retorna:
+    - Instancia con órdenes y pasillos en formato CSR.
+    """
+    with open(archivo) as info:
+        lineas = (linea for linea in info if linea.strip())
+
+        O, I, A = map(int, next(lineas).split()[:3])
+        ordenes = _leer_bloque(lineas, O, I)
+        pasillos = _leer_bloque(lineas, A, I)
+        LB, UB = map(int, next(lineas).split()[:2])
+
+    return Instancia(O, I, A, LB, UB, ordenes, pasillos, archivo=archivo)
+
+
+def ruta_cache(archivo: str) -> str:
+    """Directorio binario asociado a una instancia de texto."""
+    return os.path.splitext(archivo)[0] + ".cache"
+
+
+def _firma_fuente(archivo):
+    """Tamaño y fecha de modificación del archivo de texto, para invalidar la cache."""
+    info = os.stat(archivo)
+    return {"tamano_fuente": info.st_size, "mtime_fuente": info.st_mtime_ns}
+
+
+def compilar_instancia(archivo: str, destino: str = None) -> str:
+    """
+    Compila una instancia de texto al formato binario de cache.
+
+    Parámetros:
+    - archivo: ruta al archivo de texto de la instancia.
+    - destino: directorio de salida; por defecto ruta_cache(archivo).
+
+    Retorna:
+    - Ruta del directorio generado.
+    """
+    destino = destino or ruta_cache(archivo)
+    instancia = leer_instancia(archivo)
+
+    cabecera = {"version": VERSION_CACHE, "O": instancia.O, "I": instancia.I, "A": instancia.A,
+                "LB": instancia.LB, "UB": instancia.UB}
+    cabecera.update(_firma_fuente(archivo))
+
+    # Se escribe en un directorio temporal y se renombra al final, para que otros
+    # procesos nunca vean una cache a medio escribir
+    padre = os.path.dirname(os.path.abspath(destino))
+    temporal = tempfile.mkdtemp(prefix=".compilando_", dir=padre)
+    for nombre, matriz in (("ordenes", instancia.ordenes), ("pasillos", instancia.pasillos)):
+        for arreglo in _ARREGLOS:
+            np.save(os.path.join(temporal, f"{nombre}_{arreglo}.npy"), getattr(matriz, arreglo))
+    instancia.estadisticas().guardar(temporal)
+    with open(os.path.join(temporal, "cabecera.json"), "w") as f:
+        json.dump(cabecera, f)
+
+    try:
+        os.replace(temporal, destino)
+    except OSError:
+        # Otro proceso ya dejó una cache en destino; se reemplaza la anterior
+        _borrar_directorio(destino)
+        os.replace(temporal, destino)
+
+    return destino
+
+
+def _borrar_directorio(directorio):
+    if os.path.isdir(directorio):
+        for nombre in os.listdir(directorio):
+            os.remove(os.path.join(directorio, nombre))
+        os.rmdir(directorio)
+
+
+def _leer_cabecera(directorio):
+    try:
+        with open(os.path.join(directorio, "cabecera.json")) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def abrir_cache(directorio: str, archivo: str = None) -> Instancia:
+    """
+    Abre una instancia compilada con memoria mapeada (solo lectura).
+
+    Parámetros:
+    - directorio: directorio generado por compilar_instancia.
+    - archivo: ruta de la instancia de texto original, solo informativa.
+    """
+    cabecera = _leer_cabecera(directorio)
+    if cabecera is None:
+        raise FileNotFoundError(f"No hay una instancia compilada en {directorio}")
+
+    matrices = {}
+    for nombre, filas in (("ordenes", cabecera["O"]), ("pasillos", cabecera["A"])):
+        arreglos = [np.load(os.path.join(directorio, f"{nombre}_{arreglo}.npy"), mmap_mode="r")
+                    for arreglo in _ARREGLOS]
+        matrices[nombre] = MatrizCSR(*arreglos, (filas, cabecera["I"]))
+
+    return Instancia(cabecera["O"], cabecera["I"], cabecera["A"], cabecera["LB"], cabecera["UB"],
+                     matrices["ordenes"], matrices["pasillos"], archivo=archivo or directorio,
+                     estadisticas=Estadisticas.abrir(directorio))
+
+
+def cache_vigente(archivo: str) -> bool:
+    """Indica si la cache binaria de archivo existe y corresponde a la versión actual del texto."""
+    cabecera = _leer_cabecera(ruta_cache(archivo))
+    if cabecera is None or cabecera.get("version") != VERSION_CACHE:
+        return False
+    firma = _firma_fuente(archivo)
+    return all(cabecera.get(clave) == valor for clave, valor in firma.items())
+
+
+def cargar_instancia(archivo: str, usar_cache: bool = True) -> Instancia:
+    """
+    Carga una instancia usando la cache binaria, compilándola la primera vez.
+
+    Parámetros:
+    - archivo: ruta al archivo de texto de la instancia o a un directorio de cache.
+    - usar_cache: si es False se lee siempre el texto (sin escribir nada en disco).
+
+    Retorna:
+    - Instancia con las matrices CSR (memoria mapeada si viene de la cache).
+    """
+    if os.path.isdir(archivo):
+        return abrir_cache(archivo)
+    if not usar_cache:
+        return leer_instancia(archivo)
+
+    if not cache_vigente(archivo):
+        try:
+            compilar_instancia(archivo)
+        except OSError:
+            # Sin permisos de escritura junto a la instancia: se usa la lectura de texto
+            return leer_instancia(archivo)
+
+    return abrir_cache(ruta_cache(archivo), archivo=archivo)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compila instancias de texto al formato binario de cache.")
+    parser.add_argument("instancias", nargs="+", type=str)
+    parser.add_argument("--forzar", action="store_true", help="recompila aunque la cache esté vigente")
+    args = parser.parse_args()
+
+    for archivo in args.instancias:
+        if args.forzar or not cache_vigente(archivo):
+            print(f"{archivo} -> {compilar_instancia(archivo)}")
+        else:
+            print(f"{archivo}: cache vigente en {ruta_cache(archivo)}")
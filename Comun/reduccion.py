@@ -0,0 +1,149 @@
+"""
+Reducción de una instancia antes de resolverla, compartida por el GA y los modelos.
+
+Las reglas se aplican una vez, en este orden, y solo quitan elementos que no pueden
+aparecer en una wave factible o que no cambian el valor óptimo:
+
+- ordenes_sin_stock: órdenes que piden de algún ítem más de lo que hay en todos los
+  pasillos juntos.
+- ordenes_sobre_UB: órdenes con más unidades que UB.
+- items_sin_demanda: ítems que ninguna de las órdenes restantes pide.
+- pasillos_dominados: pasillo a cuando otro pasillo b tiene, de cada ítem que ofrece a,
+  al menos min(demanda total del ítem, UB) unidades. Cualquier wave que use a sigue
+  siendo factible cambiando a por b (o quitando a si b ya está), con los mismos o menos
+  pasillos. Incluye los pasillos sin ítems demandados. Entre pasillos que se dominan
+  mutuamente se conserva el de menor índice. Dos pasillos con el mismo contenido que no
+  cubren la demanda no se quitan: su stock se suma.
+
+La instancia reducida numera órdenes, ítems y pasillos desde 0; Reduccion guarda el ID
+original de cada uno para traducir las soluciones.
+"""
+import numpy as np
+
+import bitset as bs
+from instancia import Instancia
+
+REGLAS = ("ordenes_sin_stock", "ordenes_sobre_UB", "items_sin_demanda", "pasillos_dominados")
+
+
+def _ordenes_sin_stock(instancia):
+    """Máscara de órdenes con algún ítem cuya demanda supera el stock total."""
+    stock = instancia.pasillos.sumas_columnas()
+    faltante = instancia.ordenes.data > stock[instancia.ordenes.indices]
+    return np.bincount(instancia.ordenes.ids_filas(), weights=faltante, minlength=instancia.O) > 0
+
+
+def _pasillos_dominados(instancia):
+    """
+    Máscara de pasillos dominados (ver el docstring del módulo).
+
+    Para cada pasillo se arman dos conjuntos de ítems: los que ofrece y los que cubre
+    (stock >= min(demanda total, UB)); a está dominado por b si lo que ofrece a está
+    contenido en lo que cubre b.
+    """
+    pasillos = instancia.pasillos
+    tope = np.minimum(instancia.ordenes.sumas_columnas(), instancia.UB)
+    filas, items = pasillos.ids_filas(), pasillos.indices
+    ofrece = bs.desde_pares(filas, items, instancia.A, instancia.I)
+    cubre_entrada = pasillos.data.astype(np.int64) >= tope[items]
+    cubre = bs.desde_pares(filas[cubre_entrada], items[cubre_entrada], instancia.A, instancia.I)
+
+    # domina[b, a]: b cubre todo lo que ofrece a
+    domina = np.stack([bs.subconjunto(ofrece[a], cubre) for a in range(instancia.A)], axis=1)
+    np.fill_diagonal(domina, False)
+    indices = np.arange(instancia.A)
+    # Dominación mutua: solo el de menor índice quita al otro
+    mutua = domina & domina.T & (indices[None, :] < indices[:, None])
+    return np.any(domina & ~mutua, axis=0)
+
+
+def _traducir(conservados, originales):
+    """Posición en `conservados` (ordenado) de cada ID original que sigue en la instancia."""
+    originales = np.asarray(originales, dtype=np.int64)
+    return np.searchsorted(conservados, originales[np.isin(originales, conservados)]).tolist()
+
+
+class Reduccion:
+    """
+    Resultado de reducir una instancia.
+
+    Atributos:
+    - instancia: instancia reducida.
+    - original: instancia original.
+    - ordenes, items, pasillos: ID original de cada orden, ítem y pasillo reducido.
+    - registro: lista de diccionarios {regla, O, I, A} con el tamaño tras cada regla.
+    """
+
+    def __init__(self, instancia, original, ordenes, items, pasillos, registro):
+        self.instancia = instancia
+        self.original = original
+        self.ordenes = ordenes
+        self.items = items
+        self.pasillos = pasillos
+        self.registro = registro
+
+    def ordenes_originales(self, ordenes):
+        """IDs originales de órdenes de la instancia reducida."""
+        return self.ordenes[np.asarray(ordenes, dtype=np.int64)].tolist()
+
+    def pasillos_originales(self, pasillos):
+        """IDs originales de pasillos de la instancia reducida."""
+        return self.pasillos[np.asarray(pasillos, dtype=np.int64)].tolist()
+
+    def ordenes_reducidas(self, ordenes):
+        """IDs reducidos de órdenes originales; las órdenes quitadas se omiten."""
+        return _traducir(self.ordenes, ordenes)
+
+    def pasillos_reducidos(self, pasillos):
+        """IDs reducidos de pasillos originales; los pasillos quitados se omiten."""
+        return _traducir(self.pasillos, pasillos)
+
+    def resumen(self):
+        """Texto con cuánto redujo cada regla O, I y A."""
+        renglones = [f"original: O = {self.original.O}, I = {self.original.I}, A = {self.original.A}"]
+        anterior = {"O": self.original.O, "I": self.original.I, "A": self.original.A}
+        for paso in self.registro:
+            cambios = ", ".join(f"{clave} = {paso[clave]} (-{anterior[clave] - paso[clave]})" for clave in ("O", "I", "A"))
+            renglones.append(f"{paso['regla']}: {cambios}")
+            anterior = paso
+        return "\n".join(renglones)
+
+
+def reducir(instancia):
+    """
+    Aplica las reglas de REGLAS a la instancia.
+
+    Parámetros:
+    - instancia: instancia.Instancia.
+
+    Retorna:
+    - Reduccion con la instancia reducida y la traducción a IDs originales.
+    """
+    ordenes = np.arange(instancia.O)
+    items = np.arange(instancia.I)
+    pasillos = np.arange(instancia.A)
+    actual = instancia
+    registro = []
+
+    def _aplicar(regla, ordenes_nuevas, items_nuevos, pasillos_nuevos):
+        nonlocal ordenes, items, pasillos, actual
+        actual = Instancia(len(ordenes_nuevas), len(items_nuevos), len(pasillos_nuevos), actual.LB, actual.UB,
+                           actual.ordenes.submatriz(ordenes_nuevas, items_nuevos),
+                           actual.pasillos.submatriz(pasillos_nuevos, items_nuevos),
+                           archivo=instancia.archivo)
+        ordenes, items, pasillos = ordenes[ordenes_nuevas], items[items_nuevos], pasillos[pasillos_nuevos]
+        registro.append({"regla": regla, "O": actual.O, "I": actual.I, "A": actual.A})
+
+    todos_items, todos_pasillos = np.arange(actual.I), np.arange(actual.A)
+    _aplicar("ordenes_sin_stock", np.flatnonzero(~_ordenes_sin_stock(actual)), todos_items, todos_pasillos)
+
+    unidades = actual.ordenes.sumas_filas()
+    _aplicar("ordenes_sobre_UB", np.flatnonzero(unidades <= actual.UB), todos_items, todos_pasillos)
+
+    demandados = np.flatnonzero(actual.ordenes.sumas_columnas() > 0)
+    _aplicar("items_sin_demanda", np.arange(actual.O), demandados, np.arange(actual.A))
+
+    _aplicar("pasillos_dominados", np.arange(actual.O), np.arange(actual.I),
+             np.flatnonzero(~_pasillos_dominados(actual)))
+
+    return Reduccion(actual, instancia, ordenes, items, pasillos, registro)
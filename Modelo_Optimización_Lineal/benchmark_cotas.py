@@ -0,0 +1,73 @@
+"""
+Comparación del modelo de waves con M_big = sum_o B_o contra las cotas ajustadas de
+modelo_wave.cotas_variables.
+
+Para cada instancia se resuelve la propuesta elegida dos veces (sin y con cotas) y se
+registran los tiempos, los nodos procesados por CPLEX, el gap y el valor objetivo:
+
+    python benchmark_cotas.py --instancias ../datasets/a --propuesta 2 --tiempo 120 --salida cotas.csv
+"""
+import argparse
+import csv
+import os
+
+import modelo_wave as mw
+
+COLUMNAS = ("instancia", "cotas", "pasillos_min", "tiempo_construccion", "tiempo_resolucion",
+            "nodos", "gap", "estado", "objetivo")
+
+
+def comparar(archivo, opciones, tiempo_limite, workmem):
+    """
+    Resuelve una instancia sin y con cotas ajustadas.
+
+    Retorna:
+    - Lista con un renglón (diccionario con COLUMNAS) por variante.
+    """
+    renglones = []
+    for acotar in (False, True):
+        resultado = mw.resolver_instancia(archivo, tiempo_limite=tiempo_limite, workmem=workmem,
+                                          log_output=False, acotar=acotar, **opciones)
+        renglones.append({
+            "instancia": os.path.basename(archivo),
+            "cotas": acotar,
+            "pasillos_min": resultado["cotas"]["pasillos_min"] if acotar else 1,
+            "tiempo_construccion": resultado["tiempo_construccion"],
+            "tiempo_resolucion": resultado["tiempo_resolucion"],
+            "nodos": resultado["nodos"],
+            "gap": resultado["gap"],
+            "estado": resultado["estado"],
+            "objetivo": resultado["objetivo"],
+        })
+    return renglones
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Nodos y tiempos del modelo de waves sin y con cotas ajustadas")
+    parser.add_argument("--instancias", type=str,
+                        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "datasets", "a"),
+                        help="directorio con las instancias")
+    parser.add_argument("--propuesta", type=int, default=2, choices=sorted(mw.PROPUESTAS))
+    parser.add_argument("--tiempo", type=float, default=120, help="límite de tiempo por resolución en segundos")
+    parser.add_argument("--workmem", type=int, default=8192, help="memoria de trabajo de CPLEX en MB")
+    parser.add_argument("--salida", type=str, default=None, help="archivo CSV con los resultados")
+    args = parser.parse_args()
+
+    archivos = sorted(os.path.join(args.instancias, nombre) for nombre in os.listdir(args.instancias)
+                      if nombre.endswith(".txt"))
+    renglones = []
+    for archivo in archivos:
+        for renglon in comparar(archivo, mw.PROPUESTAS[args.propuesta], args.tiempo, args.workmem):
+            renglones.append(renglon)
+            print(f"{renglon['instancia']} cotas={renglon['cotas']!s:5} nodos={renglon['nodos']} "
+                  f"tiempo={renglon['tiempo_resolucion']:.2f} s gap={renglon['gap']} objetivo={renglon['objetivo']}")
+
+    if args.salida:
+        with open(args.salida, "w", newline="") as f:
+            escritor = csv.DictWriter(f, fieldnames=COLUMNAS)
+            escritor.writeheader()
+            escritor.writerows(renglones)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Wave inicial para los modelos de CPLEX a partir del GA de Algoritmo_Gen_Propuesta1.
+
+El GA encuentra waves factibles en pocos segundos; su mejor individuo se pasa a
+modelo_wave como MIP start (ver ModeloWave.agregar_inicio y la opción --ga).
+"""
+import os
+import sys
+
+# GA de la propuesta 1 (funciones_entero, controlador, ...)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Algoritmo_Gen_Propuesta1"))
+import controlador as ctl
+import funciones_entero as fn
+
+
+def mejor_wave(archivo, tiempo, mu=50, select="torneo.rep", pc=0.8, recom="un.punto", pm=0.05, reducir=False):
+    """
+    Corre el GA con presupuesto de tiempo y regresa su mejor wave.
+
+    Parámetros:
+    - archivo: ruta de la instancia.
+    - tiempo: segundos de la corrida del GA.
+    - mu, select, pc, recom, pm: parámetros del GA (ver 5_minutos.py).
+    - reducir: el GA trabaja sobre la instancia reducida (Comun/reduccion.py).
+
+    Retorna:
+    - (ordenes, pasillos) del mejor individuo, en IDs de la instancia original.
+    """
+    general, ordenes_list, pasillos_list = fn.lectura(archivo, reducir)
+    stock = fn.generar_stock(pasillos_list)
+    unidades_orden = fn.estadisticas(archivo, reducir).ordenes["unidades"].tolist()
+    selector = fn.SelectorPasillos(pasillos_list, general[1])
+
+    mejor, _ = ctl.ejecutar(general, ordenes_list, pasillos_list, stock, mu, select, pc, recom, pm,
+                            selector=selector, limite=tiempo, unidades_orden=unidades_orden)
+
+    ordenes, pasillos = [int(o) for o in mejor[0]], [int(a) for a in mejor[1]]
+    if reducir:
+        reduccion = fn.reduccion(archivo)
+        ordenes, pasillos = reduccion.ordenes_originales(ordenes), reduccion.pasillos_originales(pasillos)
+    return ordenes, pasillos
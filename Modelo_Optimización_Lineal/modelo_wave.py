@@ -0,0 +1,602 @@
+"""
+Construcción dispersa del modelo de waves de Mercado Libre para CPLEX (docplex).
+
+Las restricciones de inventario por ítem solo incluyen los coeficientes distintos de
+cero: para cada ítem se recorren únicamente las órdenes que lo piden y los pasillos
+que lo tienen (transpuestas CSR ítem -> órdenes e ítem -> pasillos), en lugar de
+todas las O órdenes y A pasillos de la matriz densa. Todas las familias de
+restricciones se agregan en bloque con add_constraints.
+
+Las cuatro propuestas de MPL_Mercado_Libre_Pro_*.py son combinaciones de opciones de
+este módulo (ver PROPUESTAS); la línea de comandos resuelve varias instancias en un
+mismo proceso:
+
+    python modelo_wave.py ../datasets/a/instance_0001.txt ../datasets/a/instance_0002.txt --propuesta 3
+
+Variables (formulación de Charnes-Cooper de la razón unidades / pasillos):
+- z_o = 1 si se completa la orden o; y_a = 1 si se visita el pasillo a.
+- t = 1 / (número de pasillos visitados); w_o = z_o * t; s_a = y_a * t.
+
+Por defecto los modelos usan cotas ajustadas (cotas_variables): t en [1/pasillos_max,
+1/pasillos_min], w y s acotadas por la cota de t y la M de la linealización igual a esa
+cota en lugar de M_big = sum_o B_o; las órdenes que no caben en ninguna wave se fijan
+en z_o = 0. benchmark_cotas.py compara ambas variantes.
+
+Como alternativa a la linealización con M_big, ModeloDinkelbach resuelve la razón con
+iteraciones de Dinkelbach sobre un solo modelo en z, y (opción --dinkelbach).
+
+Ambos modelos aceptan una wave inicial (agregar_inicio) como MIP start; con --ga el GA
+de Algoritmo_Gen_Propuesta1 corre unos segundos y su mejor individuo es el inicio.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+from docplex.mp.constants import EffortLevel
+from docplex.mp.model import Model
+from docplex.mp.solution import SolveSolution
+
+# Lector compartido de instancias (CSR), ubicado en la carpeta Comun del repositorio
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Comun"))
+import instancia as ins
+import reduccion as rd
+
+OBJETIVOS = ("razon", "penalizado")
+ESTRATEGIAS_K = ("ninguna", "stock")
+
+# Opciones de cada propuesta de MPL_Mercado_Libre_Pro_{1..4}.py
+PROPUESTAS = {
+    1: {"objetivo": "razon", "K": "ninguna", "lambda_penal": 1.0},
+    2: {"objetivo": "razon", "K": "stock", "lambda_penal": 1.0},
+    3: {"objetivo": "penalizado", "K": "stock", "lambda_penal": 1.0},
+    4: {"objetivo": "penalizado", "K": "stock", "lambda_penal": 5.0},
+}
+
+
+def calcular_K(instancia):
+    """
+    Cota del número de pasillos: se ordenan los pasillos de menor a mayor stock y se
+    agregan hasta que su stock total supera UB.
+
+    Retorna:
+    - K (a lo más A).
+    """
+    acumulado = np.cumsum(np.sort(instancia.estadisticas().pasillos["stock"]))
+    return int(min(np.searchsorted(acumulado, instancia.UB, side="right") + 1, instancia.A))
+
+
+def obtener_K(instancia, estrategia):
+    """
+    Número máximo de pasillos según la estrategia.
+
+    Parámetros:
+    - estrategia: "ninguna" (sin restricción), "stock" (calcular_K) o un entero fijo.
+
+    Retorna:
+    - K, o None si no se restringe el número de pasillos.
+    """
+    if estrategia is None or estrategia == "ninguna":
+        return None
+    if estrategia == "stock":
+        return calcular_K(instancia)
+    try:
+        return int(estrategia)
+    except ValueError:
+        raise ValueError(f"Estrategia de K desconocida: {estrategia}") from None
+
+
+def cotas_variables(instancia, K=None):
+    """
+    Cotas del número de pasillos de cualquier wave factible y de las variables del modelo.
+
+    - Órdenes excluidas: más unidades que UB, o que necesitan más pasillos que pasillos_max
+      (min_pasillos de la tabla de estadísticas; A + 1 si el stock no alcanza).
+    - pasillos_min: toda wave tiene al menos una orden elegible, así que visita al menos el
+      mínimo de min_pasillos sobre ellas; además necesita juntar LB unidades, lo que
+      requiere al menos los pasillos de mayor stock cuya suma llega a LB.
+    - pasillos_max: K o A.
+
+    Parámetros:
+    - instancia: instancia.Instancia.
+    - K: número máximo de pasillos (None = A).
+
+    Retorna:
+    - Diccionario con pasillos_min, pasillos_max, t_min = 1/pasillos_max,
+      t_max = 1/pasillos_min (también la M de la linealización) y ordenes_excluidas.
+    """
+    estadisticas = instancia.estadisticas()
+    unidades = np.asarray(estadisticas.ordenes["unidades"])
+    min_pasillos = np.asarray(estadisticas.ordenes["min_pasillos"])
+    pasillos_max = instancia.A if K is None else max(1, min(int(K), instancia.A))
+
+    excluidas = (unidades > instancia.UB) | (min_pasillos > pasillos_max)
+    por_orden = int(min_pasillos[~excluidas].min(initial=pasillos_max))
+    acumulado = np.cumsum(np.sort(np.asarray(estadisticas.pasillos["stock"]))[::-1])
+    por_LB = int(np.searchsorted(acumulado, instancia.LB, side="left")) + 1
+    pasillos_min = min(max(1, por_orden, por_LB), pasillos_max)
+
+    return {
+        "pasillos_min": pasillos_min,
+        "pasillos_max": pasillos_max,
+        "t_min": 1.0 / pasillos_max,
+        "t_max": 1.0 / pasillos_min,
+        "ordenes_excluidas": np.flatnonzero(excluidas).tolist(),
+    }
+
+
+def configurar_cplex(m, tiempo_limite=600, workmem=8192, enfasis_mip=1):
+    """
+    Parámetros de CPLEX.
+
+    Parámetros:
+    - tiempo_limite: segundos máximos de resolución.
+    - workmem: memoria de trabajo en MB.
+    - enfasis_mip: emphasis.mip (1 = prioriza factibilidad).
+    """
+    parametros = m.context.cplex_parameters
+    parametros.emphasis.mip = enfasis_mip
+    parametros.workmem = workmem
+    m.set_time_limit(tiempo_limite)
+
+
+def _registrar_inicio(m, valores):
+    """
+    Registra los valores como MIP start (las variables que no aparecen valen 0).
+
+    CPLEX intenta reparar el inicio si no es factible (EffortLevel.Repair).
+
+    Retorna:
+    - Si el inicio satisface todas las restricciones del modelo.
+    """
+    inicio = SolveSolution(m, valores)
+    m.add_mip_start(inicio, effort_level=EffortLevel.Repair, complete_vars=True)
+    return not inicio.find_unsatisfied_constraints(m)
+
+
+def _listas_por_item(matriz):
+    """Transpuesta ítem -> renglones de una MatrizCSR, como listas de Python."""
+    por_item = matriz.transpuesta()
+    return por_item.indptr.tolist(), por_item.indices.tolist(), por_item.data.tolist()
+
+
+def restricciones_items(m, instancia, variables_ordenes, variables_pasillos):
+    """
+    Restricciones de inventario por ítem, solo con coeficientes distintos de cero:
+    sum_o UO[o][i] * variables_ordenes[o] <= sum_a UA[a][i] * variables_pasillos[a].
+
+    Los ítems que ninguna orden pide no generan restricción.
+
+    Retorna:
+    - Lista de restricciones agregadas al modelo.
+    """
+    indptr_o, ordenes, cantidades_o = _listas_por_item(instancia.ordenes)
+    indptr_a, pasillos, cantidades_a = _listas_por_item(instancia.pasillos)
+
+    restricciones = []
+    for i in range(instancia.I):
+        ini_o, fin_o = indptr_o[i], indptr_o[i + 1]
+        if ini_o == fin_o:
+            continue
+        ini_a, fin_a = indptr_a[i], indptr_a[i + 1]
+        demanda = m.scal_prod([variables_ordenes[o] for o in ordenes[ini_o:fin_o]], cantidades_o[ini_o:fin_o])
+        oferta = m.scal_prod([variables_pasillos[a] for a in pasillos[ini_a:fin_a]], cantidades_a[ini_a:fin_a])
+        restricciones.append(demanda <= oferta)
+
+    return m.add_constraints(restricciones)
+
+
+class ModeloWave:
+    """
+    Modelo de administración de waves construido a partir de una instancia CSR.
+
+    Parámetros:
+    - instancia: instancia.Instancia (ins.cargar_instancia).
+    - K: número máximo de pasillos a visitar (None = sin restricción).
+    - objetivo: "razon" maximiza sum_o B_o * w_o (unidades por pasillo);
+      "penalizado" maximiza sum_o B_o * z_o - lambda_penal * sum_a y_a.
+    - lambda_penal: penalización por pasillo del objetivo "penalizado".
+    - acotar: usa cotas_variables; con False se usa M_big = sum_o B_o como en las
+      propuestas originales.
+
+    Atributos:
+    - m: modelo de docplex.
+    - z, y, w, s, t: variables (ver el docstring del módulo).
+    - B: unidades de cada orden; M_big: constante de la linealización.
+    - cotas: resultado de cotas_variables (None sin acotar).
+    - tiempo_construccion, tiempo_resolucion: segundos de construcción y de solve.
+    """
+
+    def __init__(self, instancia, K=None, objetivo="razon", lambda_penal=1.0, acotar=True,
+                 nombre="Modelo de administración de waves de Mercado Libre"):
+        if objetivo not in OBJETIVOS:
+            raise ValueError(f"Objetivo desconocido: {objetivo}")
+
+        inicio = time.time()
+        self.instancia = instancia
+        self.K = K
+        O, A = instancia.O, instancia.A
+        LB, UB = instancia.LB, instancia.UB
+
+        # B_o = unidades totales de la orden o; M_big = límite superior de t para la linealización
+        self.B = instancia.estadisticas().ordenes["unidades"].tolist()
+        self.cotas = cotas_variables(instancia, K) if acotar else None
+        if acotar:
+            self.M_big = self.cotas["t_max"]
+            t_min = self.cotas["t_min"]
+        else:
+            self.M_big = sum(self.B)
+            t_min = 0
+        M_big = self.M_big
+
+        m = self.m = Model(nombre)
+        s = self.s = m.continuous_var_list(keys=A, lb=0, ub=M_big, name="s")
+        w = self.w = m.continuous_var_list(keys=O, lb=0, ub=M_big, name="w")
+        y = self.y = m.binary_var_list(keys=A, lb=0, name="y")
+        z = self.z = m.binary_var_list(keys=O, lb=0, name="z")
+        t = self.t = m.continuous_var(lb=t_min, ub=M_big, name="t")
+        if acotar:
+            for o in self.cotas["ordenes_excluidas"]:
+                z[o].ub = 0
+                w[o].ub = 0
+
+        # Límites inferior y superior de la cantidad de elementos a tomar en la wave
+        unidades = m.scal_prod(w, self.B)
+        m.add_constraints([unidades >= LB * t, unidades <= UB * t])
+
+        # No elegir órdenes que sobrepasen el inventario de los pasillos visitados, por ítem
+        restricciones_items(m, instancia, w, s)
+
+        # Definición de la variable t
+        m.add_constraint(m.sum(s) == 1)
+
+        # Linealización del producto w = z*t
+        m.add_constraints([w[o] <= M_big * z[o] for o in range(O)])
+        m.add_constraints([w[o] <= t for o in range(O)])
+        m.add_constraints([w[o] >= t - M_big * (1 - z[o]) for o in range(O)])
+
+        # Linealización del producto s = y*t
+        m.add_constraints([s[a] <= M_big * y[a] for a in range(A)])
+        m.add_constraints([s[a] <= t for a in range(A)])
+        m.add_constraints([s[a] >= t - M_big * (1 - y[a]) for a in range(A)])
+
+        # Número máximo de pasillos a visitar
+        if K is not None:
+            m.add_constraint(m.sum(y) <= K)
+
+        if objetivo == "razon":
+            m.maximize(unidades)
+        else:
+            m.maximize(m.scal_prod(z, self.B) - lambda_penal * m.sum(y))
+
+        self.tiempo_construccion = time.time() - inicio
+        self.tiempo_resolucion = 0.0
+
+    def agregar_inicio(self, ordenes, pasillos):
+        """
+        Registra una wave como MIP start: z = 1 en las órdenes, y = 1 en los pasillos,
+        t = 1 / número de pasillos, w = z * t y s = y * t.
+
+        Retorna:
+        - Si la wave satisface todas las restricciones del modelo.
+        """
+        if not pasillos:
+            return False
+        t = 1.0 / len(pasillos)
+        valores = {self.t: t}
+        for o in ordenes:
+            valores[self.z[o]] = 1
+            valores[self.w[o]] = t
+        for a in pasillos:
+            valores[self.y[a]] = 1
+            valores[self.s[a]] = t
+        return _registrar_inicio(self.m, valores)
+
+    def configurar(self, tiempo_limite=600, workmem=8192, enfasis_mip=1):
+        """Parámetros de CPLEX (ver configurar_cplex)."""
+        configurar_cplex(self.m, tiempo_limite, workmem, enfasis_mip)
+
+    def resolver(self, log_output=True):
+        """Resuelve el modelo y mide el tiempo de solve por separado del de construcción."""
+        inicio = time.time()
+        solucion = self.m.solve(log_output=log_output)
+        self.tiempo_resolucion = time.time() - inicio
+        return solucion
+
+    def solucion(self):
+        """
+        Lee la solución actual.
+
+        Retorna:
+        - ordenes, pasillos: índices con z_o = 1 y y_a = 1.
+        - objetivo: unidades recolectadas por pasillo visitado.
+        """
+        ordenes = [o for o, var in enumerate(self.z) if var.solution_value > 0.5]
+        pasillos = [a for a, var in enumerate(self.y) if var.solution_value > 0.5]
+        unidades = sum(self.B[o] for o in ordenes)
+        return ordenes, pasillos, unidades / len(pasillos) if pasillos else 0.0
+
+
+class ModeloDinkelbach:
+    """
+    Maximización de unidades / pasillos con el método de Dinkelbach.
+
+    El modelo se construye una sola vez con z, y binarias, las restricciones de LB/UB y
+    de inventario por ítem, y una variable entera num_pasillos = sum_a y_a. En cada
+    iteración se resuelve F(q) = max sum_o B_o z_o - q * num_pasillos y se actualiza
+    q = unidades / pasillos de la solución encontrada; entre iteraciones solo cambia el
+    coeficiente de num_pasillos en el objetivo y la solución anterior se registra como
+    MIP start (en ella F(q) = 0, así que siempre es factible). Si F(q) <= tolerancia, q
+    es la razón óptima.
+
+    Parámetros:
+    - instancia: instancia.Instancia.
+    - K: número máximo de pasillos (None = A).
+    - acotar: fija en 0 las órdenes excluidas y usa pasillos_min como cota inferior de
+      num_pasillos (ver cotas_variables).
+
+    Atributos:
+    - m, z, y, num_pasillos: modelo y variables; B: unidades de cada orden.
+    - iteraciones: lista de diccionarios por iteración con q, unidades, pasillos, razon,
+      F (valor de F(q) encontrado), cota (cota superior de la razón) y tiempo.
+    - tiempo_construccion, tiempo_resolucion: segundos de construcción y total de solves.
+    """
+
+    def __init__(self, instancia, K=None, acotar=True,
+                 nombre="Modelo de administración de waves de Mercado Libre (Dinkelbach)"):
+        inicio = time.time()
+        self.instancia = instancia
+        self.K = K
+        O, A = instancia.O, instancia.A
+        LB, UB = instancia.LB, instancia.UB
+        self.B = instancia.estadisticas().ordenes["unidades"].tolist()
+
+        m = self.m = Model(nombre)
+        y = self.y = m.binary_var_list(keys=A, name="y")
+        z = self.z = m.binary_var_list(keys=O, name="z")
+        self.cotas = cotas_variables(instancia, K) if acotar else None
+        if acotar:
+            self.num_pasillos = m.integer_var(lb=self.cotas["pasillos_min"], ub=self.cotas["pasillos_max"],
+                                              name="num_pasillos")
+            for o in self.cotas["ordenes_excluidas"]:
+                z[o].ub = 0
+        else:
+            self.num_pasillos = m.integer_var(lb=1, ub=A if K is None else K, name="num_pasillos")
+
+        unidades = m.scal_prod(z, self.B)
+        m.add_constraints([unidades >= LB, unidades <= UB])
+        restricciones_items(m, instancia, z, y)
+        m.add_constraint(self.num_pasillos == m.sum(y))
+
+        # El objetivo se modifica en sitio: solo cambia el coeficiente de num_pasillos
+        m.maximize(m.scal_prod(z, self.B) - self.num_pasillos)
+        self.objetivo = m.get_objective_expr()
+
+        self.iteraciones = []
+        self.mejor = None
+        self.q_inicio = 0.0
+        self.tiempo_construccion = time.time() - inicio
+        self.tiempo_resolucion = 0.0
+
+    def agregar_inicio(self, ordenes, pasillos):
+        """
+        Registra una wave como MIP start de la primera iteración y toma su razón como q
+        inicial, de modo que la primera iteración ya busca mejorarla.
+
+        Retorna:
+        - Si la wave satisface todas las restricciones del modelo.
+        """
+        if not pasillos:
+            return False
+        valores = {self.num_pasillos: len(pasillos)}
+        valores.update({self.z[o]: 1 for o in ordenes})
+        valores.update({self.y[a]: 1 for a in pasillos})
+        factible = _registrar_inicio(self.m, valores)
+        if factible:
+            self.q_inicio = sum(self.B[o] for o in ordenes) / len(pasillos)
+        return factible
+
+    def configurar(self, workmem=8192, enfasis_mip=1):
+        """Parámetros de CPLEX; el límite de tiempo se reparte en resolver."""
+        parametros = self.m.context.cplex_parameters
+        parametros.emphasis.mip = enfasis_mip
+        parametros.workmem = workmem
+
+    def resolver(self, tiempo_limite=600, max_iteraciones=50, tolerancia=1e-6, q_inicial=None,
+                 log_output=False):
+        """
+        Iteraciones de Dinkelbach hasta F(q) <= tolerancia, max_iteraciones o tiempo_limite.
+
+        Parámetros:
+        - tiempo_limite: segundos totales para todas las iteraciones.
+        - q_inicial: razón inicial; por defecto la del inicio registrado con agregar_inicio (o 0).
+
+        Retorna:
+        - La mejor solución encontrada (ordenes, pasillos, razon), o None.
+        """
+        m = self.m
+        q = self.q_inicio if q_inicial is None else q_inicial
+        limite = time.time() + tiempo_limite
+        for _ in range(max_iteraciones):
+            restante = limite - time.time()
+            if restante <= 0:
+                break
+            self.objetivo.set_coefficient(self.num_pasillos, -q)
+            m.set_time_limit(restante)
+
+            inicio = time.time()
+            solucion = m.solve(log_output=log_output)
+            tiempo = time.time() - inicio
+            self.tiempo_resolucion += tiempo
+            if solucion is None:
+                break
+
+            ordenes = [o for o, var in enumerate(self.z) if solucion.get_value(var) > 0.5]
+            pasillos = [a for a, var in enumerate(self.y) if solucion.get_value(var) > 0.5]
+            unidades = sum(self.B[o] for o in ordenes)
+            razon = unidades / len(pasillos)
+            F = unidades - q * len(pasillos)
+            # Para toda wave, unidades - q * pasillos <= cota de F(q) y pasillos >= 1
+            cota = q + max(m.solve_details.best_bound, 0.0)
+            self.iteraciones.append({"q": q, "unidades": unidades, "pasillos": len(pasillos), "razon": razon,
+                                     "F": F, "cota": cota, "tiempo": tiempo})
+            if self.mejor is None or razon > self.mejor[2]:
+                self.mejor = (ordenes, pasillos, razon)
+
+            m.clear_mip_starts()
+            m.add_mip_start(solucion)
+            if F <= tolerancia:
+                break
+            q = razon
+
+        return self.mejor
+
+    def solucion(self):
+        """Mejor solución de las iteraciones: (ordenes, pasillos, razon)."""
+        return self.mejor if self.mejor is not None else ([], [], 0.0)
+
+
+def resolver_instancia(archivo, objetivo="razon", lambda_penal=1.0, K="ninguna",
+                       tiempo_limite=600, workmem=8192, log_output=True, dinkelbach=False, acotar=True,
+                       reducir=False, inicial=None):
+    """
+    Lee una instancia, construye el modelo con las opciones dadas y lo resuelve.
+
+    Parámetros:
+    - archivo: ruta de la instancia.
+    - objetivo, lambda_penal: ver ModeloWave.
+    - K: estrategia del número máximo de pasillos (ver obtener_K).
+    - tiempo_limite, workmem: ver ModeloWave.configurar.
+    - dinkelbach: resuelve la razón con ModeloDinkelbach (solo objetivo "razon").
+    - acotar: cotas ajustadas de cotas_variables en lugar de M_big.
+    - reducir: resuelve la instancia reducida (Comun/reduccion.py); las órdenes y los
+      pasillos del resultado se traducen a los IDs originales.
+    - inicial: wave (ordenes, pasillos) en IDs originales para el MIP start.
+
+    Retorna:
+    - Diccionario con archivo, K, tiempos (lectura, que incluye la reducción, construccion
+      y resolucion), estado, nodos, gap, cotas (cotas_variables o None), ordenes,
+      pasillos, objetivo (unidades por pasillo; None si no hay solución), iteraciones
+      (solo con dinkelbach), reduccion (reduccion.Reduccion o None) e inicio_factible
+      (None sin inicial).
+    """
+    if dinkelbach and objetivo != "razon":
+        raise ValueError("Dinkelbach solo aplica al objetivo razon")
+
+    inicio = time.time()
+    instancia = ins.cargar_instancia(archivo)
+    reduccion = rd.reducir(instancia) if reducir else None
+    if reduccion is not None:
+        instancia = reduccion.instancia
+    tiempo_lectura = time.time() - inicio
+
+    K = obtener_K(instancia, K)
+    if dinkelbach:
+        modelo = ModeloDinkelbach(instancia, K=K, acotar=acotar)
+        modelo.configurar(workmem=workmem)
+    else:
+        modelo = ModeloWave(instancia, K=K, objetivo=objetivo, lambda_penal=lambda_penal, acotar=acotar)
+        modelo.configurar(tiempo_limite=tiempo_limite, workmem=workmem)
+
+    inicio_factible = None
+    if inicial is not None:
+        ordenes, pasillos = inicial
+        if reduccion is not None:
+            ordenes, pasillos = reduccion.ordenes_reducidas(ordenes), reduccion.pasillos_reducidos(pasillos)
+        inicio_factible = modelo.agregar_inicio(ordenes, pasillos)
+
+    if dinkelbach:
+        solucion = modelo.resolver(tiempo_limite=tiempo_limite, log_output=log_output)
+    else:
+        solucion = modelo.resolver(log_output=log_output)
+
+    ordenes, pasillos, valor = modelo.solucion() if solucion is not None else ([], [], None)
+    if reduccion is not None:
+        ordenes, pasillos = reduccion.ordenes_originales(ordenes), reduccion.pasillos_originales(pasillos)
+    return {
+        "archivo": archivo,
+        "K": K,
+        "tiempo_lectura": tiempo_lectura,
+        "tiempo_construccion": modelo.tiempo_construccion,
+        "tiempo_resolucion": modelo.tiempo_resolucion,
+        "estado": modelo.m.solve_details.status,
+        "nodos": modelo.m.solve_details.nb_nodes_processed,
+        "gap": modelo.m.solve_details.mip_relative_gap,
+        "cotas": modelo.cotas,
+        "ordenes": ordenes,
+        "pasillos": pasillos,
+        "objetivo": valor,
+        "iteraciones": getattr(modelo, "iteraciones", None),
+        "reduccion": reduccion,
+        "inicio_factible": inicio_factible,
+    }
+
+
+def imprimir_resultado(resultado):
+    """Imprime los tiempos y el valor objetivo de resolver_instancia."""
+    print(f"\nInstancia: {resultado['archivo']}")
+    if resultado["K"] is not None:
+        print(f"Se ocupan a lo mucho {resultado['K']} pasillos para saturar de capacidad la wave")
+    if resultado["reduccion"] is not None:
+        print(resultado["reduccion"].resumen())
+    print(f"Tiempo total para la lectura del archivo: {resultado['tiempo_lectura']} segundos")
+    print(f"Tiempo total para la construcción del modelo: {resultado['tiempo_construccion']} segundos")
+    print(f"Tiempo total para la resolución del problema: {resultado['tiempo_resolucion']} segundos")
+    if resultado["inicio_factible"] is not None:
+        print(f"Inicio heurístico {'factible' if resultado['inicio_factible'] else 'no factible'}")
+    print(f"Estado: {resultado['estado']}")
+    for k, it in enumerate(resultado["iteraciones"] or []):
+        print(f"Iteración {k}: q = {it['q']:.4f}, F(q) = {it['F']:.4f}, razón = {it['razon']:.4f}, "
+              f"cota = {it['cota']:.4f}, tiempo = {it['tiempo']:.2f} s")
+    if resultado["objetivo"] is not None:
+        print(f"\tNúmero de elementos recolectados por pasillo visitado: {resultado['objetivo']}")
+        print(f"Número de pasillos visitados: {len(resultado['pasillos'])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Modelo de waves de Mercado Libre con CPLEX sobre una o varias instancias")
+    parser.add_argument("instancias", nargs="+", help="rutas de las instancias")
+    parser.add_argument("--propuesta", type=int, default=1, choices=sorted(PROPUESTAS),
+                        help="opciones de MPL_Mercado_Libre_Pro_<n>.py (las demás opciones las sobrescriben)")
+    parser.add_argument("--objetivo", type=str, default=None, choices=OBJETIVOS)
+    parser.add_argument("--lambda", dest="lambda_penal", type=float, default=None,
+                        help="penalización por pasillo del objetivo penalizado")
+    parser.add_argument("--K", type=str, default=None,
+                        help="número máximo de pasillos: ninguna, stock o un entero")
+    parser.add_argument("--tiempo", type=float, default=600, help="límite de tiempo por instancia en segundos")
+    parser.add_argument("--workmem", type=int, default=8192, help="memoria de trabajo de CPLEX en MB")
+    parser.add_argument("--dinkelbach", action="store_true",
+                        help="resuelve la razón con iteraciones de Dinkelbach (objetivo razon)")
+    parser.add_argument("--sin-cotas", action="store_true",
+                        help="usa M_big = sum_o B_o en lugar de las cotas ajustadas")
+    parser.add_argument("--reducir", action="store_true",
+                        help="resuelve la instancia reducida (Comun/reduccion.py)")
+    parser.add_argument("--ga", type=float, default=0,
+                        help="segundos del GA de Algoritmo_Gen_Propuesta1 cuyo mejor individuo es el MIP start (0 = sin inicio)")
+    parser.add_argument("--silencioso", action="store_true", help="no imprime el log de CPLEX")
+    args = parser.parse_args()
+
+    opciones = dict(PROPUESTAS[args.propuesta])
+    for clave in ("objetivo", "lambda_penal", "K"):
+        if getattr(args, clave) is not None:
+            opciones[clave] = getattr(args, clave)
+    if args.dinkelbach and opciones["objetivo"] != "razon":
+        parser.error("--dinkelbach solo aplica al objetivo razon")
+
+    for archivo in args.instancias:
+        inicial = None
+        if args.ga > 0:
+            # Importación diferida: el GA solo se carga si se pide el inicio heurístico
+            import inicio_ga
+            inicial = inicio_ga.mejor_wave(archivo, args.ga, reducir=args.reducir)
+            print(f"GA ({args.ga} s): {len(inicial[0])} órdenes, {len(inicial[1])} pasillos")
+        resultado = resolver_instancia(archivo, tiempo_limite=args.tiempo, workmem=args.workmem, inicial=inicial,
+                                       log_output=not args.silencioso, dinkelbach=args.dinkelbach,
+                                       acotar=not args.sin_cotas, reducir=args.reducir, **opciones)
+        imprimir_resultado(resultado)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+for carpeta in ("Comun", "Algoritmo_Gen_Propuesta1", "Algoritmo_Gen_Propuesta2", "Modelo_Optimización_Lineal"):
+    sys.path.insert(0, os.path.join(RAIZ, carpeta))
+
+
+def escribir_instancia(ruta, ordenes, pasillos, LB, UB):
+    """
+    Escribe una instancia en el formato de texto del challenge.
+
+    ordenes y pasillos son matrices densas (renglones x ítems); regresa la ruta como str.
+    """
+    ordenes, pasillos = np.asarray(ordenes), np.asarray(pasillos)
+    renglones = [f"{ordenes.shape[0]} {ordenes.shape[1]} {pasillos.shape[0]}"]
+    for matriz in (ordenes, pasillos):
+        for fila in matriz:
+            items = np.flatnonzero(fila)
+            renglones.append(" ".join([str(len(items))] + [f"{i} {fila[i]}" for i in items]))
+    renglones.append(f"{LB} {UB}")
+    with open(ruta, "w") as archivo:
+        archivo.write("\n".join(renglones) + "\n")
+    return str(ruta)
+
+
+def densas_aleatorias(semilla, O=12, I=8, A=6, densidad=0.4, maximo=5):
+    """Matrices densas de órdenes y pasillos con ceros, para instancias pequeñas de prueba."""
+    rng = np.random.default_rng(semilla)
+    ordenes = rng.integers(1, maximo + 1, size=(O, I)) * (rng.random((O, I)) < densidad)
+    pasillos = rng.integers(1, 3 * maximo, size=(A, I)) * (rng.random((A, I)) < densidad)
+    return ordenes, pasillos
+
+
+@pytest.fixture
+def instancia_texto(tmp_path):
+    """Ruta de una instancia pequeña aleatoria (con órdenes y pasillos vacíos) y sus matrices densas."""
+    ordenes, pasillos = densas_aleatorias(7)
+    ordenes[3] = 0
+    pasillos[2] = 0
+    ruta = escribir_instancia(tmp_path / "instancia.txt", ordenes, pasillos, 5, 30)
+    return ruta, ordenes, pasillos
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+import bitset as bs
+import instancia as ins
+from conftest import densas_aleatorias
+
+
+@pytest.mark.parametrize("n", [1, 63, 64, 65, 200])
+def test_indices_ida_y_vuelta(n):
+    rng = np.random.default_rng(n)
+    indices = rng.integers(0, n, size=2 * n)
+    bits = bs.desde_indices(indices, n)
+
+    assert bits.shape == (bs.palabras(n),)
+    assert bs.a_indices(bits).tolist() == sorted(set(indices.tolist()))
+    assert bs.conteo(bits) == len(set(indices.tolist()))
+    assert bs.contiene(bits, np.arange(n)).tolist() == [e in set(indices.tolist()) for e in range(n)]
+
+
+def test_vacio():
+    assert bs.palabras(0) == 1
+    assert bs.a_indices(bs.vacio(130)).tolist() == []
+    assert bs.conteo(bs.vacio(130, 3)).tolist() == [0, 0, 0]
+    assert bs.desde_indices([], 70).tolist() == bs.vacio(70).tolist()
+
+
+def test_operaciones_de_conjuntos():
+    n = 150
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        a = set(rng.integers(0, n, size=rng.integers(0, 60)).tolist())
+        b = set(rng.integers(0, n, size=rng.integers(0, 60)).tolist())
+        bits_a, bits_b = bs.desde_indices(sorted(a), n), bs.desde_indices(sorted(b), n)
+
+        assert bs.a_indices(bs.union(bits_a, bits_b)).tolist() == sorted(a | b)
+        assert bs.a_indices(bs.interseccion(bits_a, bits_b)).tolist() == sorted(a & b)
+        assert bs.a_indices(bs.diferencia(bits_a, bits_b)).tolist() == sorted(a - b)
+        assert bool(bs.subconjunto(bits_a, bits_b)) == (a <= b)
+        assert bool(bs.subconjunto(bs.interseccion(bits_a, bits_b), bits_a))
+
+
+def test_matrices_de_conjuntos():
+    n = 100
+    listas = [[], [0, 99], [5, 5, 64, 63], list(range(0, 100, 7))]
+    bits = bs.desde_listas(listas, n)
+
+    largos = np.array([len(lista) for lista in listas])
+    rellena = np.zeros((len(listas), largos.max()), dtype=np.int64)
+    for k, lista in enumerate(listas):
+        rellena[k, :len(lista)] = lista
+    assert np.array_equal(bs.desde_matriz(rellena, largos, n), bits)
+
+    assert bs.conteo(bits).tolist() == [len(set(lista)) for lista in listas]
+    assert bs.a_indices(bs.union_filas(bits)).tolist() == sorted(set().union(*listas))
+    assert bs.subconjunto(bits, bs.union_filas(bits)).all()
+
+
+def test_desde_pares_de_csr():
+    ordenes, _ = densas_aleatorias(5, O=10, I=70)
+    csr = ins.MatrizCSR.desde_densa(ordenes)
+    bits = bs.desde_pares(csr.ids_filas(), csr.indices, 10, 70)
+
+    for r in range(10):
+        assert bs.a_indices(bits[r]).tolist() == np.flatnonzero(ordenes[r]).tolist()
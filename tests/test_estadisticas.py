@@ -0,0 +1,65 @@
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+import estadisticas as est
+import instancia as ins
+from conftest import densas_aleatorias, escribir_instancia
+
+
+def _minimo_exacto(orden, pasillos):
+    """Menor número de pasillos que surten la orden, por fuerza bruta (A + 1 si no hay)."""
+    for k in range(len(pasillos) + 1):
+        if any(np.all(pasillos[list(y)].sum(axis=0) >= orden) for y in combinations(range(len(pasillos)), k)):
+            return k
+    return len(pasillos) + 1
+
+
+def _cota_por_items(orden, pasillos):
+    """Máximo, sobre los ítems de la orden, de los pasillos de mayor stock que hacen falta para ese ítem."""
+    cota = 0
+    for i in np.flatnonzero(orden):
+        acumulado = np.cumsum(np.sort(pasillos[:, i])[::-1])
+        if acumulado[-1] < orden[i]:
+            return len(pasillos) + 1
+        cota = max(cota, int(np.searchsorted(acumulado, orden[i])) + 1)
+    return cota
+
+
+@pytest.mark.parametrize("semilla", range(5))
+def test_min_pasillos_por_orden(semilla):
+    ordenes, pasillos = densas_aleatorias(semilla, O=15, I=6, A=6)
+    ordenes[0] = 0
+
+    cotas = est.min_pasillos_por_orden(ins.MatrizCSR.desde_densa(ordenes), ins.MatrizCSR.desde_densa(pasillos))
+
+    assert cotas.tolist() == [_cota_por_items(orden, pasillos) for orden in ordenes]
+    assert cotas[0] == 0
+    for orden, cota in zip(ordenes, cotas):
+        assert cota <= _minimo_exacto(orden, pasillos)
+
+
+def test_columnas_de_la_tabla(instancia_texto):
+    ruta, ordenes, pasillos = instancia_texto
+    tabla = ins.leer_instancia(ruta).estadisticas()
+
+    assert tabla.ordenes["unidades"].tolist() == ordenes.sum(axis=1).tolist()
+    assert tabla.ordenes["items"].tolist() == (ordenes > 0).sum(axis=1).tolist()
+    assert tabla.pasillos["stock"].tolist() == pasillos.sum(axis=1).tolist()
+    assert tabla.pasillos["items"].tolist() == (pasillos > 0).sum(axis=1).tolist()
+
+
+def test_guardar_y_abrir(tmp_path):
+    ordenes, pasillos = densas_aleatorias(9)
+    ruta = escribir_instancia(tmp_path / "instancia.txt", ordenes, pasillos, 1, 50)
+    tabla = ins.leer_instancia(ruta).estadisticas()
+
+    tabla.guardar(str(tmp_path))
+    abierta = est.Estadisticas.abrir(str(tmp_path))
+
+    for columna in est.COLUMNAS_ORDENES:
+        assert np.array_equal(abierta.ordenes[columna], tabla.ordenes[columna])
+    for columna in est.COLUMNAS_PASILLOS:
+        assert np.array_equal(abierta.pasillos[columna], tabla.pasillos[columna])
+    assert est.Estadisticas.abrir(str(tmp_path / "no_existe")) is None
@@ -0,0 +1,81 @@
+import numpy as np
+
+import funciones_entero as fn
+import instancia as ins
+from conftest import densas_aleatorias
+
+
+def _completa(ordenes_list, stock, x):
+    """Demanda, total y exceso recalculados desde cero con generar_demanda."""
+    demanda = fn.generar_demanda(ordenes_list, x)
+    exceso = sum(max(0, cantidad - stock.get(item_id, 0)) for item_id, cantidad in demanda.items())
+    return demanda, sum(demanda.values()), exceso
+
+
+def _datos(semilla):
+    ordenes, pasillos = densas_aleatorias(semilla, O=25, I=10, A=4)
+    ordenes_list = ins.MatrizCSR.desde_densa(ordenes).a_diccionarios()
+    stock = fn.generar_stock(ins.MatrizCSR.desde_densa(pasillos).a_diccionarios())
+    return ordenes_list, stock
+
+
+def _igual(evaluador, ordenes_list, stock, x):
+    demanda, total, exceso = _completa(ordenes_list, stock, x)
+    assert evaluador.demanda == demanda
+    assert evaluador.total == total
+    assert evaluador.exceso == exceso
+
+
+def test_inicial_igual_a_completa():
+    ordenes_list, stock = _datos(1)
+    for x in ([], [0], [3, 7, 7, 12], list(range(25))):
+        _igual(fn.EvaluadorIncremental(ordenes_list, stock, x), ordenes_list, stock, x)
+
+
+def test_movimientos_iguales_a_completa():
+    ordenes_list, stock = _datos(2)
+    rng = np.random.default_rng(0)
+    x = rng.choice(25, size=8, replace=False).tolist()
+    evaluador = fn.EvaluadorIncremental(ordenes_list, stock, x)
+
+    for _ in range(200):
+        fuera = [o for o in range(25) if o not in x]
+        movimiento = rng.integers(0, 4)
+        if movimiento == 0 and fuera:
+            entra = int(rng.choice(fuera))
+            evaluador.agregar(entra)
+            x.append(entra)
+        elif movimiento == 1 and x:
+            sale = x.pop(int(rng.integers(0, len(x))))
+            evaluador.quitar(sale)
+        elif movimiento == 2 and x and fuera:
+            sale, entra = x.pop(int(rng.integers(0, len(x)))), int(rng.choice(fuera))
+            evaluador.intercambiar(sale, entra)
+            x.append(entra)
+        elif x and fuera:
+            salen = [x.pop(int(rng.integers(0, len(x))))]
+            entran = rng.choice(fuera, size=min(2, len(fuera)), replace=False).tolist()
+            evaluador.aplicar(salen, entran)
+            x.extend(entran)
+        _igual(evaluador, ordenes_list, stock, x)
+
+
+def test_quitar_todo_deja_vacio():
+    ordenes_list, stock = _datos(3)
+    x = [1, 4, 9]
+    evaluador = fn.EvaluadorIncremental(ordenes_list, stock, x)
+    evaluador.aplicar(x, [])
+
+    assert evaluador.demanda == {}
+    assert evaluador.total == 0
+    assert evaluador.exceso == 0
+
+
+def test_copia_independiente():
+    ordenes_list, stock = _datos(4)
+    evaluador = fn.EvaluadorIncremental(ordenes_list, stock, [0, 2])
+    copia = evaluador.copia()
+    copia.intercambiar(0, 5)
+
+    _igual(evaluador, ordenes_list, stock, [0, 2])
+    _igual(copia, ordenes_list, stock, [2, 5])
@@ -0,0 +1,72 @@
+import numpy as np
+
+import instancia as ins
+from Fitness import fitness_poblacion
+
+
+def _solucion(ordenes, pasillos):
+    return [len(ordenes)] + list(ordenes) + [len(pasillos)] + list(pasillos)
+
+
+def _esperado(sol, ordenes, pasillos, LB, UB):
+    """Evaluación directa con las matrices densas, un individuo a la vez."""
+    x = sorted(set(sol[1:sol[0] + 1]))
+    y = sorted(set(sol[sol[0] + 2:]))
+    unidades = int(ordenes[x].sum())
+    faltante = int(np.maximum(ordenes[x].sum(axis=0) - pasillos[y].sum(axis=0), 0).sum())
+    factible = LB <= unidades <= UB and faltante == 0 and len(y) > 0
+    fuera = max(LB - unidades, 0) + max(unidades - UB, 0)
+    return unidades, len(y), factible, unidades / len(y) if factible else -(1.0 + fuera + faltante)
+
+
+def test_poblacion_sin_pasillos(instancia_texto):
+    ruta, ordenes, pasillos = instancia_texto
+    instancia = ins.leer_instancia(ruta)
+    poblacion = [_solucion([0, 1], []), _solucion([2], []), _solucion([], [])]
+
+    resultado = fitness_poblacion(poblacion, instancia)
+
+    assert resultado["num_pasillos"].tolist() == [0, 0, 0]
+    assert not resultado["factible"].any()
+    for k, sol in enumerate(poblacion):
+        assert resultado["objetivo"][k] == _esperado(sol, ordenes, pasillos, instancia.LB, instancia.UB)[3]
+
+
+def test_poblacion_factible(instancia_texto):
+    ruta, ordenes, pasillos = instancia_texto
+    instancia = ins.leer_instancia(ruta)
+    todos = list(range(instancia.A))
+    # Órdenes sueltas y en pares cuyo total queda entre LB y UB y que el stock completo cubre
+    candidatos = [[o] for o in range(instancia.O)] + [[o, o + 1] for o in range(instancia.O - 1)]
+    poblacion = [_solucion(x, todos) for x in candidatos
+                 if _esperado(_solucion(x, todos), ordenes, pasillos, instancia.LB, instancia.UB)[2]]
+    assert poblacion
+
+    resultado = fitness_poblacion(poblacion, instancia)
+
+    assert resultado["factible"].all()
+    for k, sol in enumerate(poblacion):
+        unidades, num_pasillos, _, objetivo = _esperado(sol, ordenes, pasillos, instancia.LB, instancia.UB)
+        assert resultado["unidades"][k] == unidades
+        assert resultado["num_pasillos"][k] == num_pasillos
+        assert np.isclose(resultado["objetivo"][k], objetivo)
+
+
+def test_poblacion_mixta_con_repetidos(instancia_texto):
+    ruta, ordenes, pasillos = instancia_texto
+    instancia = ins.leer_instancia(ruta)
+    rng = np.random.default_rng(0)
+    poblacion = []
+    for _ in range(30):
+        x = rng.integers(0, instancia.O, size=rng.integers(0, 6)).tolist()
+        y = rng.integers(0, instancia.A, size=rng.integers(0, 5)).tolist()
+        poblacion.append(_solucion(x, y))
+
+    resultado = fitness_poblacion(poblacion, instancia)
+
+    for k, sol in enumerate(poblacion):
+        unidades, num_pasillos, factible, objetivo = _esperado(sol, ordenes, pasillos, instancia.LB, instancia.UB)
+        assert resultado["unidades"][k] == unidades
+        assert resultado["num_pasillos"][k] == num_pasillos
+        assert resultado["factible"][k] == factible
+        assert np.isclose(resultado["objetivo"][k], objetivo)
@@ -0,0 +1,97 @@
+import os
+
+import numpy as np
+
+import instancia as ins
+from conftest import densas_aleatorias, escribir_instancia
+
+
+def _leer_texto(ruta):
+    """Lectura directa del formato de texto a matrices densas, sin pasar por CSR."""
+    with open(ruta) as archivo:
+        lineas = [linea.split() for linea in archivo if linea.strip()]
+    O, I, A = map(int, lineas[0][:3])
+    matrices = []
+    for inicio, filas in ((1, O), (1 + O, A)):
+        matriz = np.zeros((filas, I), dtype=np.int64)
+        for r, valores in enumerate(lineas[inicio:inicio + filas]):
+            for k in range(int(valores[0])):
+                matriz[r, int(valores[1 + 2 * k])] += int(valores[2 + 2 * k])
+        matrices.append(matriz)
+    LB, UB = map(int, lineas[1 + O + A][:2])
+    return O, I, A, LB, UB, matrices[0], matrices[1]
+
+
+def _comparar(instancia, ruta):
+    O, I, A, LB, UB, ordenes, pasillos = _leer_texto(ruta)
+    assert (instancia.O, instancia.I, instancia.A, instancia.LB, instancia.UB) == (O, I, A, LB, UB)
+    assert np.array_equal(instancia.ordenes.densa(np.int64), ordenes)
+    assert np.array_equal(instancia.pasillos.densa(np.int64), pasillos)
+    general, diccionarios_ordenes, diccionarios_pasillos = instancia.a_diccionarios()
+    assert general == [O, I, A, LB, UB]
+    assert diccionarios_ordenes == [{i: int(c) for i, c in enumerate(fila) if c} for fila in ordenes]
+    assert diccionarios_pasillos == [{i: int(c) for i, c in enumerate(fila) if c} for fila in pasillos]
+
+
+def test_leer_instancia_igual_al_texto(instancia_texto):
+    ruta, _, _ = instancia_texto
+    _comparar(ins.leer_instancia(ruta), ruta)
+
+
+def test_leer_instancia_con_lineas_vacias(tmp_path):
+    ordenes, pasillos = densas_aleatorias(3)
+    ruta = escribir_instancia(tmp_path / "instancia.txt", ordenes, pasillos, 2, 40)
+    with open(ruta) as archivo:
+        texto = archivo.read()
+    with open(ruta, "w") as archivo:
+        archivo.write("\n" + texto.replace("\n", "\n\n"))
+
+    _comparar(ins.leer_instancia(ruta), ruta)
+
+
+def test_cargar_instancia_desde_cache(instancia_texto):
+    ruta, _, _ = instancia_texto
+    assert not ins.cache_vigente(ruta)
+
+    compilada = ins.cargar_instancia(ruta)
+    assert ins.cache_vigente(ruta)
+    assert os.path.isdir(ins.ruta_cache(ruta))
+    _comparar(compilada, ruta)
+    _comparar(ins.cargar_instancia(ruta), ruta)
+    _comparar(ins.cargar_instancia(ins.ruta_cache(ruta)), ruta)
+
+    esperadas = ins.leer_instancia(ruta).estadisticas()
+    for tabla in ("ordenes", "pasillos"):
+        for columna, valores in getattr(esperadas, tabla).items():
+            assert np.array_equal(getattr(compilada.estadisticas(), tabla)[columna], valores)
+
+
+def test_cache_se_invalida_al_cambiar_el_texto(instancia_texto):
+    ruta, ordenes, pasillos = instancia_texto
+    ins.cargar_instancia(ruta)
+
+    ordenes[0] += 1
+    escribir_instancia(ruta, ordenes, pasillos, 5, 300)
+    assert not ins.cache_vigente(ruta)
+    _comparar(ins.cargar_instancia(ruta), ruta)
+
+
+def test_operaciones_csr_iguales_a_densa():
+    ordenes, _ = densas_aleatorias(11, O=20, I=15)
+    ordenes[4] = 0
+    csr = ins.MatrizCSR.desde_densa(ordenes)
+    rng = np.random.default_rng(0)
+    filas = rng.integers(0, 20, size=9)
+    columnas = rng.permutation(15)[:6]
+    vector = rng.integers(0, 10, size=15)
+
+    assert np.array_equal(csr.densa(np.int64), ordenes)
+    assert np.array_equal(csr.largos(), (ordenes > 0).sum(axis=1))
+    assert np.array_equal(csr.sumas_filas(), ordenes.sum(axis=1))
+    assert np.array_equal(csr.sumas_columnas(), ordenes.sum(axis=0))
+    assert np.array_equal(csr.suma_filas(filas), ordenes[filas].sum(axis=0))
+    assert np.array_equal(csr.suma_filas([]), np.zeros(15, dtype=np.int64))
+    assert np.array_equal(csr.producto(vector), ordenes @ vector)
+    assert np.array_equal(csr.submatriz(filas).densa(np.int64), ordenes[filas])
+    assert np.array_equal(csr.submatriz(filas, columnas).densa(np.int64), ordenes[filas][:, columnas])
+    assert np.array_equal(csr.transpuesta().densa(np.int64), ordenes.T)
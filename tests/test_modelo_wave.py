@@ -0,0 +1,72 @@
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("docplex")
+
+import instancia as ins
+import modelo_wave as mw
+from conftest import densas_aleatorias
+
+
+def _waves_factibles(instancia):
+    """Pares (órdenes, mínimo de pasillos) de todas las waves factibles, por fuerza bruta."""
+    ordenes, pasillos = instancia.ordenes.densa(np.int64), instancia.pasillos.densa(np.int64)
+    coberturas = [(k, pasillos[list(y)].sum(axis=0)) for k in range(1, instancia.A + 1)
+                  for y in combinations(range(instancia.A), k)]
+    waves = []
+    for k in range(1, instancia.O + 1):
+        for x in combinations(range(instancia.O), k):
+            demanda = ordenes[list(x)].sum(axis=0)
+            if not instancia.LB <= demanda.sum() <= instancia.UB:
+                continue
+            minimo = next((n for n, stock in coberturas if np.all(stock >= demanda)), None)
+            if minimo is not None:
+                waves.append((set(x), minimo))
+    return waves
+
+
+@pytest.mark.parametrize("semilla", range(5))
+@pytest.mark.parametrize("K", [None, 2, 3])
+def test_cotas_validas_para_toda_wave_factible(semilla, K):
+    ordenes, pasillos = densas_aleatorias(semilla, O=8, I=5, A=5)
+    instancia = ins.Instancia(8, 5, 5, 8, 30, ins.MatrizCSR.desde_densa(ordenes), ins.MatrizCSR.desde_densa(pasillos))
+
+    cotas = mw.cotas_variables(instancia, K)
+
+    assert cotas["pasillos_max"] == (5 if K is None else K)
+    assert 1 <= cotas["pasillos_min"] <= cotas["pasillos_max"]
+    assert np.isclose(cotas["t_min"], 1 / cotas["pasillos_max"])
+    assert np.isclose(cotas["t_max"], 1 / cotas["pasillos_min"])
+    excluidas = set(cotas["ordenes_excluidas"])
+    for x, minimo in _waves_factibles(instancia):
+        if minimo <= cotas["pasillos_max"]:
+            assert cotas["pasillos_min"] <= minimo
+            assert not x & excluidas
+
+
+def test_excluye_ordenes_sobre_UB_y_sin_stock():
+    ordenes = [[2, 0], [9, 0], [0, 7], [1, 1]]
+    pasillos = [[3, 1], [3, 2]]
+    instancia = ins.Instancia(4, 2, 2, 1, 8, ins.MatrizCSR.desde_densa(ordenes), ins.MatrizCSR.desde_densa(pasillos))
+
+    cotas = mw.cotas_variables(instancia)
+
+    # Orden 1: más unidades que UB; orden 2: pide 7 del ítem 1 y solo hay 3
+    assert cotas["ordenes_excluidas"] == [1, 2]
+    assert cotas["pasillos_min"] == 1
+    assert mw.cotas_variables(instancia, K=1)["ordenes_excluidas"] == [1, 2]
+
+
+def test_pasillos_min_por_LB_y_por_orden():
+    pasillos = [[2, 1], [1, 1], [1, 1], [1, 0]]
+    # LB = 6: los tres pasillos de mayor stock suman 3 + 2 + 2 = 7
+    instancia = ins.Instancia(2, 2, 4, 6, 10, ins.MatrizCSR.desde_densa([[3, 1], [2, 1]]),
+                              ins.MatrizCSR.desde_densa(pasillos))
+    assert mw.cotas_variables(instancia)["pasillos_min"] == 3
+    # LB = 1, pero la única orden pide 4 unidades del ítem 0 y ningún par de pasillos las tiene
+    instancia = ins.Instancia(1, 2, 4, 1, 10, ins.MatrizCSR.desde_densa([[4, 0]]),
+                              ins.MatrizCSR.desde_densa(pasillos))
+    assert mw.cotas_variables(instancia)["pasillos_min"] == 3
+    assert all(minimo >= 3 for _, minimo in _waves_factibles(instancia))
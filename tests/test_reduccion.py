@@ -0,0 +1,107 @@
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+import instancia as ins
+import reduccion as rd
+from conftest import densas_aleatorias
+
+
+def _instancia(ordenes, pasillos, LB, UB):
+    ordenes, pasillos = np.asarray(ordenes), np.asarray(pasillos)
+    return ins.Instancia(ordenes.shape[0], ordenes.shape[1], pasillos.shape[0], LB, UB,
+                         ins.MatrizCSR.desde_densa(ordenes), ins.MatrizCSR.desde_densa(pasillos))
+
+
+def _con_casos_de_cada_regla(semilla):
+    """Instancia aleatoria a la que se agregan elementos que cada regla debe quitar."""
+    ordenes, pasillos = densas_aleatorias(semilla, O=8, I=7, A=5)
+    ordenes[:, 6] = 0                           # Ítem 6: sin demanda
+    ordenes[0] = 0
+    ordenes[0, 1] = pasillos[:, 1].sum() + 1    # Orden 0: sin stock suficiente del ítem 1
+    ordenes[1] = 0
+    ordenes[1, 2] = 40                          # Orden 1: más unidades que UB
+    pasillos[4] = 0
+    pasillos[4, 6] = 3                          # Pasillo 4: solo tiene un ítem sin demanda
+    return _instancia(ordenes, pasillos, 3, 25)
+
+
+def _optimo(instancia):
+    """Mejor unidades / pasillos por fuerza bruta (solo para instancias diminutas)."""
+    ordenes, pasillos = instancia.ordenes.densa(np.int64), instancia.pasillos.densa(np.int64)
+    coberturas = [(k, pasillos[list(y)].sum(axis=0)) for k in range(1, instancia.A + 1)
+                  for y in combinations(range(instancia.A), k)]
+    mejor = 0.0
+    for k in range(1, instancia.O + 1):
+        for x in combinations(range(instancia.O), k):
+            demanda = ordenes[list(x)].sum(axis=0)
+            unidades = int(demanda.sum())
+            if not instancia.LB <= unidades <= instancia.UB:
+                continue
+            minimo = next((n for n, stock in coberturas if np.all(stock >= demanda)), None)
+            if minimo is not None:
+                mejor = max(mejor, unidades / minimo)
+    return mejor
+
+
+@pytest.mark.parametrize("semilla", range(4))
+def test_reglas_quitan_lo_esperado(semilla):
+    original = _con_casos_de_cada_regla(semilla)
+    reduccion = rd.reducir(original)
+
+    assert 0 not in reduccion.ordenes.tolist()
+    assert 1 not in reduccion.ordenes.tolist()
+    assert 6 not in reduccion.items.tolist()
+    assert 4 not in reduccion.pasillos.tolist()
+    assert [paso["regla"] for paso in reduccion.registro] == list(rd.REGLAS)
+    final = reduccion.registro[-1]
+    assert (final["O"], final["I"], final["A"]) == (reduccion.instancia.O, reduccion.instancia.I, reduccion.instancia.A)
+
+
+@pytest.mark.parametrize("semilla", range(4))
+def test_matrices_reducidas_con_ids_originales(semilla):
+    original = _con_casos_de_cada_regla(semilla)
+    reduccion = rd.reducir(original)
+    ordenes, pasillos = original.ordenes.densa(np.int64), original.pasillos.densa(np.int64)
+
+    assert np.array_equal(reduccion.instancia.ordenes.densa(np.int64),
+                          ordenes[np.ix_(reduccion.ordenes, reduccion.items)])
+    assert np.array_equal(reduccion.instancia.pasillos.densa(np.int64),
+                          pasillos[np.ix_(reduccion.pasillos, reduccion.items)])
+    # Las órdenes conservadas no piden ninguno de los ítems quitados
+    quitados = np.setdiff1d(np.arange(original.I), reduccion.items)
+    assert not ordenes[np.ix_(reduccion.ordenes, quitados)].any()
+
+
+@pytest.mark.parametrize("semilla", range(4))
+def test_traduccion_ida_y_vuelta(semilla):
+    reduccion = rd.reducir(_con_casos_de_cada_regla(semilla))
+    ordenes = list(range(reduccion.instancia.O))
+    pasillos = list(range(reduccion.instancia.A))
+
+    assert reduccion.ordenes_reducidas(reduccion.ordenes_originales(ordenes)) == ordenes
+    assert reduccion.pasillos_reducidos(reduccion.pasillos_originales(pasillos)) == pasillos
+    assert reduccion.ordenes_originales(reduccion.ordenes_reducidas(range(8))) == reduccion.ordenes.tolist()
+    assert reduccion.pasillos_originales(reduccion.pasillos_reducidos(range(5))) == reduccion.pasillos.tolist()
+    assert reduccion.ordenes_reducidas([0, 1]) == []
+    assert reduccion.pasillos_reducidos([4]) == []
+
+
+@pytest.mark.parametrize("semilla", range(6))
+def test_conserva_el_optimo(semilla):
+    original = _con_casos_de_cada_regla(semilla)
+    reduccion = rd.reducir(original)
+
+    assert np.isclose(_optimo(reduccion.instancia), _optimo(original))
+
+
+def test_pasillos_iguales_sin_cubrir_se_conservan():
+    ordenes = [[3, 2], [2, 3]]
+    pasillos = [[2, 2], [2, 2], [5, 5]]
+    reduccion = rd.reducir(_instancia(ordenes, pasillos, 1, 10))
+
+    # El pasillo 2 cubre todo lo que ofrecen 0 y 1; si no existiera, 0 y 1 no se quitarían
+    assert reduccion.pasillos.tolist() == [2]
+    reduccion = rd.reducir(_instancia(ordenes, pasillos[:2], 1, 10))
+    assert reduccion.pasillos.tolist() == [0, 1]
@@ -0,0 +1,68 @@
+import time
+
+import pytest
+
+import funciones_entero as fn
+import instancia as ins
+from conftest import densas_aleatorias
+
+
+def _datos(semilla):
+    ordenes, pasillos = densas_aleatorias(semilla, O=10, I=6, A=8)
+    return ins.MatrizCSR.desde_densa(ordenes).a_diccionarios(), ins.MatrizCSR.desde_densa(pasillos).a_diccionarios()
+
+
+def _cubre(pasillos_list, seleccion, demanda):
+    stock = fn.generar_stock([pasillos_list[j] for j in seleccion])
+    return all(stock.get(item_id, 0) >= cantidad for item_id, cantidad in demanda.items())
+
+
+@pytest.mark.parametrize("semilla", range(5))
+def test_greedy_y_exacto_cubren_la_demanda(semilla):
+    ordenes_list, pasillos_list = _datos(semilla)
+    selector = fn.SelectorPasillos(pasillos_list, 6, modo="exacto")
+    demanda = fn.generar_demanda(ordenes_list, [0, 1])
+    assert _cubre(pasillos_list, range(8), demanda)
+
+    n_greedy, greedy = selector.resolver(demanda, modo="greedy")
+    n_exacto, exacto = selector.resolver(demanda)
+
+    assert n_greedy == len(greedy) and _cubre(pasillos_list, greedy, demanda)
+    assert n_exacto == len(exacto) and _cubre(pasillos_list, exacto, demanda)
+    assert n_exacto <= n_greedy
+
+
+def test_pasado_el_fin_se_usa_la_greedy(monkeypatch):
+    ordenes_list, pasillos_list = _datos(1)
+    selector = fn.SelectorPasillos(pasillos_list, 6, modo="exacto")
+    demanda = fn.generar_demanda(ordenes_list, [2])
+    monkeypatch.setattr(fn, "pasillos", lambda *args: pytest.fail("no debe resolver el modelo exacto"))
+
+    selector.fin = time.time() - 1
+    assert selector.resolver(demanda) == selector.resolver(demanda, modo="greedy")
+
+
+def test_sin_cobertura_exacta_se_usa_la_greedy(monkeypatch):
+    ordenes_list, pasillos_list = _datos(1)
+    selector = fn.SelectorPasillos(pasillos_list, 6, modo="exacto")
+    demanda = fn.generar_demanda(ordenes_list, [2])
+    limites = []
+
+    def sin_solucion(pasillos_list, demanda, num_pasillos, tiempo_limite=None):
+        limites.append(tiempo_limite)
+        return None
+
+    monkeypatch.setattr(fn, "HAY_CPLEX", False)
+    monkeypatch.setattr(fn, "pasillos", sin_solucion)
+    selector.fin = time.time() + 60
+
+    assert selector.resolver(demanda) == selector.resolver(demanda, modo="greedy")
+    assert len(limites) == 1 and 0 < limites[0] <= 60
+
+
+def test_stock_insuficiente():
+    _, pasillos_list = _datos(1)
+    selector = fn.SelectorPasillos(pasillos_list, 6)
+    demanda = {0: sum(p.get(0, 0) for p in pasillos_list) + 1}
+
+    assert selector.resolver(demanda) == (8, [])